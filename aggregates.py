@@ -0,0 +1,365 @@
+"""
+Agregados materializados de los atributos de los informes.
+
+Para cada grupo (jugador, posición) se mantiene el nº de informes y, por
+atributo, la suma, el nº de valores válidos (numéricos y distintos de 0; el 0
+significa "no valorado") y un histograma de las notas 1-5. Se calculan sobre la
+matriz de attributes.AttributeMatrix. Con eso las medias y
+percentiles por grupo salen sin recorrer los informes, y un informe nuevo se
+incorpora en O(atributos). Las sumas (y las medias) usan el valor exacto de
+cada nota; solo el histograma de los percentiles la redondea a 1..SCALE_MAX.
+"""
+import threading
+
+import numpy as np
+import pandas as pd
+
+from attributes import SCALE_MAX, AttributeMatrix
+
+
+def _valid(value):
+    return value is not None and not pd.isna(value)
+
+
+def _hist_bins(notas):
+    """Casilla del histograma de cada nota: redondeada y acotada a 1..SCALE_MAX (0-based)."""
+    return np.clip(np.rint(notas), 1, SCALE_MAX).astype(np.int64) - 1
+
+
+class GroupAggregates:
+    """
+    Agregados por grupo de una lista de atributos. Inmutable: with_record()
+    devuelve una copia actualizada, así los lectores nunca ven un estado a medias.
+    """
+
+    def __init__(self, group_col, attrs, groups=None, count=None, sums=None, nonzero=None,
+                 hist=None, first_cols=(), first=None, first_ids=None):
+        self.group_col = group_col
+        self.attrs = list(attrs)
+        self.groups = list(groups or [])
+        self.index = {g: i for i, g in enumerate(self.groups)}
+        n_groups, n_attrs = len(self.groups), len(self.attrs)
+        self.count = count if count is not None else np.zeros(n_groups, dtype=np.int64)
+        self.sums = sums if sums is not None else np.zeros((n_groups, n_attrs))
+        self.nonzero = nonzero if nonzero is not None else np.zeros((n_groups, n_attrs), dtype=np.int64)
+        # hist[g, a, k]: nº de notas k+1 (redondeadas a 1..SCALE_MAX) del atributo a en el grupo g
+        self.hist = hist if hist is not None else np.zeros((n_groups, n_attrs, SCALE_MAX), dtype=np.int64)
+        # Primer valor no vacío de otras columnas por grupo (p. ej. la posición de un jugador)
+        self.first_cols = list(first_cols)
+        self.first = first if first is not None else {col: {} for col in self.first_cols}
+        # Id del informe que da cada primer valor (None: añadido después de leer la tabla)
+        self.first_ids = first_ids if first_ids is not None else {col: {} for col in self.first_cols}
+        # Matrices de nearest(), se calculan en la primera búsqueda
+        self._similarity = None
+
+    @classmethod
+    def from_df(cls, df, group_col, attrs, first_cols=(), matrix=None):
+        """
+        Construye los agregados de un DataFrame de informes (vectorizado).
+        matrix es la AttributeMatrix de df con los mismos atributos; si no se da se codifica aquí.
+        """
+        if df.empty or group_col not in df.columns:
+            return cls(group_col, attrs, first_cols=first_cols)
+        if matrix is None:
+            matrix = AttributeMatrix.from_df(df, attrs)
+        codes, groups = pd.factorize(df[group_col])
+        keep = codes >= 0
+        codes = codes[keep]
+        n_groups = len(groups)
+
+        # Todas las notas válidas a la vez: (grupo, atributo, nota) por cada celda valorada
+        values = matrix.values[keep]
+        rows, cols = np.nonzero(~np.isnan(values))
+        notas = values[rows, cols].astype(np.float64)
+        cell = codes[rows] * len(attrs) + cols
+        size = n_groups * len(attrs)
+        sums = np.bincount(cell, weights=notas, minlength=size).reshape(n_groups, len(attrs))
+        nonzero = np.bincount(cell, minlength=size).reshape(n_groups, len(attrs)).astype(np.int64)
+        bins = _hist_bins(notas)
+        hist = np.bincount(cell * SCALE_MAX + bins, minlength=size * SCALE_MAX).reshape(
+            n_groups, len(attrs), SCALE_MAX).astype(np.int64)
+        count = np.bincount(codes, minlength=n_groups).astype(np.int64)
+
+        first, first_ids = {}, {}
+        for col in first_cols:
+            first[col], first_ids[col] = {}, {}
+            if col in df.columns:
+                column = df[col][keep]
+                filas = np.flatnonzero(column.notna().to_numpy())
+                # Primera fila con valor de cada grupo
+                _, primeras = np.unique(codes[filas], return_index=True)
+                for r in filas[primeras]:
+                    group = groups[codes[r]]
+                    first[col][group], first_ids[col][group] = column.iloc[r], column.index[r]
+        return cls(group_col, attrs, list(groups), count, sums, nonzero, hist, first_cols, first, first_ids)
+
+    def with_record(self, record):
+        """Copia de los agregados con un informe más."""
+        return self.with_changes(inserted=[record])
+
+    def with_changes(self, deleted=None, inserted=(), updated=None):
+        """
+        Copia de los agregados tras borrar los informes deleted ({id: informe}),
+        añadir al final los inserted y modificar en su sitio los updated
+        ({id: (anterior, nuevo)}): cada informe se resta o se suma de los
+        contadores, sumas e histogramas en O(atributos). Los grupos que se quedan
+        sin informes desaparecen.
+
+        El primer valor de first_cols se sigue por el id del informe que lo da
+        (las tablas se leen en orden de id). Devuelve None si no se puede saber
+        el nuevo (se borra o cambia ese informe, o un informe añadido de esta
+        misma caché): entonces hay que reconstruir.
+        """
+        deleted, updated = deleted or {}, updated or {}
+        removed = list(deleted.values()) + [old for old, _ in updated.values()]
+        added = list(inserted) + [new for _, new in updated.values()]
+        groups, index = list(self.groups), dict(self.index)
+        for record in added:
+            group = record.get(self.group_col)
+            if _valid(group) and group not in index:
+                index[group] = len(groups)
+                groups.append(group)
+        n_new, n_attrs = len(groups) - len(self.groups), len(self.attrs)
+        count = np.append(self.count, np.zeros(n_new, dtype=np.int64))
+        sums = np.vstack([self.sums, np.zeros((n_new, n_attrs))])
+        nonzero = np.vstack([self.nonzero, np.zeros((n_new, n_attrs), dtype=np.int64)])
+        hist = np.concatenate([self.hist, np.zeros((n_new, n_attrs, SCALE_MAX), dtype=np.int64)])
+
+        for records, sign in ((removed, -1), (added, 1)):
+            for record in records:
+                i = index.get(record.get(self.group_col))
+                if i is None:
+                    continue
+                notas = AttributeMatrix.from_record(record, self.attrs).values[0].astype(np.float64)
+                valid = ~np.isnan(notas)
+                count[i] += sign
+                sums[i, valid] += sign * notas[valid]
+                nonzero[i, valid] += sign
+                hist[i, np.flatnonzero(valid), _hist_bins(notas[valid])] += sign
+
+        empty = {g for g, i in index.items() if count[i] <= 0}
+        first = {col: dict(values) for col, values in self.first.items()}
+        first_ids = {col: dict(ids) for col, ids in self.first_ids.items()}
+        for col in self.first_cols:
+            values, ids = first[col], first_ids.setdefault(col, {})
+            changes = [(pk, old, None) for pk, old in deleted.items()]
+            changes += [(pk, old, new) for pk, (old, new) in updated.items()]
+            for pk, old, new in changes:
+                group = old.get(self.group_col)
+                provider = ids.get(group)
+                if group in values and group not in empty and (
+                        provider == pk or (provider is None and old.get(col) == values[group])):
+                    # Era (o puede ser) el informe que daba el valor
+                    if new is None or new.get(self.group_col) != group or new.get(col) != values[group]:
+                        return None
+            for pk, (_, new) in updated.items():
+                group, value = new.get(self.group_col), new.get(col)
+                if _valid(group) and _valid(value) and (
+                        group not in values or ids.get(group) is None or pk < ids[group]):
+                    values[group], ids[group] = value, pk
+            for record in inserted:
+                group, value = record.get(self.group_col), record.get(col)
+                if _valid(group) and group not in values and _valid(value):
+                    # Sin id conocido: va detrás de todos los informes leídos
+                    values[group], ids[group] = value, None
+            for group in empty:
+                values.pop(group, None)
+                ids.pop(group, None)
+
+        if empty:
+            keep = count > 0
+            groups = [g for g in groups if g not in empty]
+            count, sums, nonzero, hist = count[keep], sums[keep], nonzero[keep], hist[keep]
+        return GroupAggregates(self.group_col, self.attrs, groups, count, sums, nonzero,
+                               hist, self.first_cols, first, first_ids)
+
+    def __contains__(self, group):
+        return group in self.index
+
+    def mean_matrix(self):
+        """Matriz grupos x atributos con las medias (NaN donde no hay valores)."""
+        out = np.full(self.sums.shape, np.nan)
+        np.divide(self.sums, self.nonzero, out=out, where=self.nonzero > 0)
+        return out
+
+    def means(self, groups=None):
+        """DataFrame de medias por atributo indexado por grupo (todos o los indicados)."""
+        df = pd.DataFrame(self.mean_matrix(), index=self.groups, columns=self.attrs)
+        if groups is not None:
+            df = df.loc[[g for g in groups if g in self.index]]
+        return df
+
+    def mean_of(self, group):
+        """{atributo: media} de un grupo, solo con los atributos valorados (> 0)."""
+        i = self.index.get(group)
+        if i is None:
+            return {}
+        row = self.nonzero[i]
+        return {a: float(self.sums[i, j] / row[j]) for j, a in enumerate(self.attrs) if row[j] > 0}
+
+    def first_value(self, group, col):
+        """Primer valor registrado de otra columna para el grupo (None si no hay)."""
+        return self.first.get(col, {}).get(group)
+
+    def percentiles(self, group, qs=(0.25, 0.5, 0.75)):
+        """
+        Percentiles de cada atributo en el grupo, a partir del histograma de notas.
+        DataFrame atributos x percentiles (NaN si el atributo no tiene notas).
+        """
+        i = self.index.get(group)
+        out = np.full((len(self.attrs), len(qs)), np.nan)
+        if i is not None:
+            cum = np.cumsum(self.hist[i], axis=1)  # atributos x notas
+            total = cum[:, -1]
+            for k, q in enumerate(qs):
+                # Primera nota cuya frecuencia acumulada alcanza q
+                reached = cum >= np.maximum(q * total, 1)[:, None]
+                out[:, k] = np.where(total > 0, reached.argmax(axis=1) + 1, np.nan)
+        return pd.DataFrame(out, index=self.attrs, columns=[f"P{int(q * 100)}" for q in qs])
+
+    def global_means(self):
+        """Media de cada atributo sobre todos los informes (NaN si nadie lo valoró)."""
+        total = self.nonzero.sum(axis=0)
+        out = np.full(len(self.attrs), np.nan)
+        np.divide(self.sums.sum(axis=0), total, out=out, where=total > 0)
+        return pd.Series(out, index=self.attrs)
+
+    def _similarity_arrays(self):
+        """
+        Matrices de la búsqueda de similares, calculadas una vez por instancia
+        (los agregados son inmutables): medias con 0 donde no hay nota, sus
+        cuadrados, la máscara de atributos valorados y las medias centradas en
+        la media global de cada atributo (y sus cuadrados).
+        """
+        if self._similarity is None:
+            means = self.mean_matrix()
+            rated = ~np.isnan(means)
+            filled = np.where(rated, means, 0.0)
+            centered = np.where(rated, means - np.nan_to_num(self.global_means().to_numpy()), 0.0)
+            self._similarity = (filled, filled ** 2, rated.astype(float), centered, centered ** 2)
+        return self._similarity
+
+    def first_values(self, col):
+        """Array con el primer valor de otra columna para cada grupo, en el orden de groups."""
+        values = self.first.get(col, {})
+        return np.array([values.get(g) for g in self.groups], dtype=object)
+
+    def nearest(self, target, k=10, metric="cosine", weights=None, candidates=None, exclude=None,
+                min_shared=3):
+        """
+        Los k grupos más parecidos a un perfil objetivo (array de medias por
+        atributo, NaN donde no cuenta), en una sola operación vectorizada.
+
+        metric "cosine" compara los perfiles centrados en la media global de cada
+        atributo (si no, todas las notas positivas se parecen); "euclidean" usa la
+        distancia euclídea ponderada por weights (1 por atributo si no se da)
+        normalizada por los atributos en común. Solo se comparan los atributos
+        valorados en ambos perfiles, y hace falta tener min_shared en común (o
+        todos los del objetivo si tiene menos). candidates es una máscara booleana
+        sobre groups y exclude un grupo a descartar (p. ej. el propio jugador).
+
+        DataFrame indexado por grupo con "Similitud" (mayor es más parecido;
+        coseno en -1..1 o 1 / (1 + distancia)), "Atributos en común" e "Informes".
+        """
+        filled, squared, rated, centered, centered_sq = self._similarity_arrays()
+        target = np.asarray(target, dtype=float)
+        w = np.ones(len(self.attrs)) if weights is None else np.asarray(weights, dtype=float)
+        target_rated = ~np.isnan(target) & (w > 0)
+        w = np.where(target_rated, w, 0.0)
+        t = np.where(target_rated, target, 0.0)
+
+        shared = (rated > 0) @ target_rated.astype(float)
+        shared_weight = rated @ w
+        if metric == "cosine":
+            t_c = np.where(target_rated, t - np.nan_to_num(self.global_means().to_numpy()), 0.0)
+            dot = centered @ (w * t_c)
+            norms = np.sqrt(centered_sq @ w) * np.sqrt(rated @ (w * t_c ** 2))
+            score = np.divide(dot, norms, out=np.zeros(len(self.groups)), where=norms > 0)
+        elif metric == "euclidean":
+            # sum(w·(x - t)²) sobre los atributos en común, desarrollado en productos matriz-vector
+            sq = squared @ w - 2 * (filled @ (w * t)) + rated @ (w * t ** 2)
+            mean_sq = np.divide(np.maximum(sq, 0), shared_weight, out=np.full(len(self.groups), np.inf),
+                                where=shared_weight > 0)
+            score = 1 / (1 + np.sqrt(mean_sq))
+        else:
+            raise ValueError(f"Métrica desconocida: {metric}")
+
+        valid = (shared >= min(min_shared, int(target_rated.sum()))) & (shared > 0)
+        if candidates is not None:
+            valid &= np.asarray(candidates, dtype=bool)
+        if exclude is not None and exclude in self.index:
+            valid[self.index[exclude]] = False
+        found = np.flatnonzero(valid)
+        if len(found) > k:
+            found = found[np.argpartition(-score[found], k - 1)[:k]]
+        found = found[np.argsort(-score[found], kind="stable")]
+        return pd.DataFrame(
+            {"Similitud": score[found], "Atributos en común": shared[found].astype(int),
+             "Informes": self.count[found]},
+            index=pd.Index([self.groups[i] for i in found], name=self.group_col),
+        )
+
+
+class AggregateCache:
+    """
+    Agregados compartidos por todo el proceso, ligados a una versión de la tabla
+    de informes. Las escrituras propias los actualizan de forma incremental; si la
+    versión no cuadra (escritura de otro proceso) se reconstruyen en la siguiente
+    lectura.
+    """
+
+    def __init__(self, attrs, group_cols=("Jugador",), first_cols=()):
+        self.attrs = list(attrs)
+        self.group_cols = list(group_cols)
+        self.first_cols = list(first_cols)
+        self._lock = threading.Lock()
+        self._version = None
+        self._aggs = {}
+
+    def _build(self, df, matrix=None):
+        # Las notas se codifican una vez (o vienen ya del cargador) y se comparten entre las agrupaciones
+        if matrix is None or matrix.attrs != self.attrs or len(matrix) != len(df):
+            matrix = AttributeMatrix.from_df(df, self.attrs)
+        return {
+            col: GroupAggregates.from_df(df, col, self.attrs, [c for c in self.first_cols if c != col], matrix)
+            for col in self.group_cols
+        }
+
+    def get(self, version, load, group_col="Jugador"):
+        """
+        Agregados de la versión indicada; load() da (tabla, AttributeMatrix de
+        sus notas o None) si hay que reconstruir.
+        """
+        with self._lock:
+            if self._version != version or not self._aggs:
+                self._aggs = self._build(*load())
+                self._version = version
+            return self._aggs[group_col]
+
+    def record_added(self, prev_version, new_version, record):
+        """Incorpora un informe recién añadido si los agregados estaban al día."""
+        with self._lock:
+            if self._aggs and self._version == prev_version:
+                self._aggs = {col: agg.with_record(record) for col, agg in self._aggs.items()}
+                self._version = new_version
+
+    def records_changed(self, prev_version, new_version, deleted=None, inserted=(), updated=None):
+        """
+        Aplica cambios puntuales recién guardados (ver GroupAggregates.with_changes)
+        si los agregados estaban al día; si no se pueden aplicar, se descartan y
+        se reconstruyen en la siguiente lectura.
+        """
+        with self._lock:
+            if not self._aggs or self._version != prev_version:
+                return
+            aggs = {col: agg.with_changes(deleted, inserted, updated) for col, agg in self._aggs.items()}
+            if any(agg is None for agg in aggs.values()):
+                self._aggs, self._version = {}, None
+            else:
+                self._aggs, self._version = aggs, new_version
+
+    def rebuild(self, version, df):
+        """Recalcula los agregados a partir de la tabla completa ya guardada."""
+        with self._lock:
+            self._aggs = self._build(df)
+            self._version = version
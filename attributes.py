@@ -0,0 +1,83 @@
+"""
+Representación compacta de las notas de los informes.
+
+Las columnas de atributos llegan de JSON/SQLite como objetos (int, str, None...).
+AttributeMatrix las convierte una sola vez en una matriz float32 contigua
+(informes x atributos) con NaN donde no hay nota, más el índice de cada fila en
+la tabla de informes. Las agregaciones trabajan sobre esa matriz sin volver a
+coercionar columnas. La codifica el cargador de tablas (core._read_table) una
+vez por versión, junto con el DataFrame.
+
+Los valores no se redondean ni se acotan a la escala: una nota fraccionaria o
+fuera de 1..SCALE_MAX se guarda tal cual (con la precisión de float32, exacta
+para las notas enteras y las medias notas), así que las medias coinciden con
+las de pd.to_numeric sobre las columnas ignorando los 0.
+"""
+import numpy as np
+import pandas as pd
+
+
+# Escala de los atributos valorables (0 = no valorado)
+SCALE_MAX = 5
+
+
+def encode_values(values, zero_is_missing=True):
+    """
+    Convierte una secuencia de valores a float32 como pd.to_numeric(errors="coerce"):
+    los no numéricos y (si zero_is_missing) los 0 pasan a NaN; el resto se conserva.
+    """
+    series = pd.Series(values)
+    if not pd.api.types.is_numeric_dtype(series) or pd.api.types.is_bool_dtype(series):
+        series = pd.to_numeric(series.astype(object), errors="coerce")
+    vals = series.to_numpy(dtype=np.float32, na_value=np.nan)
+    if zero_is_missing:
+        vals[vals == 0] = np.nan
+    return vals
+
+
+class AttributeMatrix:
+    """
+    Notas de una lista de atributos para un conjunto de informes.
+    values[i, j] es la nota del atributo j en el informe de la fila index[i]
+    (NaN si no está valorado).
+    """
+
+    def __init__(self, attrs, values, index=None):
+        self.attrs = list(attrs)
+        self.values = np.ascontiguousarray(values, dtype=np.float32)
+        self.index = np.arange(len(self.values)) if index is None else np.asarray(index)
+
+    @classmethod
+    def from_df(cls, df, attrs, zero_is_missing=True):
+        """Codifica las columnas de atributos de un DataFrame (las que falten quedan sin valor)."""
+        values = np.full((len(df), len(attrs)), np.nan, dtype=np.float32)
+        for j, attr in enumerate(attrs):
+            if attr in df.columns:
+                values[:, j] = encode_values(df[attr].to_numpy(), zero_is_missing)
+        return cls(attrs, values, df.index.to_numpy())
+
+    @classmethod
+    def from_record(cls, record, attrs, zero_is_missing=True):
+        """Matriz de una fila con las notas de un informe (dict)."""
+        values = encode_values([record.get(a) for a in attrs], zero_is_missing)
+        return cls(attrs, values[None, :])
+
+    def __len__(self):
+        return len(self.values)
+
+    @property
+    def nbytes(self):
+        return self.values.nbytes
+
+    def rated(self):
+        """Máscara booleana de las notas válidas."""
+        return ~np.isnan(self.values)
+
+    def as_float(self):
+        """Matriz float64 con NaN donde no hay nota."""
+        return self.values.astype(float)
+
+    def row_values(self, i):
+        """{atributo: nota} de la fila i, solo con los atributos valorados."""
+        row = self.values[i]
+        return {a: float(row[j]) for j, a in enumerate(self.attrs) if not np.isnan(row[j])}
@@ -0,0 +1,455 @@
+"""
+Banco de pruebas de rendimiento de Scouting UD Lanzarote con datos sintéticos.
+
+Genera tablas Posiciones, Scouts, Jugadores e Informes realistas del tamaño
+pedido (varios informes por jugador con notas coherentes, fechas, temporadas,
+observaciones...) y las guarda con el backend elegido, en el mismo formato que
+data/ ({"pk": id, "fields": {...}}, o SQLite). Sobre ellas mide sin navegador
+load_table, save_table, add_new_record, generar_pdf, los agregados y la página
+del Dashboard y los filtros y la página de Informes, y escribe un JSON con los
+percentiles de latencia y la memoria de pico de cada caso para comparar
+ejecuciones:
+
+    python benchmark.py --sizes 1000 50000 500000 --output bench_results.json
+    python benchmark.py --sizes 1000 --backend sqlite --compare bench_results.json
+"""
+import argparse
+import json
+import os
+import platform
+import random
+import resource
+import shutil
+import subprocess
+import sys
+import tempfile
+import time
+import tracemalloc
+from datetime import datetime
+
+import numpy as np
+import pandas as pd
+
+from config import ATRIBUTOS_PORCENTAJE, ATRIBUTOS_VALORABLES, COLUMNAS_INFORME
+
+BASE_DIR = os.path.dirname(os.path.abspath(__file__))
+
+# === DATOS SINTÉTICOS ===
+NOMBRES = [
+    "Alejandro", "Adrián", "Álvaro", "Daniel", "David", "Diego", "Hugo", "Iván", "Javier", "Jesús",
+    "Jonathan", "Jorge", "José", "Juan", "Kevin", "Marcos", "Mario", "Miguel", "Nicolás", "Óscar",
+    "Pablo", "Raúl", "Rubén", "Samuel", "Sergio", "Víctor", "Yeray", "Aitor", "Borja", "Carlos",
+    "Cristian", "Eduardo", "Gonzalo", "Héctor", "Ismael", "Joel", "Lucas", "Manuel", "Néstor", "Unai",
+]
+APELLIDOS = [
+    "García", "Rodríguez", "González", "Fernández", "López", "Martínez", "Sánchez", "Pérez", "Gómez",
+    "Martín", "Jiménez", "Ruiz", "Hernández", "Díaz", "Moreno", "Muñoz", "Álvarez", "Romero", "Alonso",
+    "Gutiérrez", "Navarro", "Torres", "Domínguez", "Vázquez", "Ramos", "Gil", "Ramírez", "Serrano",
+    "Blanco", "Suárez", "Molina", "Morales", "Ortega", "Delgado", "Castro", "Ortiz", "Rubio", "Marín",
+    "Sanz", "Núñez", "Iglesias", "Medina", "Garrido", "Cortés", "Castillo", "Santos", "Lozano", "Guerra",
+    "Cano", "Prieto", "Méndez", "Cruz", "Calvo", "Gallego", "Vidal", "León", "Márquez", "Herrera",
+    "Peña", "Betancor", "Perdomo", "Cabrera", "Umpiérrez", "Viñoly", "Manrique", "Rivero",
+]
+LOCALIDADES = [
+    "Lanzarote", "Tenerife", "Las Palmas", "Arucas", "Telde", "Gáldar", "Mensajero", "Tamaraceite",
+    "San Fernando", "Ibarra", "Marino", "Villa de Santa Brígida", "Teguise", "Tías", "Yaiza", "Haría",
+    "Tenisca", "Atlético Paso", "Panadería Pulido", "Unión Puerto", "Estrella", "Las Zocas", "Orotava",
+    "Lagunera", "Buzanada", "Vera", "Firgas", "Agaete", "Guía", "Moya", "Ingenio", "Vecindario",
+    "Villarrobledo", "Alcorcón", "Rayo Majadahonda", "Ceuta", "Melilla", "Mérida", "Córdoba B", "Cádiz B",
+]
+PREFIJOS_CLUB = ["UD", "CD", "CF", "SD", "AD", "Real", "Atlético"]
+COMPETICIONES = [
+    "Primera División", "Segunda División", "1ªRFEF", "2ªRFEF", "3ªRFEF",
+    "Regional Preferente", "División de Honor Juvenil", "Liga Nacional Juvenil",
+]
+POSICIONES = [
+    "Central", "Central derecho", "Central izquierdo", "Lateral", "Lateral derecho", "Lateral izquierdo",
+    "Mediocentro", "Interior", "Mediapunta", "Extremo", "Extremo derecho", "Extremo izquierdo",
+    "Delantero", "Portero",
+]
+# Frecuencia de cada posición entre los jugadores (más centrales y mediocentros que porteros)
+PESOS_POSICION = [10, 6, 6, 4, 7, 7, 11, 7, 6, 5, 7, 7, 10, 7]
+# Atributos propios de porteros: el resto de posiciones casi nunca los valora
+ATRIBUTOS_PORTERO = ATRIBUTOS_VALORABLES[:6]
+LATERALIDADES = (["Diestro", "Zurdo", "Ambidiestro"], [0.7, 0.25, 0.05])
+ACCIONES = (["Seguir ojeando", "Descartar", "Fichar"], [0.6, 0.28, 0.12])
+FRASES = [
+    "Buen golpeo con ambas piernas.", "Rápido en el primer paso y en la conducción.",
+    "Le cuesta la presión tras pérdida.", "Domina el juego aéreo en las dos áreas.",
+    "Lee bien las segundas jugadas.", "Zurdo con desborde por fuera.", "Poca participación en la salida de balón.",
+    "Lento en las transiciones defensivas.", "Muy intenso en los duelos.", "Buen perfil para la categoría.",
+    "Tiene gol, ataca bien el primer palo.", "Pierde la posición en los centros laterales.",
+    "Carácter y liderazgo en el vestuario.", "Necesita mejorar la toma de decisiones.",
+    "Partido irregular, volver a verlo en casa.", "Buenas salidas por alto, blocaje seguro.",
+    "Juega de cara y descarga con criterio.", "Acusa el cansancio en la segunda parte.",
+]
+FECHA_INFORME = ("2022-08-01", "2026-06-30")
+FECHA_NACIMIENTO = ("1990-01-01", "2009-12-31")
+FECHA_SUB23 = pd.Timestamp("2003-01-01")  # nacidos desde esta fecha cuentan como sub 23
+
+
+def _fechas(rng, desde, hasta, n):
+    """n fechas al azar entre desde y hasta (incluidas), como Timestamps."""
+    inicio, fin = pd.Timestamp(desde), pd.Timestamp(hasta)
+    dias = rng.integers(0, (fin - inicio).days + 1, n)
+    return inicio + pd.to_timedelta(dias, unit="D")
+
+
+def _clubes(rng, n):
+    """n nombres de club distintos (o casi) combinando prefijos y localidades."""
+    nombres = [f"{p} {l}" for p in PREFIJOS_CLUB for l in LOCALIDADES]
+    return list(rng.choice(nombres, size=min(n, len(nombres)), replace=False))
+
+
+def generar_jugadores(rng, n_jugadores, clubes):
+    """Tabla Jugadores y los rasgos de cada uno (posición, lateralidad, nivel por atributo)."""
+    nombres = pd.Series(
+        rng.choice(NOMBRES, n_jugadores).astype(object) + " "
+        + rng.choice(APELLIDOS, n_jugadores).astype(object) + " "
+        + rng.choice(APELLIDOS, n_jugadores).astype(object)
+    )
+    # Nombres repetidos: se distinguen como en la realidad, con un segundo nombre
+    repetidos = nombres.duplicated()
+    while repetidos.any():
+        extra = rng.choice(NOMBRES, int(repetidos.sum())).astype(object)
+        partes = nombres[repetidos].str.split(" ", n=1)
+        nombres[repetidos] = partes.str[0] + " " + extra + " " + partes.str[1]
+        repetidos = nombres.duplicated()
+    nacimiento = _fechas(rng, *FECHA_NACIMIENTO, n_jugadores)
+    jugadores = pd.DataFrame({
+        "Nombre jugador": nombres.to_numpy(),
+        "Fecha de nacimiento": nacimiento.strftime("%d-%m-%Y"),
+        "Club": rng.choice(clubes, n_jugadores),
+        "Sub 23": np.where(nacimiento >= FECHA_SUB23, "Sí", "No"),
+    })
+    pesos = np.asarray(PESOS_POSICION, dtype=float)
+    rasgos = {
+        "posicion": rng.choice(POSICIONES, n_jugadores, p=pesos / pesos.sum()),
+        "lateralidad": rng.choice(LATERALIDADES[0], n_jugadores, p=LATERALIDADES[1]),
+        "nivel": rng.normal(3.0, 0.55, (n_jugadores, len(ATRIBUTOS_VALORABLES))),
+        # Unos pocos jugadores acumulan muchos informes (seguimientos)
+        "interes": 1.0 / np.arange(1, n_jugadores + 1) ** 0.6,
+    }
+    rasgos["interes"] = rng.permutation(rasgos["interes"] / rasgos["interes"].sum())
+    return jugadores, rasgos
+
+
+def generar_informes(rng, n, jugadores, rasgos, scouts, clubes):
+    """n informes de los jugadores dados, con los campos del formulario."""
+    quien = rng.choice(len(jugadores), n, p=rasgos["interes"])
+    jugador = jugadores.iloc[quien]
+    fecha = _fechas(rng, *FECHA_INFORME, n)
+    inicio = np.where(fecha.month >= 7, fecha.year, fecha.year - 1)
+    # Casi siempre en su posición habitual; a veces en otra
+    posicion = np.where(rng.random(n) < 0.9, rasgos["posicion"][quien], rng.choice(POSICIONES, n))
+    portero = posicion == "Portero"
+    local = rng.choice(clubes, n)
+    visitante = np.where(rng.random(n) < 0.5, jugador["Club"].to_numpy(), rng.choice(clubes, n))
+    local = np.where(visitante == jugador["Club"].to_numpy(), local, jugador["Club"].to_numpy())
+    frases = rng.choice(FRASES, (n, 2)).astype(object)
+    informes = pd.DataFrame({
+        "Fecha informe": fecha.strftime("%d-%m-%Y"),
+        "Scout": rng.choice(scouts, n),
+        "Temporada": [f"{y}-{y + 1}" for y in inicio],
+        "Competición": rng.choice(COMPETICIONES, n),
+        "Equipo local": local,
+        "Equipo visitante": visitante,
+        "Jugador": jugador["Nombre jugador"].to_numpy(),
+        "Posición": posicion,
+        "Lateralidad": rasgos["lateralidad"][quien],
+        "Acción": rng.choice(ACCIONES[0], n, p=ACCIONES[1]),
+        "Observaciones": np.where(rng.random(n) < 0.15, "", frases[:, 0] + " " + frases[:, 1]),
+    })
+    # Notas 1-5 alrededor del nivel del jugador; 0 = no valorado en ese partido
+    notas = np.clip(np.rint(rasgos["nivel"][quien] + rng.normal(0, 0.6, rasgos["nivel"][quien].shape)), 1, 5)
+    de_portero = np.isin(ATRIBUTOS_VALORABLES, ATRIBUTOS_PORTERO)
+    valorado = np.where(portero[:, None] == de_portero[None, :], 0.8, 0.05)
+    notas[rng.random(notas.shape) >= valorado] = 0
+    for i, atributo in enumerate(ATRIBUTOS_VALORABLES):
+        informes[atributo] = notas[:, i].astype(np.int64)
+    for atributo in ATRIBUTOS_PORCENTAJE:
+        informes[atributo] = np.clip(rng.normal(62, 15, n), 0, 100).round().astype(np.int64)
+    informes = informes[COLUMNAS_INFORME]
+    for columna in ["Sub 23", "Fecha de nacimiento", "Club"]:
+        informes[columna] = jugador[columna].to_numpy()
+    return informes
+
+
+def generar_datos(store, n_informes, seed):
+    """
+    Escribe en store las cuatro tablas para n_informes (un jugador por cada 8
+    informes de media). Devuelve ({tabla: nº de registros}, informes extra de
+    los mismos jugadores para las altas del banco de pruebas).
+    """
+    rng = np.random.default_rng(seed)
+    clubes = _clubes(rng, 160)
+    scouts = pd.DataFrame({
+        "Nombre scout": [f"{n} {a1} {a2}" for n, a1, a2 in zip(
+            rng.choice(NOMBRES, 12), rng.choice(APELLIDOS, 12), rng.choice(APELLIDOS, 12))],
+        "Contraseña": [f"scout{i}" for i in range(12)],
+        "Correo electrónico": "",
+        "Teléfono": "",
+        "Procedencia": rng.choice(["Club", "Externo"], 12, p=[0.7, 0.3]),
+    })
+    jugadores, rasgos = generar_jugadores(rng, max(50, n_informes // 8), clubes)
+    informes = generar_informes(rng, n_informes + 200, jugadores, rasgos, scouts["Nombre scout"].to_numpy(), clubes)
+    tablas = {
+        "Posiciones": pd.DataFrame({"Posición": POSICIONES}),
+        "Scouts": scouts,
+        "Jugadores": jugadores,
+        "Informes": informes.iloc[:n_informes].reset_index(drop=True),
+    }
+    for table_name, df in tablas.items():
+        # Sin índice "id": save numera los registros 1..n, como los de la app
+        store.save(table_name, df)
+    extra = informes.iloc[n_informes:].to_dict("records")
+    return {table_name: len(df) for table_name, df in tablas.items()}, extra
+
+
+# === MEDICIÓN ===
+def _percentiles(tiempos):
+    ms = np.asarray(tiempos) * 1000
+    return {
+        "n": len(ms),
+        "p50_ms": float(np.percentile(ms, 50)),
+        "p90_ms": float(np.percentile(ms, 90)),
+        "p99_ms": float(np.percentile(ms, 99)),
+        "mean_ms": float(ms.mean()),
+        "min_ms": float(ms.min()),
+        "max_ms": float(ms.max()),
+    }
+
+
+def medir(fn, repeat, setup=None):
+    """
+    Ejecuta fn repeat veces (con setup antes de cada una, fuera del tiempo) y
+    una más con tracemalloc para la memoria de pico de Python/numpy, que se
+    mide aparte porque tracemalloc ralentiza la ejecución. Sin setup (casos en
+    caliente) se hace antes una ejecución sin medir.
+    """
+    if setup is None:
+        fn()
+    tiempos = []
+    for _ in range(repeat):
+        if setup:
+            setup()
+        t0 = time.perf_counter()
+        fn()
+        tiempos.append(time.perf_counter() - t0)
+    if setup:
+        setup()
+    tracemalloc.start()
+    try:
+        fn()
+        pico = tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+    return {**_percentiles(tiempos), "peak_mb": pico / 2**20}
+
+
+def _rss_max_mb():
+    """Máximo de memoria residente del proceso hasta ahora (en Linux ru_maxrss va en KiB; en macOS, en bytes)."""
+    rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return rss / 2**20 if sys.platform == "darwin" else rss / 2**10
+
+
+def casos(core, extra, repeat, repeat_heavy, seed):
+    """Casos a medir como (nombre, repeticiones, fn, setup)."""
+    import pdf_report
+    from streamlit.testing.v1 import AppTest
+
+    rnd = random.Random(seed)
+    altas = iter(extra * (1 + (repeat + 2) // max(1, len(extra))))  # + la ejecución previa y la de memoria
+    informes, _ = core.load_table("Informes")
+    filas = informes.sample(min(len(informes), 50), random_state=seed)
+    muestras = [{k: v for k, v in fila.items() if pd.notna(v)} for _, fila in filas.iterrows()]
+    filtros_informes = ["Scout", "Jugador", "Sub 23", "Posición", "Acción"]
+    fechas_informes = ["Fecha informe", "Fecha de nacimiento"]
+
+    def cargar_frio():
+        core._read_table.clear()
+
+    def releer(columnas=None):
+        # Lo que se construye por versión parte de un DataFrame recién leído, como tras una escritura
+        def setup():
+            core._read_table.clear()
+            core._table_index.clear()
+            core.load_table("Informes", columnas)
+        return setup
+
+    def agregados_dashboard():
+        core.get_aggregates.clear()
+        agregados = core.player_aggregates()
+        core.position_aggregates()
+        medias = agregados.means().mean(axis=1)
+        medias[medias > agregados.global_means().mean()].sort_values(ascending=False).head(5)
+
+    def filtro_informes():
+        df, indice = core.load_indexed_table("Informes", filtros_informes, fechas_informes)
+        fila = df.iloc[rnd.randrange(len(df))]
+        desde, hasta = indice.ranges["Fecha informe"].bounds()
+        mitad = rnd.randint(desde, hasta)
+        nacido = rnd.randint(*indice.ranges["Fecha de nacimiento"].bounds())
+        combinaciones = [
+            ({"Scout": [fila["Scout"]]}, {}),
+            ({"Jugador": [fila["Jugador"]]}, {}),
+            ({"Posición": [fila["Posición"]], "Sub 23": ["Sí"]}, {}),
+            ({"Acción": ["Fichar"]}, {"Fecha informe": (mitad, min(hasta, mitad + 90))}),
+            ({"Posición": [fila["Posición"]], "Acción": ["Seguir ojeando", "Fichar"]},
+             {"Fecha de nacimiento": (nacido, None)}),
+        ]
+        valores, rangos = rnd.choice(combinaciones)
+        seleccion = indice.lookup(valores, rangos)
+        return df if seleccion is None else df.iloc[seleccion]
+
+    def pagina(script):
+        def run():
+            at = AppTest.from_file(os.path.join(BASE_DIR, "paginas", script), default_timeout=600)
+            at.run()
+            if at.exception:
+                raise RuntimeError(f"{script}: {at.exception[0].message}")
+        return run
+
+    def pdf():
+        informe = rnd.choice(muestras)
+        pdf_report.generar_pdf(informe, **core.pdf_context(informe))
+
+    def guardar():
+        core.save_table(core.load_table("Informes")[0].copy(), "Informes")
+
+    lista = [
+        ("load_table", repeat_heavy, lambda: core.load_table("Informes"), cargar_frio),
+        ("load_table_columns", repeat, lambda: core.load_table("Informes", core.COLUMNAS_AGREGADOS), cargar_frio),
+        ("load_table_warm", repeat, lambda: core.load_table("Informes"), None),
+        ("dashboard_aggregates", repeat, agregados_dashboard, releer(core.COLUMNAS_AGREGADOS)),
+        ("dashboard_page_cold", repeat_heavy, pagina("dashboard.py"), lambda: core.st.cache_resource.clear()),
+        ("dashboard_page", repeat, pagina("dashboard.py"), None),
+        ("informes_index", repeat_heavy, lambda: core.load_indexed_table("Informes", filtros_informes, fechas_informes),
+         releer()),
+        ("informes_filter", repeat, filtro_informes, None),
+        ("informes_page", repeat, pagina("informes.py"), None),
+        ("generar_pdf", repeat, pdf, None),
+        ("add_new_record", repeat, lambda: core.add_new_record("Informes", next(altas)), None),
+        ("save_table", repeat_heavy, guardar, lambda: core.load_table("Informes")),
+    ]
+    if not os.path.exists(pdf_report.TTF_PATH):
+        # Sin la fuente tampoco la app puede generar PDFs
+        print(f"  generar_pdf omitido: falta {pdf_report.TTF_PATH}")
+        lista = [c for c in lista if c[0] != "generar_pdf"]
+    return lista
+
+
+def _git_commit():
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"], cwd=BASE_DIR, capture_output=True, text=True, check=True
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def _versiones():
+    import pyarrow
+    import streamlit
+    return {
+        "python": platform.python_version(), "numpy": np.__version__, "pandas": pd.__version__,
+        "pyarrow": pyarrow.__version__, "streamlit": streamlit.__version__,
+    }
+
+
+def comparar(anterior, actual):
+    """Tabla de p50 y p99 de los casos comunes a dos resultados (ratio > 1: más lento ahora)."""
+    previos = {(r["size"], r["case"]): r for r in anterior["results"]}
+    print(f"\nComparación con {anterior['meta'].get('commit')} ({anterior['meta'].get('date')}):")
+    print(f"{'tamaño':>9}  {'caso':<22}{'p50 antes':>11}{'p50 ahora':>11}{'ratio':>8}{'p99 ratio':>11}")
+    for r in actual["results"]:
+        p = previos.get((r["size"], r["case"]))
+        if p is None:
+            continue
+        ratio = r["p50_ms"] / p["p50_ms"] if p["p50_ms"] else float("nan")
+        ratio99 = r["p99_ms"] / p["p99_ms"] if p["p99_ms"] else float("nan")
+        print(f"{r['size']:>9}  {r['case']:<22}{p['p50_ms']:>11.2f}{r['p50_ms']:>11.2f}{ratio:>8.2f}{ratio99:>11.2f}")
+
+
+def main(args):
+    # Siempre en una subcarpeta nueva (dentro de --data-dir si se indica): cada
+    # tamaño vacía la carpeta y no debe tocar datos que no haya generado el banco
+    if args.data_dir:
+        os.makedirs(args.data_dir, exist_ok=True)
+    data_dir = tempfile.mkdtemp(prefix="scouting_bench_", dir=args.data_dir)
+    # core copia la carpeta y el backend de config al importarse: se fijan antes
+    import config
+    config.DATA_DIR, config.STORAGE_BACKEND = data_dir, args.backend
+    os.chdir(BASE_DIR)  # logos y fuente de los PDFs, como al ejecutar la app
+    # Sin los avisos de Streamlit por ejecutarse sin servidor (AppTest vuelve a leer la configuración)
+    import streamlit.config
+    import streamlit.logger
+    streamlit.config.set_option("logger.level", "error")
+    streamlit.logger.set_log_level("error")
+    import core
+    import storage
+
+    resultados = {
+        "meta": {
+            "date": datetime.now().isoformat(timespec="seconds"),
+            "commit": _git_commit(),
+            "platform": platform.platform(),
+            "cpus": os.cpu_count(),
+            "versions": _versiones(),
+            "seed": args.seed,
+            "repeat": args.repeat,
+            "repeat_heavy": args.repeat_heavy,
+        },
+        "datasets": [],
+        "results": [],
+    }
+    try:
+        for size in args.sizes:
+            for name in os.listdir(data_dir):
+                os.remove(os.path.join(data_dir, name))
+            core.st.cache_resource.clear()
+            t0 = time.perf_counter()
+            registros, extra = generar_datos(storage.get_storage(args.backend, data_dir), size, args.seed)
+            segundos = time.perf_counter() - t0
+            resultados["datasets"].append({
+                "backend": args.backend, "size": size, "records": registros, "generate_s": segundos,
+                "disk_mb": sum(os.path.getsize(os.path.join(data_dir, n)) for n in os.listdir(data_dir)) / 2**20,
+            })
+            print(f"[{args.backend}] {size} informes generados en {segundos:.1f} s")
+            for caso, repeat, fn, setup in casos(core, extra, args.repeat, args.repeat_heavy, args.seed):
+                if args.cases and caso not in args.cases:
+                    continue
+                r = {"backend": args.backend, "size": size, "case": caso, **medir(fn, repeat, setup),
+                     "rss_max_mb": _rss_max_mb()}
+                resultados["results"].append(r)
+                print(f"  {caso:<22} p50 {r['p50_ms']:>10.2f} ms  p90 {r['p90_ms']:>10.2f} ms  "
+                      f"p99 {r['p99_ms']:>10.2f} ms  pico {r['peak_mb']:>8.1f} MB")
+    finally:
+        if args.data_dir:
+            print(f"Datos generados en {data_dir}")
+        else:
+            shutil.rmtree(data_dir, ignore_errors=True)
+
+    with open(args.output, "w", encoding="utf-8") as f:
+        json.dump(resultados, f, ensure_ascii=False, indent=2)
+    print(f"Resultados en {args.output}")
+    if args.compare:
+        with open(args.compare, encoding="utf-8") as f:
+            comparar(json.load(f), resultados)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Banco de pruebas de Scouting UD Lanzarote con datos sintéticos")
+    parser.add_argument("--sizes", type=int, nargs="+", default=[1000, 50000, 500000], help="Nº de informes de cada prueba")
+    parser.add_argument("--backend", default=os.environ.get("SCOUTING_STORAGE", "json"), choices=["json", "sqlite"])
+    parser.add_argument("--repeat", type=int, default=20, help="Repeticiones de cada caso")
+    parser.add_argument("--repeat-heavy", type=int, default=3,
+                        help="Repeticiones de los casos que leen o escriben la tabla completa")
+    parser.add_argument("--cases", nargs="*", default=None, help="Casos a medir (por defecto, todos)")
+    parser.add_argument("--seed", type=int, default=1)
+    parser.add_argument("--data-dir", default=None,
+                        help="Carpeta en la que crear la subcarpeta de los datos generados, que se conserva "
+                             "(por defecto, una temporal que se borra)")
+    parser.add_argument("--output", default="bench_results.json", help="Fichero JSON de resultados")
+    parser.add_argument("--compare", default=None, help="Resultados anteriores con los que comparar")
+    main(parser.parse_args())
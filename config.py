@@ -0,0 +1,39 @@
+"""
+Configuración de Scouting UD Lanzarote: rutas, tablas y listas de atributos.
+Sin dependencias de Streamlit: la importan la app y los procesos de exportación.
+"""
+import os
+
+# === CONFIGURACIÓN ===
+DATA_DIR = os.path.join(os.path.dirname(__file__), "data")  # Carpeta "data"
+TABLES = ["Posiciones", "Scouts", "Jugadores", "Informes"]
+# Backend de almacenamiento: "json" (ficheros de data/) o "sqlite" (data/scouting.db)
+STORAGE_BACKEND = os.environ.get("SCOUTING_STORAGE", "json")
+# Editores de tablas: filas por página (por defecto y opciones del selector)
+EDITOR_PAGE_SIZE = int(os.environ.get("SCOUTING_PAGE_SIZE", 50))
+EDITOR_PAGE_SIZES = [25, 50, 100, 250, 500]
+
+# Lista de atributos valorables
+ATRIBUTOS_VALORABLES = [
+    "Juego con los pies", "Juego aéreo", "Reflejos (Bajo palos)", "Blocajes",
+    "Salidas (mano a mano)", "Despejes", "Velocidad de reacción", "Colocación",
+    "Salida de balón (corto)", "Salida de balón (largo)", "Duelos", "Duelos aéreos",
+    "Resistencia", "Velocidad", "Precisión en el pase corto", "Precisión en el pase largo",
+    "Llegada al área rival", "Presión", "Desmarques", "Desborde", "Gol", "Descargas",
+    "Remate de cabeza", "Disparos", "Presión mental", "Liderazgo"
+]
+
+# Lista de atributos estadísticos (porcentajes)
+ATRIBUTOS_PORCENTAJE = [
+    "% Duelos ganados",
+    "% Duelos aéreos ganados",
+    "% Pases cortos acertados",
+    "% Pases largos acertados",
+    "% Disparos a puerta"
+]
+
+# Campos del formulario de informe de un jugador registrado
+COLUMNAS_INFORME = [
+    "Fecha informe", "Scout", "Temporada", "Competición", "Equipo local", "Equipo visitante",
+    "Jugador", "Posición", "Lateralidad", "Acción", "Observaciones"
+] + ATRIBUTOS_VALORABLES + ATRIBUTOS_PORCENTAJE
@@ -0,0 +1,410 @@
+"""
+Funciones compartidas por las páginas de la app: acceso a las tablas con caché
+de proceso, agregados de los atributos y caché de PDFs. Las constantes están en
+config.py y se reexportan aquí para las páginas.
+"""
+import json
+import math
+import zlib
+
+import numpy as np
+import pandas as pd
+import streamlit as st
+
+import aggregates
+import indexes
+import storage
+from attributes import AttributeMatrix
+from config import (DATA_DIR, TABLES, STORAGE_BACKEND, ATRIBUTOS_VALORABLES,
+                    ATRIBUTOS_PORCENTAJE, COLUMNAS_INFORME, EDITOR_PAGE_SIZE, EDITOR_PAGE_SIZES)
+
+
+# FUNCIONES AUXILIARES #
+@st.cache_resource(show_spinner=False)
+def get_storage():
+    """Backend de almacenamiento compartido por todas las sesiones."""
+    return storage.get_storage(STORAGE_BACKEND, DATA_DIR)
+
+@st.cache_resource(max_entries=32, show_spinner=False)
+def _read_table(table_name, version, columns=None):
+    """
+    Lee una tabla (completa o solo las columnas indicadas) del almacenamiento.
+    Cacheado a nivel de proceso (compartido por todas las sesiones) y indexado por
+    la versión de la tabla: mientras no cambie, todas las llamadas reciben el mismo
+    DataFrame sin volver a leer el disco. Pasar siempre columns (None = tabla
+    completa): la caché trata _read_table(t, v) y _read_table(t, v, None) como
+    entradas distintas y leería la tabla dos veces.
+    Devuelve (df, notas): notas es la AttributeMatrix de ATRIBUTOS_VALORABLES
+    sobre las filas de df, codificada aquí una vez por versión (None si df no
+    tiene ningún atributo valorable).
+    """
+    df = get_storage().read(table_name, list(columns) if columns is not None else None)
+    notas = None
+    if any(a in df.columns for a in ATRIBUTOS_VALORABLES):
+        notas = AttributeMatrix.from_df(df, ATRIBUTOS_VALORABLES)
+    return df, notas
+
+def table_version(table_name):
+    """Versión actual de la tabla (cambia en cada escritura); sirve de clave para las cachés."""
+    return get_storage().version(table_name)
+
+def load_table(table_name, columns=None):
+    """
+    Devuelve (df, path) de la tabla.
+    Con columns solo se leen esas columnas (las que existan); en JSON salen del
+    snapshot columnar, sin parsear el JSON completo.
+    El DataFrame es compartido entre sesiones y reruns: tratarlo como de solo
+    lectura (hacer .copy() antes de modificarlo).
+    """
+    df, _ = _read(table_name, columns)
+    return df, get_storage().location(table_name)
+
+def load_attribute_matrix(table_name, columns=None):
+    """
+    AttributeMatrix de ATRIBUTOS_VALORABLES de la misma lectura (y versión) que
+    load_table(table_name, columns): sus filas son las de df.iloc. None si la
+    tabla no tiene atributos valorables.
+    """
+    return _read(table_name, columns)[1]
+
+def _read(table_name, columns=None):
+    """(df, notas) de la versión actual de la tabla, ver _read_table."""
+    store = get_storage()
+    if columns is not None:
+        columns = tuple(columns)
+    try:
+        return _read_table(table_name, store.version(table_name), columns)
+    except json.JSONDecodeError:
+        # Fichero corrupto o a medio escribir: no se cachea
+        return pd.DataFrame(), None
+
+def _date_index(df, table_name, column):
+    """indexes.SortedIndex de los días de una columna de fecha (guardados por el almacenamiento) sobre df.iloc."""
+    days = get_storage().read_days(table_name, column)
+    positions = df.index.get_indexer(days.index)
+    found = positions >= 0
+    return indexes.SortedIndex(days.to_numpy()[found], positions[found])
+
+@st.cache_resource(max_entries=8, show_spinner=False)
+def _table_index(table_name, version, columns, date_columns=()):
+    """Índice invertido (y por rango de las fechas) para una versión de la tabla, compartido por todas las sesiones."""
+    df, _ = _read_table(table_name, version, None)
+    index = indexes.InvertedIndex.from_df(df, columns)
+    for column in date_columns:
+        index.ranges[column] = _date_index(df, table_name, column)
+    return index
+
+def load_indexed_table(table_name, columns, date_columns=()):
+    """
+    Devuelve (df, índice) con la tabla completa y un indexes.InvertedIndex de
+    columns (con filtros por rango de días en date_columns), ambos de la misma
+    versión: las posiciones del índice son filas de df.iloc. Igual que en
+    load_table, df es de solo lectura.
+    """
+    version = table_version(table_name)
+    try:
+        df, _ = _read_table(table_name, version, None)
+    except json.JSONDecodeError:
+        df = pd.DataFrame()
+        return df, indexes.InvertedIndex.from_df(df, columns)
+    return df, _table_index(table_name, version, tuple(columns), tuple(date_columns))
+
+def query_table(table_name, filters):
+    """
+    Filas de la tabla que cumplen {columna: valor | lista de valores}.
+    Con SQLite se resuelve con una consulta indexada; con JSON, sobre la tabla cacheada.
+    """
+    store = get_storage()
+    if store.supports_queries:
+        return store.query(table_name, filters)
+    df, _ = load_table(table_name)
+    return storage.filter_df(df, filters)
+
+def distinct_values(table_name, column, filters=None):
+    """Valores distintos de una columna (en orden de aparición), con filtros opcionales."""
+    store = get_storage()
+    if store.supports_queries:
+        return store.distinct(table_name, column, filters)
+    df, _ = load_table(table_name)
+    df = storage.filter_df(df, filters)
+    if column not in df.columns:
+        return []
+    return df[column].dropna().unique().tolist()
+
+# Columnas de Informes que necesitan los agregados
+COLUMNAS_AGREGADOS = ["Jugador", "Posición", "Sub 23"] + ATRIBUTOS_VALORABLES
+
+@st.cache_resource(show_spinner=False)
+def get_aggregates():
+    """Agregados por jugador y por posición de los atributos valorables, compartidos por todas las sesiones."""
+    return aggregates.AggregateCache(
+        ATRIBUTOS_VALORABLES, group_cols=["Jugador", "Posición"], first_cols=["Posición", "Sub 23"]
+    )
+
+def player_aggregates():
+    """Agregados por jugador (nº informes, suma y nº de valores > 0 por atributo) de la versión actual."""
+    version = table_version("Informes")
+    return get_aggregates().get(version, lambda: _read("Informes", COLUMNAS_AGREGADOS), "Jugador")
+
+def position_aggregates():
+    """Perfiles de referencia por posición (medias y percentiles de cada atributo) de la versión actual."""
+    version = table_version("Informes")
+    return get_aggregates().get(version, lambda: _read("Informes", COLUMNAS_AGREGADOS), "Posición")
+
+# Columnas de Informes del historial de un jugador
+COLUMNAS_EVOLUCION = ["Jugador", "Fecha informe", "Temporada"] + ATRIBUTOS_VALORABLES
+
+@st.cache_resource(max_entries=2, show_spinner=False)
+def _player_timeline(version):
+    """Columnas del historial e indexes.TimelineIndex por jugador de una versión de Informes."""
+    df, _ = _read_table("Informes", version, tuple(COLUMNAS_EVOLUCION))
+    return df, indexes.TimelineIndex.from_df(df, "Jugador", "Fecha informe")
+
+def player_history(jugador):
+    """
+    Informes del jugador (COLUMNAS_EVOLUCION) ordenados por fecha, con la fecha
+    ya convertida en la columna "Fecha" (NaT si no se pudo leer). Usa el índice
+    de la versión actual: no reordena ni vuelve a parsear la tabla.
+    """
+    try:
+        df, timeline = _player_timeline(table_version("Informes"))
+    except json.JSONDecodeError:
+        return pd.DataFrame(columns=COLUMNAS_EVOLUCION + ["Fecha"])
+    rows = timeline.rows(jugador)
+    historial = df.iloc[rows].copy()
+    historial["Fecha"] = timeline.dates[rows]
+    return historial
+
+# Columnas de Informes con texto libre para el buscador, y las que se muestran en los resultados
+COLUMNAS_TEXTO = ["Observaciones", "Club", "Competición"]
+COLUMNAS_BUSQUEDA = ["Fecha informe", "Jugador", "Posición", "Scout"] + COLUMNAS_TEXTO
+
+@st.cache_resource(show_spinner=False)
+def get_text_index():
+    """Índice de texto completo de los informes, compartido por todas las sesiones."""
+    return indexes.TextIndexCache(COLUMNAS_TEXTO)
+
+def search_informes(query, limit=50):
+    """
+    Informes cuyas observaciones, club o competición contienen las palabras de
+    la consulta (sin distinguir mayúsculas ni tildes), ordenados por relevancia.
+    DataFrame con COLUMNAS_BUSQUEDA y una columna "Relevancia".
+    """
+    version = table_version("Informes")
+    df, _ = load_table("Informes", COLUMNAS_BUSQUEDA)
+    posiciones, puntuaciones = get_text_index().search(version, lambda: df, query, limit)
+    # Índice y tabla de versiones distintas (escritura concurrente): descartar lo que no exista
+    validas = posiciones < len(df)
+    resultados = df.iloc[posiciones[validas]].copy()
+    resultados["Relevancia"] = np.round(puntuaciones[validas], 2)
+    return resultados
+
+def similar_players(objetivo, k=10, metrica="cosine", posicion=None, sub23=False, pesos=None):
+    """
+    Los k jugadores más parecidos a objetivo: el nombre de un jugador (se usan
+    sus medias y se excluye de los resultados) o {atributo: nota} con un perfil
+    buscado. posicion y sub23 restringen los candidatos (primera posición y
+    valor de "Sub 23" de sus informes). Ver GroupAggregates.nearest.
+    """
+    agregados = player_aggregates()
+    excluir = None
+    if isinstance(objetivo, dict):
+        perfil = np.array([objetivo.get(a, np.nan) for a in agregados.attrs], dtype=float)
+    else:
+        excluir = objetivo
+        medias = agregados.mean_of(objetivo)
+        perfil = np.array([medias.get(a, np.nan) for a in agregados.attrs])
+    candidatos = np.ones(len(agregados.groups), dtype=bool)
+    if posicion:
+        candidatos &= agregados.first_values("Posición") == posicion
+    if sub23:
+        candidatos &= agregados.first_values("Sub 23") == "Sí"
+    if pesos is not None:
+        pesos = [pesos.get(a, 0) for a in agregados.attrs]
+    similares = agregados.nearest(perfil, k, metrica, pesos, candidatos, excluir)
+    for i, col in enumerate(["Posición", "Sub 23"]):
+        similares.insert(i, col, [agregados.first_value(j, col) for j in similares.index])
+    return similares
+
+@st.cache_resource(show_spinner=False)
+def get_name_index():
+    """Índice de trigramas de los nombres de Jugadores, compartido por todas las sesiones."""
+    return indexes.NameIndexCache("Nombre jugador")
+
+def _nombres_jugadores():
+    return load_table("Jugadores", ["Nombre jugador"])[0]
+
+def find_player(nombre):
+    """Nombre registrado en Jugadores que coincide con nombre sin contar mayúsculas, tildes ni espacios (o None)."""
+    return get_name_index().find(table_version("Jugadores"), _nombres_jugadores, nombre)
+
+def suggest_players(nombre, limite=5):
+    """Jugadores registrados con un nombre parecido: [(nombre, similitud 0-1)], los más parecidos primero."""
+    return get_name_index().suggest(table_version("Jugadores"), _nombres_jugadores, nombre, limite)
+
+def pdf_context(informe):
+    """Medias (> 0) del jugador y de su posición para los radares de generar_pdf."""
+    jugador = informe.get("Jugador", "")
+    mean_vals = {a: m for a, m in player_aggregates().mean_of(jugador).items() if m > 0}
+    jugador_pos = player_aggregates().first_value(jugador, "Posición")
+    pos_mean = {}
+    if jugador_pos:
+        pos_mean = {a: m for a, m in position_aggregates().mean_of(jugador_pos).items() if m > 0}
+    return {"mean_vals": mean_vals, "pos_mean": pos_mean, "jugador_pos": jugador_pos}
+
+@st.cache_resource(show_spinner=False)
+def get_pdf_cache():
+    """PDFs ya generados, compartidos por todas las sesiones (LRU acotada en memoria)."""
+    import pdf_report
+    return pdf_report.PdfCache()
+
+def save_table(df, table_name):
+    prev_version, new_version = get_storage().save(table_name, df)
+    if table_name == "Informes":
+        get_aggregates().rebuild(new_version, df)
+    # Invalidar la caché aunque el mtime del sistema de ficheros sea poco preciso
+    _read_table.clear()
+
+def save_changes(table_name, cambios):
+    """
+    Guarda solo los cambios {"updates": {id: campos}, "deletes": [ids], "inserts": [campos]}
+    (ver cambios_pagina). En Informes los agregados restan la versión anterior
+    de los registros modificados o borrados y suman la nueva, sin recalcularse.
+    """
+    if not any(cambios.values()):
+        return
+    anteriores = None
+    if table_name == "Informes":
+        # Registros tal como estaban, de la misma versión que tienen los agregados
+        version = table_version(table_name)
+        df, _ = _read_table(table_name, version, tuple(COLUMNAS_AGREGADOS))
+        ids = list(cambios["updates"]) + list(cambios["deletes"])
+        if df.index.isin(ids).sum() == len(set(ids)):
+            anteriores = {pk: df.loc[pk].to_dict() for pk in ids}
+    prev_version, new_version = get_storage().apply_changes(
+        table_name, cambios["updates"], cambios["deletes"], cambios["inserts"]
+    )
+    if anteriores is not None and prev_version == version:
+        get_aggregates().records_changed(
+            prev_version, new_version,
+            deleted={pk: anteriores[pk] for pk in cambios["deletes"]},
+            inserted=cambios["inserts"],
+            updated={pk: (anteriores[pk], campos) for pk, campos in cambios["updates"].items()},
+        )
+    _read_table.clear()
+
+def add_new_record(table_name, new_record):
+    prev_version, new_version = get_storage().append(table_name, new_record)
+    if table_name == "Informes":
+        get_aggregates().record_added(prev_version, new_version, new_record)
+        get_text_index().record_added(prev_version, new_version, new_record)
+    elif table_name == "Jugadores":
+        get_name_index().record_added(prev_version, new_version, new_record)
+    _read_table.clear()
+
+# EDITOR POR PÁGINAS #
+SIN_ORDEN = "(orden original)"
+
+def _sort_codes(values):
+    """Código de orden de cada fila (empates con el mismo código, -1 si está vacía)."""
+    try:
+        codes, _ = pd.factorize(values, sort=True)
+    except TypeError:
+        # Tipos mezclados: ordenar por el texto
+        codes, _ = pd.factorize(values.astype(str).where(values.notna()), sort=True)
+    return codes
+
+@st.cache_resource(max_entries=16, show_spinner=False)
+def _table_sort_codes(table_name, version, column):
+    """Códigos de orden de una columna para una versión de la tabla (compartidos por todas las sesiones)."""
+    return _sort_codes(_read_table(table_name, version, None)[0][column])
+
+def editor_paginado(table_name, df, filas=None):
+    """
+    Editor por páginas de una vista de la tabla: el orden y el recorte se hacen
+    en el servidor y a st.data_editor solo llega la página visible.
+    df es la tabla completa de load_table y filas las posiciones de la vista
+    (filtrada) a mostrar; None = todas. Devuelve (página mostrada, cambios de
+    la página para save_changes).
+    """
+    filas = np.arange(len(df)) if filas is None else np.asarray(filas)
+    col_orden, col_desc, col_tam, col_pag = st.columns([3, 2, 2, 2])
+    orden = col_orden.selectbox("Ordenar por", [SIN_ORDEN] + list(df.columns), key=f"orden_{table_name}")
+    descendente = col_desc.toggle("Descendente", key=f"desc_{table_name}")
+    tam = col_tam.selectbox(
+        "Filas por página", EDITOR_PAGE_SIZES,
+        index=EDITOR_PAGE_SIZES.index(EDITOR_PAGE_SIZE) if EDITOR_PAGE_SIZE in EDITOR_PAGE_SIZES else 0,
+        key=f"tam_{table_name}"
+    )
+    n_paginas = max(1, math.ceil(len(filas) / tam))
+    # Si la vista se ha reducido (filtros, borrados), no quedarse en una página que ya no existe
+    if st.session_state.get(f"pagina_{table_name}", 1) > n_paginas:
+        st.session_state[f"pagina_{table_name}"] = n_paginas
+    pagina = col_pag.number_input(f"Página (de {n_paginas})", 1, n_paginas, key=f"pagina_{table_name}")
+
+    # Orden en el servidor: códigos de la columna (cacheados por versión) sobre las filas de la vista
+    if orden != SIN_ORDEN:
+        codes = _table_sort_codes(table_name, table_version(table_name), orden)
+        if len(codes) != len(df):  # la tabla cambió entre lecturas
+            codes = _sort_codes(df[orden])
+        claves = codes[filas]
+        claves = np.where(claves < 0, np.iinfo(np.int64).max, -claves if descendente else claves)
+        filas = filas[np.argsort(claves, kind="stable")]
+    elif descendente:
+        filas = filas[::-1]
+    visibles = filas[(pagina - 1) * tam:pagina * tam]
+
+    pagina_df = df.iloc[visibles]
+    # La clave depende solo de los ids mostrados: al cambiar de página no se arrastran
+    # ediciones, y una escritura de otra sesión no descarta las ediciones pendientes
+    huella = zlib.crc32(np.asarray(pagina_df.index, dtype=np.int64).tobytes())
+    key = f"data_editor_{table_name}_{huella}"
+    edited_df = st.data_editor(
+        pagina_df,
+        num_rows="dynamic",
+        use_container_width=True,
+        key=key
+    )
+    if len(filas):
+        st.caption(f"Filas {(pagina - 1) * tam + 1}-{(pagina - 1) * tam + len(visibles)} de {len(filas)}")
+    return pagina_df, cambios_pagina(pagina_df, edited_df, st.session_state.get(key, {}))
+
+def cambios_pagina(pagina_df, edited_df, estado):
+    """
+    Cambios de una página del editor por id de registro (el índice de pagina_df).
+    estado es el de st.data_editor en session_state: edited_rows, deleted_rows
+    (posiciones en la página) y added_rows. Los valores editados salen de
+    edited_df, ya convertidos al tipo de cada columna; el resto de campos de una
+    fila editada se queda como estaba.
+    """
+    ids = pagina_df.index
+    deletes = [ids[int(i)] for i in estado.get("deleted_rows", [])]
+    updates = {}
+    for i, celdas in estado.get("edited_rows", {}).items():
+        pk = ids[int(i)]
+        if pk in deletes:
+            continue
+        campos = pagina_df.loc[[pk]].to_dict("records")[0]
+        editadas = [c for c in celdas if c in edited_df.columns]
+        campos.update(edited_df.loc[[pk], editadas].to_dict("records")[0])
+        updates[pk] = campos
+    nuevas = edited_df[~edited_df.index.isin(ids)]
+    return {
+        "updates": updates,
+        "deletes": deletes,
+        # Filas añadidas sin ningún valor: no se guardan
+        "inserts": [r for r in nuevas.to_dict("records") if any(pd.notna(v) for v in r.values())],
+    }
+
+def editar_tabla(table_name):
+    """Editor por páginas de una tabla con botón de guardado (Posiciones, Jugadores, Scouts)."""
+    df, _ = load_table(table_name)
+    st.subheader(f"Datos de {table_name}")
+    _, cambios = editor_paginado(table_name, df)
+    if st.button("💾 Guardar cambios", key=f"save_{table_name}"):
+        if not any(cambios.values()):
+            st.warning("No hay cambios que guardar en esta página.")
+        else:
+            save_changes(table_name, cambios)
+            st.success(f"{table_name} actualizado correctamente ✅")
+            st.rerun()
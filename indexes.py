@@ -0,0 +1,547 @@
+"""
+Índices invertidos sobre columnas de una tabla.
+
+InvertedIndex (columnas categóricas): para cada columna se guarda, por valor,
+el array ordenado de posiciones de las filas que lo tienen. Un filtro
+{columna: [valores]} se resuelve uniendo las listas de los valores de cada
+columna e intersecando las de columnas distintas, sin recorrer la tabla; las
+opciones de los filtros salen de las claves. Las columnas numéricas (fechas
+como nº de días) se consultan por rango con un SortedIndex.
+
+TimelineIndex (historial): fechas ya convertidas y, por grupo (jugador), sus
+filas ordenadas por fecha; el historial de un jugador sale sin volver a
+ordenar ni parsear la tabla.
+
+TextIndex (texto libre): términos en minúsculas y sin tildes -> filas que los
+contienen, con la frecuencia de cada término; las consultas de varias palabras
+se ordenan por relevancia (BM25).
+
+NameIndex (nombres de jugadores): trigramas del nombre plegado -> nombres que
+los contienen. Sugiere nombres parecidos ("J. Perez" ~ "Juan Pérez") sin
+comparar con todos y agrupa los posibles duplicados de la tabla.
+
+Uso por línea de comandos (informe de duplicados de Jugadores):
+
+    python indexes.py duplicados data/ [--umbral 0.7]
+"""
+import argparse
+import array
+import math
+import os
+import re
+import threading
+import unicodedata
+from collections import Counter
+
+import numpy as np
+import pandas as pd
+
+# Términos del texto: secuencias de letras y dígitos (tras quitar tildes)
+TOKEN_PATTERN = r"[a-z0-9]+"
+
+
+def _sorted_values(values):
+    """Valores ordenados (por su texto si no son comparables entre sí)."""
+    try:
+        return sorted(values)
+    except TypeError:
+        return sorted(values, key=str)
+
+
+class InvertedIndex:
+    """
+    Índice valor -> posiciones de fila de varias columnas de un DataFrame.
+    Las posiciones son de df.iloc del DataFrame con el que se construyó.
+    """
+
+    def __init__(self, n_rows, postings, ranges=None):
+        self.n_rows = n_rows
+        # postings[col][valor]: np.ndarray ordenado con las posiciones de las filas
+        self.postings = postings
+        self._options = {col: _sorted_values(values) for col, values in postings.items()}
+        # ranges[col]: SortedIndex de las columnas con filtro por rango
+        self.ranges = dict(ranges or {})
+
+    @classmethod
+    def from_df(cls, df, columns):
+        """Construye el índice de las columnas indicadas (las que falten quedan vacías)."""
+        postings = {}
+        for col in columns:
+            postings[col] = {}
+            if col not in df.columns:
+                continue
+            codes, uniques = pd.factorize(df[col])
+            # Orden estable por código: las filas de cada valor quedan contiguas y en orden
+            order = np.argsort(codes, kind="stable")
+            counts = np.bincount(codes[codes >= 0], minlength=len(uniques))
+            start = int((codes < 0).sum())  # filas sin valor (NaN), al principio
+            for value, end in zip(uniques, start + np.cumsum(counts)):
+                postings[col][value] = order[start:end]
+                start = end
+        return cls(len(df), postings)
+
+    def options(self, col):
+        """Valores distintos (no nulos) de la columna, ordenados."""
+        return self._options.get(col, [])
+
+    def lookup(self, filters, ranges=None):
+        """
+        Posiciones ordenadas de las filas que cumplen {columna: valor | lista de valores}
+        y, para las columnas de self.ranges, {columna: (desde, hasta)} (incluidos;
+        None deja ese extremo abierto). Las listas vacías no filtran (como un
+        multiselect sin selección); devuelve None si no hay ningún filtro activo.
+        """
+        matches = []
+        for col, (low, high) in (ranges or {}).items():
+            if low is None and high is None:
+                continue
+            if col not in self.ranges:
+                return np.empty(0, dtype=np.int64)
+            matches.append(self.ranges[col].range(low, high))
+        for col, values in filters.items():
+            if not isinstance(values, (list, tuple, set)):
+                values = [values]
+            if not values:
+                continue
+            lists = [self.postings.get(col, {}).get(v) for v in values]
+            lists = [rows for rows in lists if rows is not None]
+            if not lists:
+                return np.empty(0, dtype=np.int64)
+            # Cada fila tiene un solo valor por columna: las listas no se solapan
+            matches.append(lists[0] if len(lists) == 1 else np.sort(np.concatenate(lists)))
+        if not matches:
+            return None
+        # Intersección empezando por la lista más corta
+        matches.sort(key=len)
+        result = matches[0]
+        for rows in matches[1:]:
+            if not len(result):
+                break
+            result = np.intersect1d(result, rows, assume_unique=True)
+        return result
+
+
+class SortedIndex:
+    """
+    Valores numéricos de una columna ordenados, con la posición (df.iloc) de la
+    fila de cada uno: un rango se resuelve con dos búsquedas binarias.
+    """
+
+    def __init__(self, values, positions):
+        order = np.argsort(values, kind="stable")
+        self.values = np.asarray(values)[order]
+        self.positions = np.asarray(positions, dtype=np.int64)[order]
+
+    def __len__(self):
+        return len(self.values)
+
+    def bounds(self):
+        """(mínimo, máximo) de los valores, o (None, None) si no hay ninguno."""
+        if not len(self.values):
+            return None, None
+        return self.values[0].item(), self.values[-1].item()
+
+    def range(self, low=None, high=None):
+        """Posiciones ordenadas de las filas con low <= valor <= high (None: sin límite)."""
+        start = 0 if low is None else np.searchsorted(self.values, low, side="left")
+        end = len(self.values) if high is None else np.searchsorted(self.values, high, side="right")
+        return np.sort(self.positions[start:end])
+
+
+class TimelineIndex:
+    """
+    Fechas de las filas de una tabla y, por grupo, las posiciones de sus filas
+    (df.iloc) ordenadas por fecha. Las filas sin fecha válida van delante (como
+    las más antiguas) y a igual fecha se respeta el orden de la tabla.
+    """
+
+    def __init__(self, dates, postings):
+        self.dates = dates          # np.ndarray datetime64[ns] por posición (NaT si no hay fecha)
+        self.postings = postings    # grupo -> np.ndarray de posiciones ordenadas por fecha
+
+    @classmethod
+    def from_df(cls, df, group_col, date_col, date_format="%d-%m-%Y"):
+        """Convierte date_col una sola vez (formato DD-MM-AAAA) y ordena las filas de cada grupo."""
+        if date_col in df.columns:
+            dates = pd.to_datetime(df[date_col], format=date_format, errors="coerce").to_numpy("datetime64[ns]")
+        else:
+            dates = np.full(len(df), np.datetime64("NaT"), dtype="datetime64[ns]")
+        postings = {}
+        if group_col not in df.columns or df.empty:
+            return cls(dates, postings)
+        codes, uniques = pd.factorize(df[group_col])
+        # Por grupo y, dentro de cada uno, por fecha (NaT es el mínimo); lexsort es estable
+        order = np.lexsort((dates.view(np.int64), codes))
+        counts = np.bincount(codes[codes >= 0], minlength=len(uniques))
+        start = int((codes < 0).sum())
+        for value, end in zip(uniques, start + np.cumsum(counts)):
+            postings[value] = order[start:end]
+            start = end
+        return cls(dates, postings)
+
+    def rows(self, group):
+        """Posiciones de las filas del grupo, de la más antigua a la más reciente."""
+        return self.postings.get(group, np.empty(0, dtype=np.int64))
+
+
+def fold_text(text):
+    """Texto en minúsculas y sin tildes ni diéresis (la ñ queda como n)."""
+    return unicodedata.normalize("NFKD", str(text)).encode("ascii", "ignore").decode("ascii").lower()
+
+
+def tokenize(text):
+    """Términos de un texto, plegado con fold_text."""
+    return re.findall(TOKEN_PATTERN, fold_text(text))
+
+
+class TextIndex:
+    """
+    Índice de texto completo de varias columnas de una tabla. Los documentos son
+    las filas en orden (posiciones de df.iloc del DataFrame de from_df); add()
+    añade uno al final sin reconstruir el resto.
+    """
+
+    # Parámetros de BM25
+    K1 = 1.2
+    B = 0.75
+
+    def __init__(self, columns):
+        self.columns = list(columns)
+        self.n_docs = 0
+        self._total_len = 0
+        self._doc_len = array.array("i")
+        # término -> (posiciones, frecuencias) como arrays numpy (construcción inicial)
+        self._postings = {}
+        # término -> (posiciones, frecuencias) añadidas después con add()
+        self._added = {}
+
+    @classmethod
+    def from_df(cls, df, columns):
+        """Indexa las columnas de texto de df (las que falten se ignoran)."""
+        index = cls(columns)
+        texts = index._texts(df)
+        index.n_docs = len(texts)
+        if not len(texts):
+            return index
+        tokens = (
+            texts.str.normalize("NFKD").str.encode("ascii", "ignore").str.decode("ascii")
+            .str.lower().str.findall(TOKEN_PATTERN)
+        )
+        # Un par (término, documento) por aparición
+        terms = tokens.explode().dropna()
+        docs = terms.index.to_numpy(dtype=np.int64)
+        doc_len = np.bincount(docs, minlength=len(texts))
+        index._doc_len.frombytes(doc_len.astype(np.int32).tobytes())
+        index._total_len = int(doc_len.sum())
+        if not len(terms):
+            return index
+
+        counts = pd.DataFrame({"term": terms.to_numpy(dtype=object), "doc": docs}).value_counts(sort=False)
+        counts = counts.sort_index()  # por término y, dentro de cada uno, por documento
+        term_values = counts.index.get_level_values("term")
+        doc_values = counts.index.get_level_values("doc").to_numpy(dtype=np.int32)
+        tfs = counts.to_numpy(dtype=np.int32)
+        codes, uniques = pd.factorize(term_values)
+        bounds = np.flatnonzero(np.diff(codes)) + 1
+        starts = np.concatenate([[0], bounds])
+        ends = np.concatenate([bounds, [len(codes)]])
+        for term, start, end in zip(uniques, starts, ends):
+            index._postings[term] = (doc_values[start:end], tfs[start:end])
+        return index
+
+    def _texts(self, df):
+        """Texto de cada fila: las columnas indexadas unidas, con posiciones 0..n-1."""
+        columns = [c for c in self.columns if c in df.columns]
+        if not columns or df.empty:
+            return pd.Series([""] * len(df), dtype=object)
+        texts = df[columns[0]].fillna("").astype(str)
+        for col in columns[1:]:
+            texts = texts + " " + df[col].fillna("").astype(str)
+        return texts.reset_index(drop=True)
+
+    def add(self, record):
+        """Añade un documento (dict con las columnas de texto) al final del índice."""
+        text = " ".join(
+            str(record.get(c)) for c in self.columns if record.get(c) is not None and not pd.isna(record.get(c))
+        )
+        tokens = tokenize(text)
+        for term, tf in Counter(tokens).items():
+            docs, tfs = self._added.setdefault(term, (array.array("i"), array.array("i")))
+            docs.append(self.n_docs)
+            tfs.append(tf)
+        self._doc_len.append(len(tokens))
+        self._total_len += len(tokens)
+        self.n_docs += 1
+
+    def _term_postings(self, term):
+        docs, tfs = self._postings.get(term, (np.empty(0, np.int32), np.empty(0, np.int32)))
+        if term in self._added:
+            added_docs, added_tfs = self._added[term]
+            docs = np.concatenate([docs, np.frombuffer(added_docs, dtype=np.int32)])
+            tfs = np.concatenate([tfs, np.frombuffer(added_tfs, dtype=np.int32)])
+        return docs, tfs
+
+    def search(self, query, limit=50):
+        """
+        Documentos que contienen alguno de los términos de la consulta, ordenados
+        por relevancia (BM25). Devuelve (posiciones, puntuaciones) de como mucho
+        limit documentos.
+        """
+        if not self.n_docs or not self._total_len:
+            return np.empty(0, dtype=np.int64), np.empty(0)
+        doc_len = np.frombuffer(self._doc_len, dtype=np.int32)
+        avg_len = self._total_len / self.n_docs
+        scores = np.zeros(self.n_docs)
+        for term in dict.fromkeys(tokenize(query)):
+            docs, tfs = self._term_postings(term)
+            if not len(docs):
+                continue
+            idf = math.log(1 + (self.n_docs - len(docs) + 0.5) / (len(docs) + 0.5))
+            norm = self.K1 * (1 - self.B + self.B * doc_len[docs] / avg_len)
+            scores[docs] += idf * tfs * (self.K1 + 1) / (tfs + norm)
+        found = np.flatnonzero(scores > 0)
+        # Más relevantes primero; a igual relevancia, los más recientes
+        order = np.lexsort((-found, -scores[found]))[:limit]
+        return found[order], scores[found[order]]
+
+
+class TextIndexCache:
+    """
+    Índice de texto compartido por todo el proceso, ligado a una versión de la
+    tabla como aggregates.AggregateCache: los registros añadidos por la app se
+    incorporan con add() y cualquier otra escritura lo reconstruye en la
+    siguiente búsqueda.
+    """
+
+    def __init__(self, columns):
+        self.columns = list(columns)
+        self._lock = threading.Lock()
+        self._version = None
+        self._index = None
+
+    def search(self, version, load_df, query, limit=50):
+        """TextIndex.search() sobre la versión indicada; load_df() da la tabla si hay que reconstruir."""
+        with self._lock:
+            if self._version != version or self._index is None:
+                self._index = TextIndex.from_df(load_df(), self.columns)
+                self._version = version
+            return self._index.search(query, limit)
+
+    def record_added(self, prev_version, new_version, record):
+        """Añade un registro recién guardado si el índice estaba al día."""
+        with self._lock:
+            if self._index is not None and self._version == prev_version:
+                self._index.add(record)
+                self._version = new_version
+
+
+def name_key(name):
+    """Nombre normalizado para comparar: plegado y con los términos separados por un espacio."""
+    return " ".join(tokenize(name))
+
+
+def trigrams(key):
+    """Trigramas de un nombre normalizado, con un espacio de relleno a cada lado."""
+    padded = f" {key} "
+    return {padded[i:i + 3] for i in range(len(padded) - 2)}
+
+
+class NameIndex:
+    """
+    Índice de trigramas de una columna de nombres. Cada nombre normalizado
+    distinto (name_key) se indexa una vez, con las filas (posiciones de df.iloc)
+    que lo tienen; add() añade uno sin reconstruir.
+    """
+
+    def __init__(self):
+        self.keys = []           # nombre normalizado de cada id
+        self.names = []          # primer nombre original de cada id
+        self.rows = []           # posiciones de las filas de cada id
+        self._ids = {}           # nombre normalizado -> id
+        self._grams = []         # trigramas de cada id
+        self._postings = {}      # trigrama -> array("i") de ids
+        self.n_rows = 0
+
+    @classmethod
+    def from_values(cls, names):
+        """Indexa una secuencia de nombres (los vacíos ocupan fila pero no se indexan)."""
+        index = cls()
+        for name in names:
+            index.add(name)
+        return index
+
+    @classmethod
+    def from_df(cls, df, column):
+        return cls.from_values(df[column] if column in df.columns else [None] * len(df))
+
+    def add(self, name):
+        """Añade el nombre de una fila nueva al final."""
+        row = self.n_rows
+        self.n_rows += 1
+        if name is None or pd.isna(name):
+            return
+        key = name_key(name)
+        if not key:
+            return
+        i = self._ids.get(key)
+        if i is None:
+            i = len(self.keys)
+            self._ids[key] = i
+            self.keys.append(key)
+            self.names.append(str(name))
+            self.rows.append([])
+            grams = trigrams(key)
+            self._grams.append(grams)
+            for gram in grams:
+                self._postings.setdefault(gram, array.array("i")).append(i)
+        self.rows[i].append(row)
+
+    def find(self, name):
+        """Nombre ya registrado que coincide al normalizar (mayúsculas, tildes, espacios), o None."""
+        i = self._ids.get(name_key(name))
+        return None if i is None else self.names[i]
+
+    def suggest(self, name, limit=5, threshold=0.5):
+        """
+        Nombres registrados parecidos a name: lista de (nombre, similitud) con
+        similitud (Dice de trigramas) >= threshold, los más parecidos primero.
+        """
+        key = name_key(name)
+        if not key or not self.keys:
+            return []
+        grams = trigrams(key)
+        lists = [np.frombuffer(self._postings[g], dtype=np.int32) for g in grams if g in self._postings]
+        if not lists:
+            return []
+        # Trigramas en común con cada nombre, contando solo los que comparten alguno
+        shared = np.bincount(np.concatenate(lists), minlength=len(self.keys))
+        sizes = np.fromiter((len(g) for g in self._grams), dtype=np.int64, count=len(self._grams))
+        scores = 2 * shared / (len(grams) + sizes)
+        found = np.flatnonzero(scores >= threshold)
+        found = found[np.lexsort((found, -scores[found]))][:limit]
+        return [(self.names[i], float(scores[i])) for i in found]
+
+    def duplicate_clusters(self, threshold=0.7):
+        """
+        Grupos de nombres distintos que probablemente son el mismo jugador
+        (Dice de trigramas >= threshold, unidos transitivamente). Lista de
+        listas de ids, las más grandes primero.
+
+        Usa filtrado por prefijo: con los trigramas de cada nombre ordenados del
+        más raro al más frecuente, dos nombres con Dice >= threshold comparten
+        por fuerza alguno de los primeros de cada uno. Solo se comparan (en
+        bloque, con numpy) los pares que coinciden en esos prefijos y cuyas
+        longitudes permiten llegar al umbral, no todos con todos.
+        """
+        n = len(self.keys)
+        parent = list(range(n))
+
+        def find(i):
+            while parent[i] != i:
+                parent[i] = parent[parent[i]]
+                i = parent[i]
+            return i
+
+        if n < 2:
+            return []
+        ratio = threshold / (2 - threshold)
+        # Trigramas como enteros, numerados del más raro al más frecuente
+        vocab = sorted(self._postings, key=lambda g: (len(self._postings[g]), g))
+        gram_ids = {g: k for k, g in enumerate(vocab)}
+        # Nombres de menos a más trigramas: cada uno se compara con los anteriores
+        order = sorted(range(n), key=lambda i: len(self._grams[i]))
+        grams = [np.sort(np.fromiter((gram_ids[g] for g in self._grams[i]), dtype=np.int64)) for i in order]
+        sizes = np.array([len(g) for g in grams])
+        offsets = np.concatenate([[0], np.cumsum(sizes)])
+        flat = np.concatenate(grams)
+        prefix_len = sizes - np.ceil(ratio * sizes).astype(np.int64) + 1
+
+        # trigrama -> posiciones (en order) de los nombres que lo tienen en el prefijo
+        prefix_postings = {}
+        for rank, ids in enumerate(grams):
+            for g in ids[:prefix_len[rank]]:
+                prefix_postings.setdefault(g, []).append(rank)
+        prefix_postings = {g: np.array(ranks) for g, ranks in prefix_postings.items()}
+
+        in_name = np.zeros(len(vocab), dtype=bool)
+        for rank, ids in enumerate(grams):
+            lists = [prefix_postings[g] for g in ids[:prefix_len[rank]]]
+            candidates = np.unique(np.concatenate(lists))
+            candidates = candidates[(candidates < rank) & (sizes[candidates] >= ratio * sizes[rank])]
+            if not len(candidates):
+                continue
+            # Trigramas en común con cada candidato: marcar los del nombre y contar en los del candidato
+            in_name[ids] = True
+            cand_sizes = sizes[candidates]
+            starts = np.repeat(offsets[candidates] - np.cumsum(cand_sizes) + cand_sizes, cand_sizes)
+            shared = np.add.reduceat(in_name[flat[starts + np.arange(cand_sizes.sum())]],
+                                     np.cumsum(cand_sizes) - cand_sizes)
+            in_name[ids] = False
+            dice = 2 * shared / (sizes[rank] + cand_sizes)
+            for other in candidates[dice >= threshold]:
+                parent[find(order[other])] = find(order[rank])
+
+        clusters = {}
+        for i in range(n):
+            clusters.setdefault(find(i), []).append(i)
+        groups = [sorted(ids) for ids in clusters.values() if len(ids) > 1]
+        return sorted(groups, key=lambda ids: (-len(ids), ids[0]))
+
+
+class NameIndexCache:
+    """
+    NameIndex compartido por todo el proceso y ligado a una versión de la tabla,
+    como TextIndexCache: las altas de la app se añaden con add() y cualquier
+    otra escritura lo reconstruye en la siguiente consulta.
+    """
+
+    def __init__(self, column):
+        self.column = column
+        self._lock = threading.Lock()
+        self._version = None
+        self._index = None
+
+    def _current(self, version, load_df):
+        if self._version != version or self._index is None:
+            self._index = NameIndex.from_df(load_df(), self.column)
+            self._version = version
+        return self._index
+
+    def find(self, version, load_df, name):
+        """NameIndex.find() sobre la versión indicada; load_df() da la tabla si hay que reconstruir."""
+        with self._lock:
+            return self._current(version, load_df).find(name)
+
+    def suggest(self, version, load_df, name, limit=5, threshold=0.5):
+        """NameIndex.suggest() sobre la versión indicada."""
+        with self._lock:
+            return self._current(version, load_df).suggest(name, limit, threshold)
+
+    def record_added(self, prev_version, new_version, record):
+        """Añade el nombre de un registro recién guardado si el índice estaba al día."""
+        with self._lock:
+            if self._index is not None and self._version == prev_version:
+                self._index.add(record.get(self.column))
+                self._version = new_version
+
+
+if __name__ == "__main__":
+    import storage
+
+    parser = argparse.ArgumentParser(description="Índices de Scouting UD Lanzarote")
+    sub = parser.add_subparsers(dest="command", required=True)
+    dup = sub.add_parser("duplicados", help="Posibles jugadores duplicados en la tabla Jugadores")
+    dup.add_argument("data_dir", nargs="?", default=os.path.join(os.path.dirname(os.path.abspath(__file__)), "data"))
+    dup.add_argument("--backend", default=os.environ.get("SCOUTING_STORAGE", "json"), choices=["json", "sqlite"])
+    dup.add_argument("--umbral", type=float, default=0.7, help="Similitud mínima (Dice de trigramas, 0-1)")
+    args = parser.parse_args()
+
+    if args.command == "duplicados":
+        jugadores = storage.get_storage(args.backend, args.data_dir).read("Jugadores")
+        index = NameIndex.from_df(jugadores, "Nombre jugador")
+        clusters = index.duplicate_clusters(args.umbral)
+        for ids in clusters:
+            print(" | ".join(
+                f"{index.names[i]} (id {', '.join(str(jugadores.index[r]) for r in index.rows[i])})" for i in ids
+            ))
+        print(f"{len(clusters)} grupos de posibles duplicados entre {len(index.keys)} nombres distintos")
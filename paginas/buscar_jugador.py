@@ -0,0 +1,191 @@
+# === BUSCAR JUGADOR: ficha, radar y referencia de su posición ===
+import numpy as np
+import pandas as pd
+import plotly.express as px
+import streamlit as st
+
+from attributes import AttributeMatrix
+from core import (ATRIBUTOS_VALORABLES, distinct_values, load_table, player_history, position_aggregates,
+                  query_table)
+
+st.subheader("🔎 Buscar jugador")
+
+# Cargar tablas
+jugadores, _ = load_table("Jugadores")
+jugadores_informados = distinct_values("Informes", "Jugador")
+
+if jugadores.empty or not jugadores_informados:
+    st.warning("No hay jugadores o informes disponibles todavía.")
+else:
+    # === Filtro por posición (opcional) ===
+    posiciones = distinct_values("Informes", "Posición")
+    posiciones.insert(0, "-- Todas --")  # opción por defecto
+    posicion_sel = st.selectbox("Selecciona posición:", posiciones, index=0)
+
+    # === Filtro por jugador ===
+    if posicion_sel != "-- Todas --":
+        jugadores_lista = distinct_values("Informes", "Jugador", {"Posición": posicion_sel})
+    else:
+        jugadores_lista = list(jugadores_informados)  # no filtra por posición
+    jugadores_lista.insert(0, "")  # opción vacía
+    jugador_sel = st.selectbox("Selecciona jugador:", jugadores_lista, index=0)
+
+    if jugador_sel:  # solo continuar si hay jugador elegido
+        # Informes del jugador seleccionado (consulta filtrada)
+        informe_jugador = query_table("Informes", {"Jugador": jugador_sel})
+        if informe_jugador.empty:
+            st.warning(f"No hay informes para {jugador_sel}")
+        else:
+            # Historial ordenado por fecha (índice precalculado por versión de la tabla)
+            historial = player_history(jugador_sel)
+            # Último informe por fecha, no por orden en el fichero
+            ultimo = informe_jugador.index[-1]
+            if not historial.empty and historial.index[-1] in informe_jugador.index:
+                ultimo = historial.index[-1]
+
+            # === INFO DEL JUGADOR ===
+            jugador_info = informe_jugador.loc[ultimo]
+            nombre = jugador_info.get("Jugador", "Desconocido")
+            fecha_nacimiento = jugador_info.get("Fecha de nacimiento", "Desconocida")
+            posicion = jugador_info.get("Posición", "Desconocida")
+            club = jugador_info.get("Club", "Desconocido")
+            lateralidad = jugador_info.get("Lateralidad", "Desconocida")
+            num_informes = len(informe_jugador)
+
+            # Atributos valorados (> 0) del último informe
+            atributos_valorados = AttributeMatrix.from_df(
+                informe_jugador.loc[[ultimo]], ATRIBUTOS_VALORABLES).row_values(0)
+
+            if len(atributos_valorados) == 0:
+                st.warning("Este jugador no tiene atributos valorados todavía.")
+            else:
+                media = np.mean(list(atributos_valorados.values()))
+
+                # === Mostrar información del jugador en tarjeta oscura ===
+                st.markdown(
+                    f"""
+                    <div style="
+                        padding:20px; 
+                        border-radius:12px; 
+                        margin-bottom:15px;
+                        background-color:#2c2c2c; 
+                        border:2px solid #e74c3c;
+                        color:#ecf0f1;
+                        box-shadow:0px 4px 8px rgba(0,0,0,0.2);
+                    ">
+                        <h3 style="margin:0 0 10px 0; color:#ecf0f1;">{nombre}</h3>
+                        <p style="margin:5px 0;"><strong>Fecha nacimiento🗓️:</strong> {fecha_nacimiento}</p>
+                        <p style="margin:5px 0;"><strong>Posición📍: </strong> {posicion}</p>
+                        <p style="margin:5px 0;"><strong>Club🏠:</strong> {club}</p>
+                        <p style="margin:5px 0;"><strong>Lateralidad🦵:</strong> {lateralidad}</p>
+                        <p style="margin:5px 0;"><strong>Número de informes📝:</strong> {num_informes}</p>
+                        <p style="margin:5px 0;"><strong>Promedio de atributos valorados⭐:</strong> {media:.2f} / 5</p>
+                    </div>
+                    """,
+                    unsafe_allow_html=True
+                )
+
+                # === RADAR PLOTLY ===
+                df_radar = pd.DataFrame({
+                    "Atributo": list(atributos_valorados.keys()),
+                    "Valor": list(atributos_valorados.values()),
+                    "Jugador": [jugador_sel] * len(atributos_valorados)
+                })
+
+                # Referencia: media de su posición (perfil precalculado)
+                perfil_pos = position_aggregates()
+                if posicion in perfil_pos:
+                    medias_pos = perfil_pos.mean_of(posicion)
+                    atributos_pos = [a for a in atributos_valorados if a in medias_pos]
+                    df_radar = pd.concat([df_radar, pd.DataFrame({
+                        "Atributo": atributos_pos,
+                        "Valor": [medias_pos[a] for a in atributos_pos],
+                        "Jugador": [f"Media {posicion}"] * len(atributos_pos)
+                    })], ignore_index=True)
+
+                fig = px.line_polar(
+                    df_radar,
+                    r="Valor",
+                    theta="Atributo",
+                    color="Jugador",
+                    line_close=True,
+                    range_r=[0, 5]
+                )
+
+                # Estilo oscuro
+                fig.update_traces(line=dict(width=3), fill="toself")
+                fig.update_layout(
+                    polar=dict(
+                        bgcolor="#2c2c2c",
+                        radialaxis=dict(
+                            tick0=0, dtick=1,
+                            tickfont=dict(color="#ecf0f1"),
+                            showline=True, linecolor="#bdc3c7", gridcolor="#444"
+                        ),
+                        angularaxis=dict(
+                            tickfont=dict(color="#ecf0f1"),
+                            linecolor="#bdc3c7", gridcolor="#444"
+                        )
+                    ),
+                    legend=dict(title_text="", font=dict(color="#ecf0f1")),
+                    paper_bgcolor="#1e1e1e",
+                    plot_bgcolor="#1e1e1e",
+                    width=600, height=600
+                )
+
+                st.plotly_chart(fig, use_container_width=True)
+
+                # === REFERENCIA DE LA POSICIÓN (medias y percentiles precalculados) ===
+                if posicion in perfil_pos:
+                    with st.expander(f"📏 Referencia de la posición: {posicion}"):
+                        referencia = perfil_pos.percentiles(posicion)
+                        referencia.insert(0, "Media posición", perfil_pos.means([posicion]).iloc[0])
+                        referencia.insert(0, "Último informe", pd.Series(atributos_valorados))
+                        referencia = referencia.loc[list(atributos_valorados)]
+                        st.dataframe(referencia.round(2), use_container_width=True)
+
+            # === EVOLUCIÓN: medias móviles y por temporada ===
+            st.markdown("#### 📈 Evolución")
+            if len(historial) < 2:
+                st.info("Hace falta más de un informe para ver la evolución.")
+            else:
+                notas = pd.DataFrame(
+                    AttributeMatrix.from_df(historial, ATRIBUTOS_VALORABLES).as_float(),
+                    index=historial.index, columns=ATRIBUTOS_VALORABLES
+                )
+                notas.insert(0, "Media", notas.mean(axis=1))
+
+                col_attr, col_ventana = st.columns([3, 1])
+                atributos_evol = col_attr.multiselect(
+                    "Atributos (además de la media)",
+                    [a for a in ATRIBUTOS_VALORABLES if notas[a].notna().any()],
+                    key="evol_atributos"
+                )
+                ventana = col_ventana.number_input(
+                    "Ventana (informes)", min_value=1, max_value=len(historial),
+                    value=min(3, len(historial)), key="evol_ventana"
+                )
+
+                # Media móvil de los últimos informes (las notas vacías no cuentan)
+                columnas_evol = ["Media"] + atributos_evol
+                movil = notas[columnas_evol].rolling(int(ventana), min_periods=1).mean()
+                movil["Fecha"] = historial["Fecha"]
+                movil = movil.dropna(subset=["Fecha"])
+                if movil.empty:
+                    st.info("Los informes de este jugador no tienen fechas válidas.")
+                else:
+                    fig_evol = px.line(
+                        movil.melt(id_vars="Fecha", var_name="Atributo", value_name="Valor").dropna(),
+                        x="Fecha", y="Valor", color="Atributo", markers=True, range_y=[0, 5]
+                    )
+                    fig_evol.update_layout(legend=dict(title_text=""), xaxis_title=None, yaxis_title=None)
+                    st.plotly_chart(fig_evol, use_container_width=True)
+
+                # Medias por temporada (si falta, la de la fecha: julio a junio)
+                temporada = historial["Temporada"] if "Temporada" in historial.columns else pd.Series(None, index=historial.index)
+                anio = historial["Fecha"].dt.year - (historial["Fecha"].dt.month < 7)
+                temporada_fecha = anio.astype("Int64").astype(str) + "-" + (anio + 1).astype("Int64").astype(str)
+                temporada = temporada.where(temporada.notna() & (temporada != ""), temporada_fecha.where(anio.notna()))
+                por_temporada = notas[columnas_evol].groupby(temporada.rename("Temporada")).mean()
+                por_temporada.insert(0, "Informes", notas.groupby(temporada.rename("Temporada")).size())
+                st.dataframe(por_temporada.round(2), use_container_width=True)
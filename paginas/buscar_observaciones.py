@@ -0,0 +1,19 @@
+# === BUSCAR EN OBSERVACIONES: texto libre de los informes ===
+import streamlit as st
+
+from core import search_informes
+
+st.subheader("🔍 Buscar en observaciones")
+
+consulta = st.text_input(
+    "Palabras a buscar (observaciones, club o competición):",
+    placeholder="zurdo desborde velocidad",
+)
+
+if consulta.strip():
+    resultados = search_informes(consulta)
+    if resultados.empty:
+        st.info("Ningún informe contiene esas palabras.")
+    else:
+        st.caption(f"{len(resultados)} informes, los más relevantes primero")
+        st.dataframe(resultados, use_container_width=True, hide_index=True)
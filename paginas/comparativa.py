@@ -0,0 +1,141 @@
+# === COMPARATIVA: medias y radar de varios jugadores ===
+import pandas as pd
+import plotly.express as px
+import streamlit as st
+
+from core import distinct_values, load_table, player_aggregates, position_aggregates, query_table
+
+st.subheader("🆚 Comparativa de Jugadores")
+
+jugadores_df, _ = load_table("Jugadores")
+jugadores_informados = distinct_values("Informes", "Jugador")
+
+if jugadores_df.empty or not jugadores_informados:
+    st.info("No hay jugadores o informes para comparar todavía.")
+else:
+    # Filtro opcional de posición
+    posiciones = distinct_values("Informes", "Posición")
+    pos_sel = st.selectbox("Filtrar por posición (opcional)", ["Todas"] + posiciones)
+
+    # Jugadores con informes en la posición elegida
+    if pos_sel != "Todas":
+        opciones_jugadores = distinct_values("Informes", "Jugador", {"Posición": pos_sel})
+    else:
+        opciones_jugadores = jugadores_informados
+    # Selección múltiple de jugadores
+    seleccionados = st.multiselect(
+        "Selecciona jugadores a comparar",
+        opciones_jugadores
+    )
+
+    if len(seleccionados) >= 2:
+        # Solo los informes de los jugadores seleccionados (consulta filtrada)
+        jugadores_sel = query_table("Informes", {"Jugador": seleccionados})
+
+        # Mostrar datos básicos
+        st.markdown("#### 📋 Datos del jugador")
+        st.dataframe(
+            jugadores_sel[["Jugador", "Club", "Fecha de nacimiento", "Posición", "Lateralidad"]],
+            use_container_width=True
+        )
+
+        # Promedios de atributos (ignorando NaN y 0) de los agregados materializados
+        df_promedios = player_aggregates().means(seleccionados)
+        df_promedios.index.name = "Nombre"
+
+        if not df_promedios.empty:
+
+            # === Tarjetas de medias de jugadores seleccionados ===
+            st.markdown("#### 🌟 Valoración media")
+
+            # Crear fila de columnas, una por jugador
+            cols = st.columns(len(df_promedios))
+
+            for col, (jugador, fila) in zip(cols, df_promedios.iterrows()):
+                media_jugador = fila.dropna().mean()  # promedio real ignorando NaN/ceros
+                estrellas_llenas = int(round(media_jugador))
+                estrellas = "⭐" * estrellas_llenas + "☆" * (5 - estrellas_llenas)
+
+                with col:
+                    st.markdown(
+                        f"""
+                        <div style="width:150px; height:150px; 
+                                    padding:10px; border-radius:12px; 
+                                    display:flex; flex-direction:column; justify-content:center; align-items:center;
+                                    background-color:#2c2c2c;
+                                    border:2px solid #e74c3c;
+                                    box-shadow:0px 2px 6px rgba(0,0,0,0.1); 
+                                    margin:auto;">
+                            <h4 style="margin:0; font-size:18px; color:#ecf0f1; text-align:center;">{jugador}</h4>
+                            <p style="margin:5px 0; font-size:16px; color:#f1c40f; text-align:center;">{estrellas}</p>
+                            <p style="margin:0; font-size:14px; color:#bdc3c7; text-align:center;">{media_jugador:.2f} / 5</p>
+                        </div>
+                        """,
+                        unsafe_allow_html=True
+                    )
+
+            # Radar dinámico:
+            # 1. Eliminar solo columnas donde todos los jugadores tienen NaN
+            df_radar = df_promedios.dropna(axis=1, how="all").reset_index().melt(
+                id_vars="Nombre",
+                var_name="Atributo",
+                value_name="Valor"
+            )
+            # 2. Quitar NaN, pero mantener atributos que tengan valor aunque sea en un solo jugador
+            df_radar = df_radar.dropna()
+
+            # 3. Referencia de la posición filtrada (perfil precalculado)
+            if pos_sel != "Todas":
+                medias_pos = position_aggregates().mean_of(pos_sel)
+                atributos_pos = [a for a in df_radar["Atributo"].unique() if a in medias_pos]
+                df_radar = pd.concat([df_radar, pd.DataFrame({
+                    "Nombre": [f"Media {pos_sel}"] * len(atributos_pos),
+                    "Atributo": atributos_pos,
+                    "Valor": [medias_pos[a] for a in atributos_pos]
+                })], ignore_index=True)
+
+            st.markdown("#### 🕸️ Radar comparativo")
+            fig = px.line_polar(
+                df_radar,
+                r="Valor",
+                theta="Atributo",
+                color="Nombre",
+                line_close=True,
+                range_r=[0, 5]
+            )
+
+            # Líneas más gruesas y rellenar con transparencia
+            fig.update_traces(line=dict(width=3), fill='toself')
+
+            # Configuración de ejes y fondo oscuro
+            fig.update_layout(
+                polar=dict(
+                    bgcolor="#2c2c2c",  # Fondo del radar oscuro
+                    radialaxis=dict(
+                        tick0=0,
+                        dtick=1,
+                        tickfont=dict(color="#ecf0f1"),  # Números en blanco grisáceo
+                        showline=True,
+                        linewidth=1,
+                        linecolor="#bdc3c7",             # Ejes en gris claro
+                        gridcolor="#444"                 # Grilla tenue
+                    ),
+                    angularaxis=dict(
+                        tickfont=dict(color="#ecf0f1"),  # Atributos en blanco grisáceo
+                        linecolor="#bdc3c7",
+                        gridcolor="#444"
+                    )
+                ),
+                legend=dict(title_text="", font=dict(color="#ecf0f1")),  # Leyenda en blanco
+                paper_bgcolor="#1e1e1e",   # Fondo de todo el gráfico oscuro
+                plot_bgcolor="#1e1e1e",
+                width=600,
+                height=600
+            )
+
+            st.plotly_chart(fig, use_container_width=True)
+
+        else:
+            st.warning("Los jugadores seleccionados no tienen informes registrados.")
+    else:
+        st.info("Selecciona al menos 2 jugadores para la comparativa.")
@@ -0,0 +1,156 @@
+# === DASHBOARD: resumen de los informes ===
+import plotly.express as px
+import streamlit as st
+
+from core import ATRIBUTOS_VALORABLES, load_table, player_aggregates, table_version
+
+# === Función para estadísticas generales ===
+def get_statistics(df):
+    """Obtener estadísticas generales del sistema (total de informes, scouts y jugadores)"""
+    return {
+        'total_reportes': len(df),
+        'scouts_activos': df['Scout'].nunique() if 'Scout' in df else 0,
+        'jugadores_evaluados': df['Jugador'].nunique() if 'Jugador' in df else 0,
+    }
+
+
+@st.cache_resource(max_entries=2, show_spinner=False)
+def resumen_dashboard(version):
+    """
+    Métricas, jugadores destacados y figuras del Dashboard para una versión de
+    Informes. Se calcula una sola vez por versión y lo comparten todas las
+    sesiones y reruns (no modificar lo devuelto). None si no hay informes.
+    """
+    # Solo las columnas que usa el resumen (lectura columnar)
+    informes, _ = load_table("Informes", ["Scout", "Posición", "Acción", "Jugador"] + ATRIBUTOS_VALORABLES)
+    if informes.empty:
+        return None
+    resumen = {"stats": get_statistics(informes)}
+
+    # === Gráfico 1: Informes por scout (tarta) ===
+    informes_por_scout = informes["Scout"].value_counts().reset_index()
+    informes_por_scout.columns = ["Scout", "Total"]
+    fig1 = px.pie(informes_por_scout, names="Scout", values="Total", hole=0.3, color_discrete_sequence=["#2600ff", "#00b7ff", "#ff9633", "#ff0000"])
+    #fig1.update_layout(legend=dict(x=-0.8))  # mueve horizontal (izquierda)
+    fig1.update_layout(showlegend=False)  # ← oculta la leyenda
+    resumen["fig_scouts"] = fig1
+
+    # === Gráfico 2: Informes por posición (barras) ===
+    resumen["fig_posiciones"] = None
+    if "Posición" in informes.columns:
+        informes_por_pos = informes["Posición"].value_counts().reset_index()
+        informes_por_pos.columns = ["Posición", "Total"]
+        informes_por_pos = informes_por_pos.sort_values("Total", ascending=False)
+        fig2 = px.bar(
+            informes_por_pos,
+            x="Total",
+            y="Posición",
+            orientation="h",
+            text="Total",
+            color_discrete_sequence=["#ff0000"]
+        )
+        # Quitar títulos, números y líneas de cuadrícula
+        fig2.update_yaxes(title=None, showgrid=False, autorange="reversed")
+        fig2.update_xaxes(showticklabels=False, title=None, showgrid=False)
+        resumen["fig_posiciones"] = fig2
+
+    # === Jugadores destacados: top 5 por encima de la media global ===
+    resumen["destacados"] = None
+    if any(c in ATRIBUTOS_VALORABLES for c in informes.columns):
+        # Medias por jugador de los agregados materializados (ceros ignorados)
+        agregados = player_aggregates()
+        media_global = agregados.global_means().mean()
+        medias_jugador = agregados.means().mean(axis=1)
+        destacados = medias_jugador[medias_jugador > media_global].sort_values(ascending=False)
+        resumen["destacados"] = destacados.head(5)
+
+    # === Gráfico 3: Acciones (columnas) ===
+    resumen["fig_acciones"] = None
+    if "Acción" in informes.columns:
+        informes_por_accion = informes["Acción"].value_counts().reset_index()
+        informes_por_accion.columns = ["Acción", "Total"]
+
+        colores_accion = {
+            "Fichar": "#2ecc71",
+            "Seguir ojeando": "#e67e22",
+            "Descartar": "#e74c3c"
+        }
+
+        fig3 = px.bar(
+            informes_por_accion,
+            x="Acción",
+            y="Total",
+            text="Total",
+            color="Acción",
+            color_discrete_map=colores_accion,
+            category_orders={"Acción": ["Fichar", "Seguir ojeando", "Descartar"]}
+        )
+        # Quitar títulos, números y líneas de cuadrícula
+        fig3.update_xaxes(title=None, showgrid=False)
+        fig3.update_yaxes(showticklabels=False, title=None, showgrid=False)
+        fig3.update_layout(showlegend=False)
+        fig3.update_traces(textfont_color="black")
+        resumen["fig_acciones"] = fig3
+    return resumen
+
+
+resumen = resumen_dashboard(table_version("Informes"))
+
+if resumen is None:
+    st.info("No hay informes disponibles todavía.")
+else:
+    # Mostrar estadísticas generales
+    stats = resumen["stats"]
+    col1, col2, col3 = st.columns(3)
+    col1.metric("📑 Total de reportes", stats['total_reportes'])
+    col2.metric("🕵️ Scouts activos", stats['scouts_activos'])
+    col3.metric("👟 Jugadores evaluados", stats['jugadores_evaluados'])
+
+    col1, col2 = st.columns(2)
+    with col1:
+        st.markdown("🕵️ Scouts")
+        st.plotly_chart(resumen["fig_scouts"], use_container_width=True)
+
+    with col2:
+        st.markdown("⚽ Posiciones")
+        if resumen["fig_posiciones"] is not None:
+            st.plotly_chart(resumen["fig_posiciones"], use_container_width=True)
+
+    # === Panel de jugadores destacados ===
+    col3, col4 = st.columns(2)
+    with col3:
+        st.markdown("🌟 Jugadores destacados")
+
+        top5 = resumen["destacados"]
+        if top5 is not None:
+            if top5.empty:
+                st.info("No hay jugadores por encima de la media global.")
+            else:
+                # Crear grid de 2 columnas
+                cols = st.columns(2)
+                for i, (jugador, media) in enumerate(top5.items()):
+                    estrellas_llenas = int(round(media))
+                    estrellas = "⭐" * estrellas_llenas + "☆" * (5 - estrellas_llenas)
+
+                    # Elegir columna alternando
+                    with cols[i % 2]:
+                        st.markdown(
+                            f"""
+                            <div style="width:150px; height:150px;
+                                        padding:15px; border-radius:12px;
+                                        margin-bottom:15px;
+                                        background-color:#2c2c2c;
+                                        border:2px solid #e74c3c;
+                                        box-shadow:0px 4px 8px rgba(0,0,0,0.1);">
+                                <h4 style="margin:0; font-size:18px; color:#ecf0f1;">{jugador}</h4>
+                                <p style="margin:5px 0; font-size:16px; color:#f1c40f;">{estrellas}</p>
+                                <p style="margin:0; font-size:14px; color:#bdc3c7;">{media:.2f} / 5</p>
+                            </div>
+                            """,
+                            unsafe_allow_html=True
+                        )
+
+    with col4:
+        st.markdown("🎯 Acción")
+        if resumen["fig_acciones"] is not None:
+            st.plotly_chart(resumen["fig_acciones"], use_container_width=True)
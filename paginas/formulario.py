@@ -0,0 +1,241 @@
+# === FORMULARIO: alta de informes (admins y scouts) ===
+from datetime import date
+
+import streamlit as st
+
+from core import (ATRIBUTOS_PORCENTAJE, ATRIBUTOS_VALORABLES, COLUMNAS_INFORME, add_new_record, find_player,
+                  load_table, suggest_players)
+
+# Datos del jugador que el informe copia de su ficha en Jugadores
+DATOS_JUGADOR = ["Sub 23", "Fecha de nacimiento", "Club"]
+
+
+def datos_registrados(nombre):
+    """Sub 23, fecha de nacimiento y club del jugador registrado con ese nombre."""
+    jugadores_df, _ = load_table("Jugadores")
+    if jugadores_df.empty:
+        return {}
+    fila = jugadores_df.loc[jugadores_df["Nombre jugador"] == nombre]
+    if fila.empty:
+        return {}
+    return {col: fila[col].values[0] for col in DATOS_JUGADOR if col in fila.columns}
+
+
+def olvidar_parecido():
+    """Al cambiar el nombre, la elección entre los jugadores parecidos del nombre anterior ya no vale."""
+    st.session_state.pop("niu_parecido", None)
+
+
+if "show_create_report_form" not in st.session_state:
+    st.session_state.show_create_report_form = False
+
+st.subheader("📝 Crear informes")
+col_nuevo, col_nuevo_unreg = st.columns(2)
+
+if col_nuevo.button("📝 Nuevo informe de jugador registrado"):
+    st.session_state.show_create_report_form = True
+    st.session_state.show_create_unreg_report_form = False
+
+if col_nuevo_unreg.button("📝 Nuevo informe de jugador no registrado"):
+    st.session_state.show_create_unreg_report_form = True
+    st.session_state.show_create_report_form = False
+# ---------------------------
+# Formulario normal (jugador registrado)
+# ---------------------------
+if st.session_state.get("show_create_report_form", False):
+    with st.form("form_crear_informe"):
+        st.write("### 📋 Nuevo informe de jugador (registrado)")
+
+        columnas = COLUMNAS_INFORME
+        scouts_df, _ = load_table("Scouts")
+        jugadores_df, _ = load_table("Jugadores")
+        posiciones_df, _ = load_table("Posiciones")
+
+        nuevo_informe = {}
+
+        # Fecha del informe
+        fecha_informe = st.date_input("Fecha del informe", value=date.today(), key="ni_fecha")
+        # Guardamos en formato DD-MM-AAAA
+        nuevo_informe["Fecha informe"] = fecha_informe.strftime("%d-%m-%Y")
+
+
+        # Campos descriptivos (en una sola columna)
+        campos_descriptivos = [col for col in columnas
+            if col not in ["Sub 23", "Fecha de nacimiento", "Club", "Acción", "Observaciones", "Fecha informe"]
+            + ATRIBUTOS_VALORABLES + ATRIBUTOS_PORCENTAJE]
+        for idx, col_name in enumerate(campos_descriptivos):
+            low = col_name.lower()
+            if low == "scout":
+                if st.session_state.role == "admin":
+                    # ✅ Admin puede elegir el scout al que asignar el informe
+                    nuevo_informe[col_name] = st.selectbox(
+                        f"{col_name}:",
+                        scouts_df["Nombre scout"].dropna().unique(),
+                        key=f"ni_scout_{idx}"
+                    )
+                else:
+                    # ✅ Si es scout, se asigna automáticamente al que ha iniciado sesión
+                    nuevo_informe[col_name] = st.session_state.scout_name
+            elif low == "jugador" and not jugadores_df.empty:
+                jugador_sel = st.selectbox(f"{col_name}:", jugadores_df["Nombre jugador"].dropna().unique(), key=f"ni_jugador_{idx}")
+                nuevo_informe[col_name] = jugador_sel
+                # auto-completar
+                nuevo_informe.update(datos_registrados(jugador_sel))
+            elif low == "posición" and not posiciones_df.empty:
+                nuevo_informe[col_name] = st.selectbox(f"{col_name}:", posiciones_df.iloc[:, 0].dropna().unique(), key=f"ni_pos_{idx}")
+            elif low == "lateralidad":
+                nuevo_informe[col_name] = st.selectbox(f"{col_name}:", ["Diestro", "Zurdo", "Ambas"], key=f"ni_lat_{idx}")
+            else:
+                nuevo_informe[col_name] = st.text_input(f"{col_name}:", key=f"ni_txt_{idx}")
+
+        # Atributos (sliders) en 3 columnas
+        atributos = [a for a in columnas if a in ATRIBUTOS_VALORABLES]
+        if atributos:
+            st.markdown("#### ⚡ Atributos valorables")
+            num_cols = 3
+            cols_sl = st.columns(num_cols)
+            for idx, attr in enumerate(atributos):
+                c = cols_sl[idx % num_cols]
+                nuevo_informe[attr] = c.slider(attr, 0, 5, 0, 1, key=f"ni_attr_{idx}")
+
+        # Porcentajes (2 columnas)
+        porcentajes = [a for a in columnas if a in ATRIBUTOS_PORCENTAJE]
+        if porcentajes:
+            st.markdown("#### 📊 Estadísticas")
+            c1, c2 = st.columns(2)
+            for idx, stat in enumerate(porcentajes):
+                target = c1 if idx % 2 == 0 else c2
+                nuevo_informe[stat] = target.number_input(stat, min_value=0, max_value=100, step=1, key=f"ni_pct_{idx}")
+
+        # Acción y Observaciones
+        if "Acción" in columnas:
+            nuevo_informe["Acción"] = st.selectbox("Acción:", ["Fichar", "Descartar", "Seguir ojeando"], key="ni_accion")
+        if "Observaciones" in columnas:
+            nuevo_informe["Observaciones"] = st.text_area("Observaciones:", height=120, key="ni_obs")
+
+        col_save, col_cancel = st.columns(2)
+        guardar = col_save.form_submit_button("✅ Guardar informe")
+        cancelar = col_cancel.form_submit_button("❌ Cancelar")
+
+        if guardar and nuevo_informe:
+            add_new_record("Informes", nuevo_informe)
+            st.success("Nuevo informe añadido correctamente ✅")
+            st.session_state.show_create_report_form = False
+            st.rerun()
+
+        if cancelar:
+            st.session_state.show_create_report_form = False
+            st.rerun()
+
+
+# ---------------------------
+# Formulario alternativo (jugador no registrado)
+# ---------------------------
+if st.session_state.get("show_create_unreg_report_form", False):
+    st.write("### 📋 Nuevo informe de jugador **no registrado**")
+
+    # Nombre fuera del formulario para sugerir jugadores ya registrados con un nombre parecido
+    nombre_jugador = st.text_input("Nombre jugador", key="niu_jugador", on_change=olvidar_parecido)
+    parecidos = suggest_players(nombre_jugador) if nombre_jugador.strip() else []
+    if parecidos:
+        nuevo = "(es un jugador nuevo)"
+        eleccion = st.radio(
+            "⚠️ Hay jugadores registrados con un nombre parecido. ¿Es alguno de ellos?",
+            [nuevo] + [nombre for nombre, _ in parecidos],
+            key="niu_parecido"
+        )
+        if eleccion != nuevo:
+            nombre_jugador = eleccion
+    # Si el jugador ya existe (sin contar mayúsculas, tildes ni espacios) se usa su nombre y sus datos registrados
+    registrado = find_player(nombre_jugador) if nombre_jugador.strip() else None
+    if registrado is not None:
+        st.info(f"El informe se asociará a **{registrado}**, ya registrado: su fecha de nacimiento, "
+                "club y Sub 23 se toman de Jugadores.")
+
+    with st.form("form_crear_informe_unreg"):
+        nuevo_informe = {}
+
+        # Fecha del informe
+        fecha_informe = st.date_input("Fecha del informe", value=date.today(), key="niu_fecha")
+        nuevo_informe["Fecha informe"] = fecha_informe.strftime("%d-%m-%Y")
+
+        # Scout
+        scouts_df, _ = load_table("Scouts")
+        if st.session_state.role == "admin":
+            # ✅ Admin puede elegir el scout al que asignar el informe
+            if not scouts_df.empty:
+                nuevo_informe["Scout"] = st.selectbox(
+                    "Scout:",
+                    scouts_df["Nombre scout"].dropna().unique(),
+                    key="niu_scout"
+                )
+        else:
+            # ✅ Si es scout, se asigna automáticamente al que ha iniciado sesión
+            nuevo_informe["Scout"] = st.session_state.scout_name
+
+        # Datos manuales del jugador
+        nuevo_informe["Temporada"] = st.text_input("Temporada", key="niu_temporada")
+        nuevo_informe["Competición"] = st.text_input("Competición", key="niu_competicion")
+        nuevo_informe["Equipo local"] = st.text_input("Equipo local", key="niu_local")
+        nuevo_informe["Equipo visitante"] = st.text_input("Equipo visitante", key="niu_visitante")
+        if registrado is not None:
+            nuevo_informe["Jugador"] = registrado
+            nuevo_informe.update(datos_registrados(registrado))
+        else:
+            nuevo_informe["Jugador"] = nombre_jugador
+            fecha_nac = st.date_input("Fecha de nacimiento", min_value=date(1900,1,1), max_value=date.today(), value=date.today(), key="niu_fnac")
+            nuevo_informe["Fecha de nacimiento"] = fecha_nac.strftime("%d-%m-%Y")
+            nuevo_informe["Club"] = st.text_input("Club", key="niu_club")
+            nuevo_informe["Sub 23"] = st.selectbox("Sub 23", ["Sí", "No"], key="niu_sub23")
+
+        # Posición
+        posiciones_df, _ = load_table("Posiciones")
+        if not posiciones_df.empty:
+            nuevo_informe["Posición"] = st.selectbox("Posición:", posiciones_df.iloc[:, 0].dropna().unique(), key="niu_pos")
+
+        # Lateralidad
+        nuevo_informe["Lateralidad"] = st.selectbox("Lateralidad:", ["Diestro", "Zurdo", "Ambas"], key="niu_lat")
+
+        # Atributos (sliders)
+        st.markdown("#### ⚡ Atributos valorables")
+        num_cols = 3
+        cols_sl = st.columns(num_cols)
+        for idx, attr in enumerate(ATRIBUTOS_VALORABLES):
+            nuevo_informe[attr] = cols_sl[idx % num_cols].slider(attr, 0, 5, 0, 1, key=f"nr_attr_{idx}")
+
+        # Porcentajes
+        if ATRIBUTOS_PORCENTAJE:
+            st.markdown("#### 📊 Estadísticas")
+            c1, c2 = st.columns(2)
+            for idx, stat in enumerate(ATRIBUTOS_PORCENTAJE):
+                target = c1 if idx % 2 == 0 else c2
+                nuevo_informe[stat] = target.number_input(stat, min_value=0, max_value=100, step=1, key=f"niu_pct_{idx}")
+
+        # Acción y Observaciones
+        nuevo_informe["Acción"] = st.selectbox("Acción:", ["Fichar", "Descartar", "Seguir ojeando"], key="niu_accion")
+        nuevo_informe["Observaciones"] = st.text_area("Observaciones:", height=120, key="niu_obs")
+
+        col_save, col_cancel = st.columns(2)
+        guardar = col_save.form_submit_button("✅ Guardar informe")
+        cancelar = col_cancel.form_submit_button("❌ Cancelar")
+
+        if guardar and nuevo_informe.get("Jugador", "").strip():
+            # Guardar informe en Informes
+            add_new_record("Informes", nuevo_informe)
+
+            # Guardar también el jugador en la tabla Jugadores si no existe
+            if registrado is None:
+                nuevo_jugador = {
+                    "Nombre jugador": nuevo_informe["Jugador"],
+                    "Fecha de nacimiento": nuevo_informe.get("Fecha de nacimiento", ""),
+                    "Club": nuevo_informe.get("Club", ""),
+                    "Sub 23": nuevo_informe.get("Sub 23", "")
+                }
+                add_new_record("Jugadores", nuevo_jugador)
+
+            st.success("Nuevo informe (jugador no registrado) añadido correctamente ✅")
+            st.session_state.show_create_unreg_report_form = False
+            st.rerun()
+        if cancelar:
+            st.session_state.show_create_unreg_report_form = False
+            st.rerun()
@@ -0,0 +1,156 @@
+# === INFORMES: lista filtrable, edición y exportación a PDF ===
+from datetime import date, timedelta
+
+import streamlit as st
+
+from core import editor_paginado, get_pdf_cache, load_indexed_table, pdf_context, save_changes
+
+# Columnas del panel de filtros, indexadas una vez por versión de la tabla
+COLUMNAS_FILTRO = ["Scout", "Jugador", "Sub 23", "Posición", "Acción"]
+# Fechas filtradas por rango (índice ordenado de los días que guarda el almacenamiento)
+COLUMNAS_FECHA = ["Fecha informe", "Fecha de nacimiento"]
+EPOCA = date(1970, 1, 1)
+
+df, indice = load_indexed_table("Informes", COLUMNAS_FILTRO, COLUMNAS_FECHA)
+
+
+def filtro_fechas(columna, etiqueta, key):
+    """date_input de rango entre la primera y la última fecha de la columna; devuelve (desde, hasta) en días."""
+    minimo, maximo = indice.ranges[columna].bounds() if columna in indice.ranges else (None, None)
+    if minimo is None:
+        return None, None
+    rango = st.date_input(
+        etiqueta,
+        value=(),
+        min_value=EPOCA + timedelta(days=minimo),
+        max_value=EPOCA + timedelta(days=maximo),
+        format="DD/MM/YYYY",
+        key=key
+    )
+    dias = [(d - EPOCA).days for d in rango]
+    # Mientras se elige el rango solo hay fecha inicial
+    return (dias[0] if dias else None), (dias[1] if len(dias) > 1 else None)
+
+if df.empty:
+    st.info("No hay informes disponibles.")
+    st.stop()
+
+st.markdown("---")
+st.markdown("### 📋 Lista de Informes")
+# ---------------------------
+# FILTROS
+# ---------------------------
+col1, col2, col3, col4, col5 = st.columns(5)
+with col1:
+    scout_filter = st.multiselect(
+        "Scout",
+        indice.options("Scout"),
+        key="filter_scout"
+    )
+with col2:
+    jugador_filter = st.multiselect(
+        "Jugador",
+        indice.options("Jugador"),
+        key="filter_jugador"
+    )
+with col3:
+    sub23_filter = st.multiselect(
+        "Sub 23",
+        indice.options("Sub 23"),
+        key="filter_sub23"
+    )
+with col4:
+    posicion_filter = st.multiselect(
+        "Posición",
+        indice.options("Posición"),
+        key="filter_posicion"
+    )
+with col5:
+    accion_filter = st.multiselect(
+        "Acción",
+        indice.options("Acción"),
+        key="filter_accion"
+    )
+col6, col7 = st.columns(2)
+with col6:
+    fecha_filter = filtro_fechas("Fecha informe", "Fecha del informe", "filter_fecha")
+with col7:
+    nacimiento_filter = filtro_fechas("Fecha de nacimiento", "Fecha de nacimiento", "filter_nacimiento")
+# ---------------------------
+# FILTRADO DE DATOS
+# ---------------------------
+# Intersección de las filas de cada filtro en el índice (sin recorrer la tabla)
+filas = indice.lookup({
+    "Scout": scout_filter,
+    "Jugador": jugador_filter,
+    "Sub 23": sub23_filter,
+    "Posición": posicion_filter,
+    "Acción": accion_filter,
+}, {
+    "Fecha informe": fecha_filter,
+    "Fecha de nacimiento": nacimiento_filter,
+})
+df_filtrado = df if filas is None else df.iloc[filas]
+# ---------------------------
+# DATA EDITOR POR PÁGINAS (solo se envía la página visible)
+# ---------------------------
+pagina_df, cambios = editor_paginado("Informes", df, filas)
+# ---------------------------
+# BOTÓN GUARDAR
+# ---------------------------
+if st.button("💾 Guardar cambios", key="save_Informes"):
+    if not any(cambios.values()):
+        st.warning("No hay cambios que guardar en esta página.")
+    else:
+        save_changes("Informes", cambios)
+        st.success("Informes actualizado correctamente ✅")
+        st.rerun()
+
+# ---------------------------
+# EXPORTAR A PDF
+# ---------------------------
+st.markdown("---")
+st.markdown("### 📤 Exportar informe a PDF")
+# Elegir informe por índice (evita ambigüedades si hay varios informes para el mismo jugador)
+# entre los de la página visible de la lista
+index_options = pagina_df.index.tolist()
+sel_index = st.selectbox(
+    "Selecciona el informe:",
+    index_options,
+    format_func=lambda i: f"{i} — {df.loc[i].get('Jugador','')} — {df.loc[i].get('Fecha informe','')}"
+)
+if st.button("📄 Generar PDF", disabled=sel_index is None):
+    import pdf_report
+    informe_dict = df.loc[sel_index].to_dict()
+    try:
+        pdf_bytes = get_pdf_cache().render(informe_dict, **pdf_context(informe_dict))
+        st.download_button(
+            label="⬇️ Descargar PDF",
+            data=pdf_bytes,
+            file_name=pdf_report.pdf_file_name(informe_dict),
+            mime="application/pdf"
+        )
+    except Exception as e:
+        st.error(f"Error generando PDF: {e}")
+
+# --- Exportación por lotes de la vista filtrada ---
+st.markdown("### 📦 Exportar informes filtrados (ZIP)")
+st.caption(f"{len(df_filtrado)} informes en la vista actual (usa los filtros de la lista).")
+if st.button("📦 Generar ZIP", disabled=df_filtrado.empty):
+    import pdf_report
+    barra = st.progress(0.0, text="Generando PDFs...")
+    jobs = [(informe, pdf_context(informe)) for informe in df_filtrado.to_dict("records")]
+    zip_bytes, errores = pdf_report.generar_zip_pdfs(
+        jobs,
+        cache=get_pdf_cache(),
+        progress=lambda hechos, total: barra.progress(hechos / total, text=f"Generando PDFs... {hechos}/{total}")
+    )
+    barra.empty()
+    for error in errores:
+        st.warning(f"No se pudo generar {error}")
+    st.download_button(
+        label=f"⬇️ Descargar ZIP ({len(jobs) - len(errores)} PDFs)",
+        data=zip_bytes,
+        file_name=f"Informes_{date.today().strftime('%d-%m-%Y')}.zip",
+        mime="application/zip"
+    )
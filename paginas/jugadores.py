@@ -0,0 +1,52 @@
+# === JUGADORES: alta de jugadores y edición de la tabla ===
+from datetime import date
+
+import streamlit as st
+
+from core import add_new_record, editar_tabla
+
+if "show_create_player_form" not in st.session_state:
+    st.session_state.show_create_player_form = False
+
+# botón para abrir el formulario
+if st.button("➕ Crear jugador"):
+    st.session_state.show_create_player_form = True
+
+# mostrar el formulario si el flag está activo
+if st.session_state.show_create_player_form:
+    with st.form("form_crear_jugador"):
+        st.write("### ✏️ Nuevo jugador")
+
+        nuevo_jugador = {}
+        nuevo_jugador["Nombre jugador"] = st.text_input("Nombre jugador", key="nj_nombre")
+        # Guardamos fecha en formato YYYY-MM-DD
+        fecha_nac = st.date_input(
+            "Fecha de nacimiento",
+            min_value=date(1900, 1, 1),
+            value=date.today(),
+            max_value=date.today(),
+            key="nj_fecha"
+        )
+        nuevo_jugador["Fecha de nacimiento"] = fecha_nac.strftime("%d-%m-%Y")
+        nuevo_jugador["Club"] = st.text_input("Club", key="nj_club")
+        nuevo_jugador["Sub 23"] = st.selectbox("Sub 23", ["Sí", "No"], key="nj_sub23")
+
+        col_guardar, col_cancelar = st.columns(2)
+        guardar = col_guardar.form_submit_button("✅ Guardar jugador")
+        cancelar = col_cancelar.form_submit_button("❌ Cancelar")
+
+        if guardar:
+            if not str(nuevo_jugador["Nombre jugador"]).strip():
+                st.error("El nombre del jugador es obligatorio.")
+            else:
+                add_new_record("Jugadores", nuevo_jugador)
+                st.success(f"Jugador '{nuevo_jugador['Nombre jugador']}' añadido correctamente ✅")
+                st.session_state.show_create_player_form = False
+                # forzar recarga para que la tabla se actualice
+                st.rerun()
+
+        if cancelar:
+            st.session_state.show_create_player_form = False
+            st.rerun()
+
+editar_tabla("Jugadores")
@@ -0,0 +1,4 @@
+# === POSICIONES: edición de la tabla ===
+from core import editar_tabla
+
+editar_tabla("Posiciones")
@@ -0,0 +1,57 @@
+# === SCOUTS: alta de scouts y edición de la tabla ===
+from datetime import date
+
+import streamlit as st
+
+from core import add_new_record, editar_tabla, load_table
+
+# Inicializar flag en session_state
+if "show_create_scout_form" not in st.session_state:
+    st.session_state.show_create_scout_form = False
+
+# Botón para abrir formulario
+if st.button("➕ Nuevo Scout"):
+    st.session_state.show_create_scout_form = True
+
+# Mostrar formulario si el flag está activo
+if st.session_state.show_create_scout_form:
+    with st.form("form_crear_scout"):
+        st.write("### ✏️ Nuevo Scout")
+
+        nuevo_scout = {}
+        scouts_df, _ = load_table("Scouts")
+
+        # Si la tabla está vacía, ponemos un campo por defecto
+        columnas = scouts_df.columns.tolist() if not scouts_df.empty else ["Nombre scout"]
+
+        # Generamos dinámicamente inputs según las columnas
+        for col_name in columnas:
+            # Si la columna parece de fecha, usar date_input
+            if "fecha" in col_name.lower():
+                valor = st.date_input(col_name, value=date.today(), key=f"ns_{col_name}")
+                nuevo_scout[col_name] = valor.strftime("%d-%m-%Y")
+            else:
+                # texto por defecto
+                valor = st.text_input(col_name, key=f"ns_{col_name}")
+                nuevo_scout[col_name] = valor
+
+        # Botones Guardar / Cancelar
+        col_guardar, col_cancelar = st.columns(2)
+        guardar = col_guardar.form_submit_button("✅ Guardar scout")
+        cancelar = col_cancelar.form_submit_button("❌ Cancelar")
+
+        if guardar:
+            # Validación mínima: nombre obligatorio
+            if not str(nuevo_scout.get("Nombre scout", "")).strip():
+                st.error("El nombre del scout es obligatorio.")
+            else:
+                add_new_record("Scouts", nuevo_scout)
+                st.success(f"Scout '{nuevo_scout['Nombre scout']}' añadido correctamente ✅")
+                st.session_state.show_create_scout_form = False
+                st.rerun()
+
+        if cancelar:
+            st.session_state.show_create_scout_form = False
+            st.rerun()
+
+editar_tabla("Scouts")
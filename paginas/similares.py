@@ -0,0 +1,54 @@
+# === JUGADORES SIMILARES: vecinos más cercanos por medias de atributos ===
+import streamlit as st
+
+from core import ATRIBUTOS_VALORABLES, distinct_values, player_aggregates, similar_players
+
+st.subheader("🧬 Jugadores similares")
+
+jugadores_informados = distinct_values("Informes", "Jugador")
+
+if not jugadores_informados:
+    st.info("No hay informes todavía.")
+else:
+    modo = st.radio("Buscar a partir de", ["Un jugador", "Un perfil de atributos"], horizontal=True)
+
+    if modo == "Un jugador":
+        objetivo = st.selectbox("Jugador de referencia", [""] + jugadores_informados)
+    else:
+        # Perfil buscado: solo cuentan los atributos marcados
+        atributos_perfil = st.multiselect("Atributos del perfil", ATRIBUTOS_VALORABLES)
+        cols = st.columns(3)
+        objetivo = {
+            atributo: cols[i % 3].slider(atributo, 1, 5, 3, key=f"perfil_{atributo}")
+            for i, atributo in enumerate(atributos_perfil)
+        }
+
+    col1, col2, col3, col4 = st.columns(4)
+    metrica = col1.selectbox("Similitud", ["cosine", "euclidean"],
+                             format_func={"cosine": "Coseno", "euclidean": "Euclídea"}.get)
+    posicion = col2.selectbox("Posición", ["Todas"] + distinct_values("Informes", "Posición"))
+    sub23 = col3.toggle("Solo Sub 23")
+    k = col4.number_input("Resultados", min_value=1, max_value=100, value=10)
+
+    atributos = st.multiselect("Atributos a comparar (vacío = todos)", ATRIBUTOS_VALORABLES)
+    pesos = {a: 1 for a in atributos} if atributos else None
+
+    if objetivo:
+        similares = similar_players(objetivo, int(k), metrica, None if posicion == "Todas" else posicion, sub23, pesos)
+        if similares.empty:
+            st.info("No hay jugadores con suficientes atributos en común.")
+        else:
+            similares["Similitud"] = similares["Similitud"].round(3)
+            st.dataframe(similares, use_container_width=True)
+
+            # Medias de los más parecidos junto a las del jugador de referencia
+            referencia = [objetivo] if isinstance(objetivo, str) else []
+            medias = player_aggregates().means(referencia + list(similares.index[:5]))
+            # Solo los atributos que han contado en la comparación
+            columnas = [a for a in ATRIBUTOS_VALORABLES if (not atributos or a in atributos)
+                        and (isinstance(objetivo, str) or a in objetivo)]
+            medias = medias[columnas]
+            st.markdown("#### 📊 Medias de los más parecidos")
+            st.dataframe(medias.dropna(axis=1, how="all").round(2), use_container_width=True)
+    else:
+        st.info("Elige un jugador o marca algún atributo del perfil.")
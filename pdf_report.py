@@ -0,0 +1,647 @@
+"""
+Generación de informes PDF (FPDF2) con radares de atributos dibujados como
+gráficos vectoriales del propio PDF.
+
+Todo lo que necesita el PDF llega por parámetros (el informe y las medias ya
+calculadas), de modo que las funciones se pueden ejecutar en procesos aparte
+para exportar muchos informes a la vez.
+"""
+import copy
+import hashlib
+import io
+import json
+import logging
+import math
+import os
+import subprocess
+import sys
+import threading
+import zipfile
+from collections import OrderedDict
+from datetime import datetime
+from functools import lru_cache
+
+import numpy as np
+import pandas as pd
+from fontTools import ttLib
+from fpdf import FPDF
+from fpdf.fonts import SubsetMap
+from fpdf.image_datastructures import ImageCache
+from fpdf.image_parsing import preload_image
+from PIL import Image
+
+import pdf_worker
+from attributes import AttributeMatrix
+from config import ATRIBUTOS_VALORABLES, ATRIBUTOS_PORCENTAJE
+
+
+logger = logging.getLogger(__name__)
+
+# Ficheros de la plantilla (relativos al directorio de trabajo)
+LOGO_PATH = "ud_lanzarote_logo3.png"
+WATERMARK_PATH = "ud_lanzarote_logo3bn.png"
+TTF_PATH = "DejaVuSans.ttf"
+# Tamaño impreso (mm) del escudo y de la marca de agua de la cabecera
+LOGO_MM = (25, 35)
+WATERMARK_MM = (160, 240)
+# Resolución a la que se guardan en el PDF (no tiene sentido incrustar más píxeles)
+IMAGEN_DPI = 300
+
+# Radares: colores de las dos series (azul y naranja), escala y medidas en mm
+RADAR_COLORES = ((31, 119, 180), (255, 127, 14))
+RADAR_ESCALA = 5
+RADAR_TITULO_H = 6
+RADAR_ETIQUETA_W = 16   # ancho reservado a cada lado para los nombres de los ejes
+RADAR_LINEA_H = 2.3     # alto de línea de las etiquetas (5.5 pt)
+RADAR_ETIQUETA_SEP = 1.5
+
+# Versión del diseño del informe: subirla al cambiar generar_pdf invalida los PDF cacheados
+PDF_LAYOUT_VERSION = 1
+# Tamaño máximo (bytes) de la caché de PDFs generados
+PDF_CACHE_BYTES = 64 * 1024 * 1024
+
+
+def pdf_file_name(informe):
+    """Nombre de fichero del PDF de un informe: Informe_<jugador>_<fecha>.pdf"""
+    jugador_safe = str(informe.get("Jugador", "desconocido")).replace(" ", "_")
+    fecha_safe = str(informe.get("Fecha informe", datetime.today().strftime("%d-%m-%Y")))
+    return f"Informe_{jugador_safe}_{fecha_safe}.pdf"
+
+
+#Gráfico Radar Informe vs media
+def _radar_axes(current_vals, mean_vals):
+    """
+    Ejes del radar: atributos con valor > 0 en al menos una de las dos series.
+    En el eje donde una serie no tenga valor > 0, esa serie vale 0.
+    Devuelve (atributos, valores actuales, valores medios).
+    """
+    all_keys = set(current_vals.keys()) | set(mean_vals.keys())
+
+    def _clean(v):
+        try:
+            x = float(v)
+            return 0.0 if math.isnan(x) else x
+        except Exception:
+            return 0.0
+
+    raw_curr = {k: _clean(current_vals.get(k, 0)) for k in all_keys}
+    raw_mean = {k: _clean(mean_vals.get(k, 0)) for k in all_keys}
+    attrs = [k for k in sorted(all_keys) if (raw_curr[k] > 0 or raw_mean[k] > 0)]
+    return attrs, [raw_curr[a] for a in attrs], [raw_mean[a] for a in attrs]
+
+
+def _label_lines(text, max_chars=14):
+    """Parte un nombre de atributo largo en dos líneas por el espacio más centrado."""
+    if len(text) <= max_chars or " " not in text:
+        return [text]
+    spaces = [i for i, c in enumerate(text) if c == " "]
+    cut = min(spaces, key=lambda i: abs(i - len(text) / 2))
+    return [text[:cut], text[cut + 1:]]
+
+
+def _radar_height(w_mm):
+    """Alto (mm) que ocupa un radar de ancho w_mm con su título y etiquetas."""
+    radius = w_mm / 2 - RADAR_ETIQUETA_W
+    return RADAR_TITULO_H + 2 * (radius + RADAR_ETIQUETA_SEP + 2 * RADAR_LINEA_H)
+
+
+def _draw_radar(pdf, x, y, w_mm, current_vals, mean_vals, title=""):
+    """
+    Dibuja un radar (serie actual vs media) con primitivas vectoriales de FPDF
+    en la caja que empieza en (x, y): rejilla, ejes, polígonos rellenos
+    semitransparentes y nombres de los atributos.
+    """
+    attrs, values_curr, values_mean = _radar_axes(current_vals, mean_vals)
+    height = _radar_height(w_mm)
+
+    with pdf.local_context():
+        if title:
+            pdf.set_font("DejaVu", "", 9)
+            pdf.set_text_color(0, 0, 0)
+            pdf.set_xy(x, y)
+            pdf.cell(w_mm, RADAR_TITULO_H, title, align="C")
+
+        # Placeholder si no hay suficientes ejes
+        if len(attrs) < 3:
+            pdf.set_font("DejaVu", "", 9)
+            pdf.set_xy(x, y + height / 2 - 5)
+            pdf.multi_cell(w_mm, 5, "Sin suficientes\natributos válidos", align="C")
+            return
+
+        radius = w_mm / 2 - RADAR_ETIQUETA_W
+        cx = x + w_mm / 2
+        cy = y + height / 2 + RADAR_TITULO_H / 2
+        # Ángulos en sentido horario empezando arriba
+        angles = [2 * math.pi * i / len(attrs) for i in range(len(attrs))]
+
+        def _point(angle, value):
+            r = radius * min(max(value, 0), RADAR_ESCALA) / RADAR_ESCALA
+            return cx + r * math.sin(angle), cy - r * math.cos(angle)
+
+        # Rejilla: círculos 1..5 con su valor y un radio por atributo
+        pdf.set_draw_color(190, 190, 190)
+        pdf.set_line_width(0.15)
+        pdf.set_font("DejaVu", "", 5)
+        pdf.set_text_color(120, 120, 120)
+        for level in range(1, RADAR_ESCALA + 1):
+            r = radius * level / RADAR_ESCALA
+            pdf.ellipse(cx - r, cy - r, 2 * r, 2 * r)
+            pdf.text(cx + 0.6, cy - r + 1.8, str(level))
+        for angle in angles:
+            pdf.line(cx, cy, *_point(angle, RADAR_ESCALA))
+
+        # Series: relleno semitransparente y contorno
+        pdf.set_line_width(0.6)
+        for values, color in zip((values_curr, values_mean), RADAR_COLORES):
+            points = [_point(angle, v) for angle, v in zip(angles, values)]
+            with pdf.local_context(fill_opacity=0.15):
+                pdf.set_fill_color(*color)
+                pdf.polygon(points, style="F")
+            pdf.set_draw_color(*color)
+            pdf.polygon(points, style="D")
+
+        # Nombres de los ejes, alineados hacia fuera del círculo
+        pdf.set_font("DejaVu", "", 5.5)
+        pdf.set_text_color(0, 0, 0)
+        for angle, attr in zip(angles, attrs):
+            ux, uy = math.sin(angle), -math.cos(angle)
+            lx = cx + (radius + RADAR_ETIQUETA_SEP) * ux
+            ly = cy + (radius + RADAR_ETIQUETA_SEP) * uy
+            lines = _label_lines(attr)
+            block_h = len(lines) * RADAR_LINEA_H
+            top = ly - block_h / 2 + uy * block_h / 2
+            for k, line in enumerate(lines):
+                line_w = pdf.get_string_width(line)
+                left = lx - line_w / 2 + ux * line_w / 2
+                pdf.text(left, top + (k + 1) * RADAR_LINEA_H - 0.5, line)
+
+
+def _insert_two_radars_row(pdf, left, right, w_mm=90, gap_mm=8, pad_bottom=8):
+    """
+    Dibuja dos radares alineados horizontalmente en la misma fila.
+    left / right son tuplas (valores actuales, valores medios, título).
+    Si la fila no cabe salta de página antes de dibujar, y si 2*w_mm + gap +
+    márgenes > ancho de página, reduce w_mm automáticamente.
+    """
+    page_w = getattr(pdf, "w", 210)   # A4 ancho mm
+    page_h = getattr(pdf, "h", 297)   # A4 alto  mm
+    lmar   = getattr(pdf, "l_margin", 10)
+    rmar   = getattr(pdf, "r_margin", 10)
+    bmar   = getattr(pdf, "b_margin", 10)
+
+    # Asegurar que caben los dos radares; si no, recalcular w_mm
+    total_needed = 2 * w_mm + gap_mm + lmar + rmar
+    if total_needed > page_w:
+        w_mm = (page_w - lmar - rmar - gap_mm) / 2.0
+    row_h = _radar_height(w_mm)
+
+    # ¿Cabe la fila completa? si no, salto de página
+    y0 = pdf.get_y()
+    if y0 + row_h > page_h - bmar:
+        pdf.add_page()
+        y0 = pdf.get_y()
+
+    # Ambos a la MISMA y
+    _draw_radar(pdf, lmar, y0, w_mm, *left)
+    _draw_radar(pdf, lmar + w_mm + gap_mm, y0, w_mm, *right)
+
+    # Avanzar cursor bajo la fila
+    pdf.set_xy(lmar, y0 + row_h + pad_bottom)
+
+
+# === PLANTILLA DEL INFORME ===
+class PlantillaInforme:
+    """
+    Parte fija de todos los informes, preparada una vez por proceso: la fuente
+    DejaVu ya parseada y el escudo y la marca de agua reducidos a su tamaño
+    impreso y comprimidos. nuevo_pdf() devuelve un documento con la primera
+    página, la marca de agua, el escudo y el título ya dibujados.
+    """
+
+    def __init__(self, logo_path, logo_path_wm, ttf_path):
+        self._font = None
+        if os.path.exists(ttf_path):
+            proto = FPDF()
+            proto.add_font("DejaVu", "", ttf_path)
+            self._font = proto.fonts["dejavu"]
+            with open(ttf_path, "rb") as f:
+                self._font_bytes = f.read()
+        self._images = ImageCache()
+        self._watermark = self._preparar_imagen(logo_path_wm, WATERMARK_MM)
+        self._logo = self._preparar_imagen(logo_path, LOGO_MM)
+
+    def _preparar_imagen(self, path, size_mm):
+        """Decodifica, reduce y comprime una imagen; devuelve su nombre en la caché (o None)."""
+        if not os.path.exists(path):
+            return None
+        try:
+            with Image.open(path) as im:
+                im = im.copy()
+            max_px = tuple(round(mm / 25.4 * IMAGEN_DPI) for mm in size_mm)
+            im.thumbnail(max_px, Image.LANCZOS)
+            name, _, _ = preload_image(self._images, im)
+            return name
+        except Exception:
+            return None
+
+    def _registrar_fuente(self, pdf):
+        """
+        Registra la fuente en el documento sin volver a parsear el TTF: se copian
+        las métricas ya calculadas y solo se abre (en diferido) una TTFont nueva,
+        porque FPDF la recorta al subconjunto de glifos usados al generar el PDF.
+        """
+        font = copy.copy(self._font)
+        font.i = len(pdf.fonts) + 1
+        font.ttfont = ttLib.TTFont(io.BytesIO(self._font_bytes), recalcTimestamp=False, lazy=True)
+        font.subset = SubsetMap(font)
+        font.missing_glyphs = []
+        font.biggest_size_pt = 0
+        font._hbfont = None
+        pdf.fonts[font.fontkey] = font
+
+    def nuevo_pdf(self):
+        pdf = FPDF(unit="mm", format="A4")
+        pdf.set_auto_page_break(auto=True, margin=15)
+        # Imágenes ya comprimidas: cada documento las incrusta una vez sin recodificarlas
+        for name, info in self._images.images.items():
+            info = copy.copy(info)
+            info["usages"] = 0
+            pdf.image_cache.images[name] = info
+        pdf.image_cache.icc_profiles.update(self._images.icc_profiles)
+        pdf.add_page()
+
+        page_w = pdf.w - 2 * pdf.l_margin
+        left_x = pdf.l_margin
+
+        # Registrar fuente Unicode
+        if self._font is not None:
+            self._registrar_fuente(pdf)
+            pdf.set_font("DejaVu", "", 14)
+        else:
+            pdf.set_font("Arial", "", 12)  # fallback
+
+        # --- Marca de agua ---
+        if self._watermark:
+            watermark_w, watermark_h = WATERMARK_MM
+            x = (pdf.w - watermark_w) / 2
+            y = (pdf.h - watermark_h) / 1.3
+            pdf.image(self._watermark, x, y, watermark_w, watermark_h)
+
+        # Logo (si existe)
+        if self._logo:
+            logo_w, logo_h = LOGO_MM
+            pdf.image(self._logo, left_x, 2.5, logo_w, logo_h)
+
+        # Título centralizado dentro del encabezado
+        pdf.set_xy(left_x, 5)
+        pdf.set_font("DejaVu", "", 20)
+        title = f"Sistema de Scouting UD Lanzarote"
+        pdf.cell(page_w, 10, title, ln=1, align="C")
+        return pdf
+
+
+def _mtime(path):
+    try:
+        return os.stat(path).st_mtime_ns
+    except OSError:
+        return None
+
+
+@lru_cache(maxsize=4)
+def _plantilla(logo_path, logo_path_wm, ttf_path, mtimes):
+    return PlantillaInforme(logo_path, logo_path_wm, ttf_path)
+
+
+def get_plantilla(logo_path=LOGO_PATH, logo_path_wm=WATERMARK_PATH, ttf_path=TTF_PATH):
+    """Plantilla compartida del proceso; se rehace si cambia alguno de los ficheros."""
+    paths = (logo_path, logo_path_wm, ttf_path)
+    return _plantilla(*paths, tuple(_mtime(p) for p in paths))
+
+
+#  FUNCIÓN DE GENERACIÓN DE PDF (FPDF2) #
+def generar_pdf(informe, mean_vals=None, pos_mean=None, jugador_pos=None,
+                logo_path=LOGO_PATH, logo_path_wm=WATERMARK_PATH, ttf_path=TTF_PATH):
+    """
+    Genera un PDF con encabezado diferenciado, escudo, línea divisoria,
+    tabla de atributos, tabla de estadísticas y bloque de observaciones.
+    mean_vals / pos_mean son las medias (> 0) del jugador y de su posición
+    jugador_pos para los radares; se calculan fuera para no tocar los datos aquí.
+    Devuelve los bytes del PDF (se genera en memoria, sin ficheros intermedios).
+    """
+    # Primera página con la cabecera fija (marca de agua, escudo y título)
+    pdf = get_plantilla(logo_path, logo_path_wm, ttf_path).nuevo_pdf()
+
+    # Página y dimensiones
+    page_w = pdf.w - 2 * pdf.l_margin  # ancho
+    left_x = pdf.l_margin
+
+    # Subtítulo con fecha y scout
+    pdf.set_y(pdf.get_y() + 5)  # añadimos 10 mm de espacio
+    pdf.set_font("DejaVu", "", 12+1)
+    subt = f"Fecha: {informe.get('Fecha informe','')}    -    Scout: {informe.get('Scout','')}"
+    pdf.cell(page_w, 7, subt, ln=1, align="C")
+
+    pdf.ln(12)
+
+    # Línea divisoria de color (roja)
+    pdf.set_draw_color(200, 0, 0)
+    pdf.set_line_width(0.8)
+    y_line = pdf.get_y()
+    pdf.line(left_x, y_line, left_x + page_w, y_line)
+    pdf.ln(6)
+
+    # --- Bloque: Información del jugador ---
+    pdf.set_font("DejaVu", "", 12)  # fuente normal para los datos
+    # Lista de campos
+    campos = [
+        ("Nombre del jugador", informe.get("Jugador", "")),
+        ("Fecha de nacimiento", informe.get("Fecha de nacimiento", "")),
+        ("Club", informe.get("Club", "")),
+        ("Posición", informe.get("Posición", "")),
+        ("Lateralidad", informe.get("Lateralidad", ""))
+    ]
+
+    for etiqueta, valor in campos:
+        pdf.cell(page_w, 6, f"{etiqueta}: {valor}", ln=1, align="L")
+    pdf.ln(6)
+
+    # Tablas
+    name_col = int(page_w * 0.75)  # columna nombre atributo
+    val_col = int(page_w * 0.25)   # columna valor
+    row_h = 8
+
+    # Tabla Atributos
+    pdf.set_font("DejaVu", "", 12)
+    pdf.set_fill_color(230, 230, 230)
+    pdf.cell(name_col, row_h, "Atributos valorables", border=0, fill=True)
+    pdf.cell(val_col, row_h, "Valor (0-5)", border=0, fill=True, align="C", ln=1)
+
+    # Filas: usamos multi_cell para el nombre por si se parte
+    pdf.set_font("DejaVu", "", 12)
+    for attr in ATRIBUTOS_VALORABLES:
+        val = informe.get(attr, "")
+        if str(val).strip() != "" and str(val) not in ["0", "0.0"]:
+            try:
+                val_num = max(0, min(5, int(round(float(val)))))
+                estrellas = "★" * val_num + "☆" * (5 - val_num)
+            except Exception:
+                estrellas = "N/A"  # fallback en caso de error
+            x_before = pdf.get_x()
+            y_before = pdf.get_y()
+            pdf.multi_cell(name_col, row_h, str(attr), border=0)
+            y_after_name = pdf.get_y()
+            pdf.set_xy(left_x + name_col, y_before)
+            pdf.multi_cell(val_col, row_h, estrellas, border=0, align="C")
+            pdf.set_xy(left_x, max(y_after_name, pdf.get_y()))
+    pdf.ln(6)
+           
+    # Tabla estadísticas
+    pdf.set_font("DejaVu", "", 12)
+    pdf.set_fill_color(230, 230, 230)
+    pdf.cell(name_col, row_h, "Datos estadísticos", border=0, fill=True)
+    pdf.cell(val_col, row_h, "Valor", border=0, fill=True,align="C", ln=1)
+
+    pdf.set_font("DejaVu", "", 12)
+    for stat in ATRIBUTOS_PORCENTAJE:
+        val = informe.get(stat, "")
+        if str(val).strip() != "" and str(val) not in ["0", "0.0"]:   # 👈 filtro
+            x_before = pdf.get_x()
+            y_before = pdf.get_y()
+            pdf.multi_cell(name_col, row_h, str(stat), border=0)
+            y_after_name = pdf.get_y()
+            pdf.set_xy(left_x + name_col, y_before)
+            pdf.multi_cell(val_col, row_h, f"{val}%", border=0, align="C")
+            pdf.set_xy(left_x, max(y_after_name, pdf.get_y()))
+    pdf.ln(8)
+
+        # === SECCIÓN DE GRÁFICOS RADAR ===
+    try:
+        # --- Radar 1: Informe actual vs Media del jugador ---
+        jugador = informe.get("Jugador", "")
+        # Serie actual
+        curr_vals = AttributeMatrix.from_record(
+            informe, ATRIBUTOS_VALORABLES, zero_is_missing=False).row_values(0)
+
+        # Media del jugador (ignorando ceros y NaN)
+        mean_vals = mean_vals or {}
+
+        # --- Radar 2: Media del jugador vs Media de su posición ---
+
+        # Medias de jugador (>0)
+        player_mean = {}
+        for a in ATRIBUTOS_VALORABLES:
+            v = mean_vals.get(a, None)
+            if v is not None and float(v) > 0:
+                player_mean[a] = float(v)
+
+        # Media de su posición (ignorando 0 -> NaN)
+        pos_mean = pos_mean or {}
+
+        # === GENERAR Y COLOCAR LOS DOS RADARES LADO A LADO ===
+        if len(curr_vals) >= 1 and len(mean_vals) >= 1 and len(pos_mean) >= 1:
+            # Colocar ambos perfectamente alineados
+            _insert_two_radars_row(
+                pdf,
+                (curr_vals, mean_vals, f"{jugador} — Informe vs Media"),
+                (player_mean, pos_mean, f"{jugador} — Media vs {jugador_pos or 'Posición'}"),
+                w_mm=90, gap_mm=8, pad_bottom=10,
+            )
+
+    except Exception:
+        # Un error en los radares no rompe la exportación, pero queda en el log
+        # (también desde los procesos de la exportación por lotes)
+        logger.exception("No se pudieron dibujar los radares del informe de %s", informe.get("Jugador", ""))
+
+
+    # Observaciones
+    obs = informe.get("Observaciones", "")
+    if obs:
+        # Encabezado "Observaciones"
+        pdf.set_font("DejaVu", "", 12)
+        pdf.set_fill_color(230, 230, 230)  # mismo fondo que cabeceras anteriores
+        pdf.cell(name_col, row_h, "Observaciones", border=0, fill=True)
+        pdf.cell(val_col, row_h, "", border=0, fill=True, ln=1)  # segunda columna vacía
+        pdf.ln(2)
+        pdf.set_font("DejaVu", "", 12)
+
+        # Cuadro de texto blanco para observaciones
+        y_start = pdf.get_y()
+        pdf.set_fill_color(255, 255, 255)  # fondo blanco
+        pdf.rect(left_x, y_start, page_w, 40, style="F")
+        pdf.set_xy(left_x, y_start)
+        pdf.multi_cell(0, 6, obs, border=0, fill=True)  # border=1 usa el color y grosor activos
+        pdf.ln(10)
+    
+    # PDF en memoria: dos exportaciones simultáneas nunca comparten ficheros
+    return bytes(pdf.output())
+
+
+# === CACHÉ DE PDFs ===
+def _canonical(value):
+    """Valor de un campo en forma estable para el hash (tipos de numpy/pandas a Python)."""
+    if isinstance(value, dict):
+        return {str(k): _canonical(v) for k, v in value.items()}
+    if isinstance(value, np.generic):
+        value = value.item()
+    if value is None or (isinstance(value, float) and math.isnan(value)) or value is pd.NaT:
+        return None
+    if isinstance(value, (str, int, float, bool)):
+        return value
+    return str(value)
+
+
+def pdf_cache_key(informe, mean_vals=None, pos_mean=None, jugador_pos=None):
+    """
+    Hash de todo lo que determina el PDF: los campos del informe, las medias del
+    jugador y de su posición, la versión del diseño y los ficheros de la plantilla.
+    Cualquier cambio en los datos da otra clave, así que no hace falta invalidar.
+    """
+    payload = {
+        "layout": PDF_LAYOUT_VERSION,
+        "plantilla": [(path, _mtime(path)) for path in (LOGO_PATH, WATERMARK_PATH, TTF_PATH)],
+        "informe": _canonical(informe),
+        "mean_vals": _canonical(mean_vals or {}),
+        "pos_mean": _canonical(pos_mean or {}),
+        "jugador_pos": _canonical(jugador_pos),
+    }
+    raw = json.dumps(payload, sort_keys=True, ensure_ascii=False, default=str)
+    return hashlib.sha256(raw.encode("utf-8")).hexdigest()
+
+
+class PdfCache:
+    """
+    Caché LRU en memoria de PDFs generados, direccionada por contenido
+    (pdf_cache_key) y acotada por el tamaño total en bytes.
+    """
+
+    def __init__(self, max_bytes=PDF_CACHE_BYTES):
+        self.max_bytes = max_bytes
+        self.size = 0
+        self.hits = 0
+        self.misses = 0
+        self._items = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key):
+        with self._lock:
+            data = self._items.get(key)
+            if data is None:
+                self.misses += 1
+                return None
+            self._items.move_to_end(key)
+            self.hits += 1
+            return data
+
+    def put(self, key, data):
+        if len(data) > self.max_bytes:
+            return
+        with self._lock:
+            old = self._items.pop(key, None)
+            if old is not None:
+                self.size -= len(old)
+            self._items[key] = data
+            self.size += len(data)
+            # Expulsar los menos usados recientemente hasta caber
+            while self.size > self.max_bytes:
+                _, evicted = self._items.popitem(last=False)
+                self.size -= len(evicted)
+
+    def render(self, informe, **context):
+        """PDF del informe: de la caché si ya se generó con los mismos datos."""
+        key = pdf_cache_key(informe, **context)
+        data = self.get(key)
+        if data is None:
+            data = generar_pdf(informe, **context)
+            self.put(key, data)
+        return data
+
+
+# === EXPORTACIÓN POR LOTES ===
+def _render_pool(jobs, workers):
+    """
+    Genera los PDFs de jobs con un pool de workers procesos, en el proceso
+    auxiliar pdf_worker (ver su docstring). Va devolviendo (índice del trabajo,
+    (nombre, bytes) o None, error o None) según terminan.
+    """
+    app_dir = os.path.dirname(os.path.abspath(__file__))
+    env = dict(os.environ, PYTHONPATH=os.pathsep.join(filter(None, [app_dir, os.environ.get("PYTHONPATH")])))
+    proc = subprocess.Popen(
+        [sys.executable, "-m", "pdf_worker", str(workers)], stdin=subprocess.PIPE, stdout=subprocess.PIPE, env=env
+    )
+    pendientes = set(range(len(jobs)))
+    try:
+        pdf_worker.write_frame(proc.stdin, jobs)
+        proc.stdin.close()
+        while (frame := pdf_worker.read_frame(proc.stdout)) is not None:
+            pendientes.discard(frame[0])
+            yield frame
+    finally:
+        proc.stdout.close()
+        code = proc.wait()
+    # Si el proceso auxiliar muere, los trabajos que no llegaron cuentan como errores
+    for i in sorted(pendientes):
+        yield i, None, f"la exportación terminó antes de tiempo (código {code})"
+
+
+def generar_zip_pdfs(jobs, progress=None, max_workers=None, cache=None):
+    """
+    Genera los PDFs de una lista de trabajos (informe, {mean_vals, pos_mean,
+    jugador_pos}) en paralelo con un pool de procesos (generar los PDF es CPU
+    puro y no libera el GIL) y los va escribiendo en un ZIP en memoria
+    según terminan. Con cache (PdfCache) solo se generan los que no estén ya.
+    progress(hechos, total) se llama tras cada PDF.
+    Devuelve (bytes del ZIP, lista de errores).
+    """
+    total = len(jobs)
+    done = 0
+    buffer = io.BytesIO()
+    errores = []
+    used_names = set()
+
+    def _add(zf, name, data):
+        # Nombres únicos dentro del ZIP (mismo jugador y fecha)
+        base, ext = os.path.splitext(name)
+        n = 2
+        while name in used_names:
+            name = f"{base}_{n}{ext}"
+            n += 1
+        used_names.add(name)
+        zf.writestr(name, data)
+
+    def _done(job, result=None, error=None):
+        nonlocal done
+        if error is not None:
+            errores.append(f"{pdf_file_name(job[0])}: {error}")
+        else:
+            name, data = result
+            _add(zf, name, data)
+            if cache is not None:
+                cache.put(pdf_cache_key(job[0], **job[1]), data)
+        done += 1
+        if progress:
+            progress(done, total)
+
+    # Los PDF ya van comprimidos: se guardan sin volver a comprimir
+    with zipfile.ZipFile(buffer, "w", compression=zipfile.ZIP_STORED) as zf:
+        pending = []
+        for job in jobs:
+            data = cache.get(pdf_cache_key(job[0], **job[1])) if cache is not None else None
+            if data is not None:
+                _add(zf, pdf_file_name(job[0]), data)
+                done += 1
+                if progress:
+                    progress(done, total)
+            else:
+                pending.append(job)
+
+        if len(pending) <= 1:
+            for job in pending:
+                try:
+                    _done(job, pdf_worker.render_job(job))
+                except Exception as e:
+                    _done(job, error=e)
+        else:
+            workers = min(max_workers or os.cpu_count() or 1, len(pending))
+            for i, result, error in _render_pool(pending, workers):
+                _done(pending[i], result, error)
+    return buffer.getvalue(), errores
@@ -0,0 +1,62 @@
+"""
+Proceso auxiliar de la exportación de PDFs por lotes (pdf_report.generar_zip_pdfs).
+
+pdf_report lo arranca con "python -m pdf_worker <trabajadores>", así que este
+módulo es el __main__ de su propio pool de procesos "spawn": los trabajadores
+solo reimportan este módulo y no la app de Streamlit, que es el __main__ del
+servidor. Lee de stdin la lista de trabajos (informe, contexto) y escribe en
+stdout (índice, (nombre, bytes) o None, error o None) de cada PDF según termina.
+Los mensajes van como pickle con su longitud delante (ver write_frame).
+"""
+import multiprocessing
+import os
+import pickle
+import struct
+import sys
+from concurrent.futures import ProcessPoolExecutor, as_completed
+
+_HEADER = struct.Struct("<Q")
+
+
+def write_frame(stream, obj):
+    """Escribe un objeto en stream como pickle precedido de su longitud."""
+    data = pickle.dumps(obj, protocol=pickle.HIGHEST_PROTOCOL)
+    stream.write(_HEADER.pack(len(data)))
+    stream.write(data)
+    stream.flush()
+
+
+def read_frame(stream):
+    """Lee un objeto escrito con write_frame (None al llegar al final del stream)."""
+    header = stream.read(_HEADER.size)
+    if len(header) < _HEADER.size:
+        return None
+    return pickle.loads(stream.read(_HEADER.unpack(header)[0]))
+
+
+def render_job(job):
+    """Genera el PDF de un trabajo (informe, {mean_vals, pos_mean, jugador_pos}) y devuelve (nombre, bytes)."""
+    import pdf_report
+    informe, context = job
+    return pdf_report.pdf_file_name(informe), pdf_report.generar_pdf(informe, **context)
+
+
+def main(max_workers):
+    # stdout queda solo para los resultados: lo que impriman este proceso o los
+    # trabajadores (que heredan el descriptor 1) va a stderr
+    out = os.fdopen(os.dup(sys.stdout.fileno()), "wb")
+    os.dup2(sys.stderr.fileno(), sys.stdout.fileno())
+    jobs = read_frame(sys.stdin.buffer) or []
+    ctx = multiprocessing.get_context("spawn")
+    with ProcessPoolExecutor(max_workers=max(1, min(max_workers, len(jobs) or 1)), mp_context=ctx) as pool:
+        futures = {pool.submit(render_job, job): i for i, job in enumerate(jobs)}
+        for future in as_completed(futures):
+            try:
+                write_frame(out, (futures[future], future.result(), None))
+            except Exception as e:
+                write_frame(out, (futures[future], None, str(e)))
+    out.close()
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else os.cpu_count() or 1)
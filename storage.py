@@ -0,0 +1,914 @@
+"""
+Capa de almacenamiento de las tablas de scouting.
+
+Dos backends intercambiables con la misma interfaz:
+  - JsonStorage: un snapshot <tabla>.json (formato {"pk": id, "fields": {...}})
+    más un log JSON Lines <tabla>.jsonl de altas, modificaciones y bajas para las
+    tablas en modo "solo añadir". Informes
+    tiene además una copia columnar <tabla>.parquet del snapshot para las
+    lecturas analíticas con proyección de columnas.
+  - SqliteStorage: una base SQLite (modo WAL) con columnas reales e índices en
+    los campos por los que filtran las páginas.
+
+Cada registro tiene un id estable, que es el índice (llamado "id") de los
+DataFrames leídos y la clave de los cambios puntuales de apply_changes(). Los ids
+no se reutilizan: como el AUTOINCREMENT de SQLite, el snapshot JSON recuerda el
+mayor id asignado aunque ese registro se haya borrado (ver _merge_records).
+
+Las fechas (DATE_COLUMNS) se leen y escriben como texto DD-MM-AAAA, pero el
+almacenamiento guarda también cada una como nº de días desde 1970-01-01 en una
+columna interna (<columna>__dias: en el Parquet y, indexada, en SQLite), que no
+aparece en read() y se consulta con read_days() ya ordenada.
+
+Uso desde línea de comandos para migrar los JSON de data/ a SQLite:
+    python storage.py import-json data/ data/scouting.db
+"""
+import argparse
+import json
+import math
+import os
+import sqlite3
+import threading
+from contextlib import contextmanager
+
+import numpy as np
+import pandas as pd
+
+try:
+    import fcntl
+except ImportError:  # Windows
+    fcntl = None
+    import msvcrt
+
+# Tablas en modo "solo añadir" (JSON): los registros nuevos se escriben en un log
+# JSON Lines (<tabla>.jsonl) y se compactan en el snapshot <tabla>.json cuando el log crece
+APPEND_ONLY_TABLES = ["Informes", "Jugadores"]
+LOG_COMPACT_BYTES = 1_000_000  # ~600 informes
+
+# Tablas con snapshot columnar (Parquet) para las lecturas de solo algunas columnas
+COLUMNAR_TABLES = ["Informes"]
+# Clave de los metadatos del Parquet con la versión del snapshot JSON del que sale
+COLUMNAR_SOURCE_KEY = b"scouting_source_version"
+# y con el mayor id asignado en ese snapshot
+COLUMNAR_LAST_ID_KEY = b"scouting_last_id"
+
+# Nombre del índice (o de la columna) con los ids de registro
+RECORD_ID = "id"
+
+# Filas por bloque al serializar un DataFrame a JSON (limita la memoria de pico)
+SAVE_CHUNK_ROWS = 5_000
+
+# Columnas indexadas (SQLite)
+INDEXED_COLUMNS = {
+    "Informes": ["Jugador", "Scout", "Posición", "Acción", "Temporada", "Fecha informe"],
+    "Jugadores": ["Nombre jugador"],
+    "Scouts": ["Nombre scout"],
+}
+
+
+# Columnas de fecha por tabla (texto DD-MM-AAAA) y sufijo de su columna interna de días
+DATE_COLUMNS = {
+    "Informes": ["Fecha informe", "Fecha de nacimiento"],
+    "Jugadores": ["Fecha de nacimiento"],
+}
+DATE_FORMAT = "%d-%m-%Y"
+DAYS_SUFFIX = "__dias"
+EPOCH = pd.Timestamp("1970-01-01")
+
+
+def days_column(column):
+    """Nombre de la columna interna con los días de una columna de fecha."""
+    return column + DAYS_SUFFIX
+
+
+def day_number(value):
+    """Nº de días desde 1970-01-01 de un date/datetime."""
+    return (pd.Timestamp(value) - EPOCH).days
+
+
+def dates_to_days(values):
+    """Fechas DD-MM-AAAA (o date/datetime) -> días desde 1970-01-01, Int32 con <NA> si falta o no es válida."""
+    values = values if isinstance(values, pd.Series) else pd.Series(values, dtype=object)
+    dates = pd.to_datetime(values.astype(object), format=DATE_FORMAT, errors="coerce")
+    return (dates - EPOCH).dt.days.astype("Int32")
+
+
+def _with_days(table_name, df):
+    """df con las columnas internas de días de sus columnas de fecha."""
+    columns = [c for c in DATE_COLUMNS.get(table_name, []) if c in df.columns]
+    if not columns:
+        return df
+    return df.assign(**{days_column(c): dates_to_days(df[c]) for c in columns})
+
+
+def _records_with_days(table_name, records):
+    """Copia de una lista de registros (dicts) con los días de sus fechas."""
+    records = [dict(r) for r in records]
+    for col in DATE_COLUMNS.get(table_name, []):
+        days = dates_to_days([r.get(col) for r in records])
+        for record, day in zip(records, days):
+            record[days_column(col)] = None if pd.isna(day) else int(day)
+    return records
+
+
+def _clean_fields(record):
+    """Quita los valores vacíos (None/NaN) de un registro."""
+    return {k: v for k, v in record.items() if v is not None and not pd.isna(v)}
+
+
+def _record_ids(df):
+    """
+    Ids de registro explícitos de un DataFrame: su índice si se llama "id" (como
+    el de read()) o si no su columna "id", siempre que sean enteros sin
+    repetidos; si no, None.
+    """
+    if df.index.name == RECORD_ID:
+        ids = df.index
+    elif RECORD_ID in df.columns:
+        ids = pd.Index(df[RECORD_ID])
+    else:
+        return None
+    if pd.api.types.is_integer_dtype(ids.dtype) and ids.is_unique:
+        return ids
+    return None
+
+
+def _with_record_ids(df):
+    """El DataFrame indexado por sus ids de registro (1..n si no los trae explícitos)."""
+    ids = _record_ids(df)
+    if ids is None:
+        ids = pd.RangeIndex(1, len(df) + 1)
+    return df.drop(columns=RECORD_ID, errors="ignore").set_axis(ids.rename(RECORD_ID))
+
+
+def _max_id(ids):
+    """Mayor id de un índice o de las claves de {id: campos} (0 si no hay ninguno)."""
+    if not len(ids):
+        return 0
+    return int(ids.max()) if isinstance(ids, pd.Index) else max(ids)
+
+
+def _merge_records(records, last=0):
+    """
+    Registros vigentes {id: campos}, en orden, y mayor id asignado, a partir de
+    los registros del snapshot seguidos de las líneas del log. Cada línea es un
+    alta ({"fields"}), la nueva versión de un registro ({"pk", "fields"}) o una
+    baja ({"pk", "deleted": true}). Lo que no trae "pk" (datos anteriores a los
+    ids, altas del log) recibe el siguiente al mayor id visto hasta ese punto
+    (last al empezar), así el id no cambia al compactar. Las bajas también
+    cuentan: el snapshot acaba con la baja del mayor id asignado cuando ese
+    registro ya no existe (ver _records_from_dicts), y sus ids no se reutilizan.
+    """
+    merged = {}
+    for record in records:
+        pk = record.get("pk")
+        if pk is None:
+            pk = last + 1
+        last = max(last, pk)
+        if record.get("deleted"):
+            merged.pop(pk, None)
+        else:
+            merged[pk] = record.get("fields", {})
+    return merged, last
+
+
+def _replay_log(df, log, columns=None, last=0):
+    """
+    Aplica las líneas del log (mismas reglas que _merge_records) a un DataFrame
+    indexado por id con el contenido del snapshot, cuyo mayor id asignado es
+    last. columns limita los campos.
+    """
+    if not log:
+        return df
+    last = max(last, _max_id(df.index))
+    changed, deleted = {}, set()
+    for record in log:
+        pk = record.get("pk")
+        if pk is None:
+            pk = last + 1
+        last = max(last, pk)
+        if record.get("deleted"):
+            changed.pop(pk, None)
+            deleted.add(pk)
+        else:
+            fields = record.get("fields", {})
+            changed[pk] = fields if columns is None else {c: fields[c] for c in columns if c in fields}
+            deleted.discard(pk)
+    new_ids = [pk for pk in changed if pk not in df.index]
+    rows = pd.DataFrame(list(changed.values()), index=list(changed))
+    out = pd.concat([df[~df.index.isin(list(changed) + list(deleted))], rows])
+    if len(new_ids) < len(changed):
+        # Registros del snapshot modificados: vuelven a su posición
+        kept = df.index[~df.index.isin(list(deleted))]
+        out = out.reindex(kept.append(pd.Index(new_ids)))
+    return out.rename_axis(RECORD_ID)
+
+
+def filter_df(df, filters):
+    """Aplica filtros {columna: valor | lista de valores} sobre un DataFrame."""
+    for col, value in (filters or {}).items():
+        if col not in df.columns:
+            return df.iloc[0:0]
+        if isinstance(value, (list, tuple, set)):
+            df = df[df[col].isin(list(value))]
+        else:
+            df = df[df[col] == value]
+    return df
+
+
+_encode_str = json.encoder.encode_basestring
+
+
+def _encode_value(value):
+    """
+    Serializa un valor escalar igual que json.dumps(..., ensure_ascii=False),
+    pero sin pasar por el encoder en Python puro que se usa con indent.
+    """
+    if isinstance(value, str):
+        return _encode_str(value)
+    if value is True:
+        return "true"
+    if value is False:
+        return "false"
+    if isinstance(value, int):
+        return int.__repr__(value)
+    if isinstance(value, float) and math.isfinite(value):
+        return float.__repr__(value)
+    return json.dumps(value, ensure_ascii=False, default=str)
+
+
+def _format_last_id(last):
+    """Baja {"pk": id, "deleted": true} con la que el snapshot recuerda el mayor id asignado."""
+    return '    {\n        "pk": ' + int.__repr__(int(last)) + ',\n        "deleted": true\n    }'
+
+
+def _format_record(pk, parts):
+    """Registro {"pk": id, "fields": {...}} con la indentación de json.dump(indent=4) dentro de la lista."""
+    head = '    {\n        "pk": ' + int.__repr__(int(pk)) + ",\n"
+    if not parts:
+        return head + '        "fields": {}\n    }'
+    return head + '        "fields": {\n' + ",\n".join(parts) + "\n        }\n    }"
+
+
+def _key_prefix(key):
+    return " " * 12 + _encode_str(str(key)) + ": "
+
+
+def _records_from_df(df, last=0):
+    """
+    Genera los registros serializados de un DataFrame, columna a columna y por
+    bloques: cada columna se convierte y se codifica de una vez (sin crear una
+    Series por fila) y los NaN se descartan con la máscara notna de la columna.
+    El id de cada registro es el índice del DataFrame (ver _with_record_ids);
+    last es el mayor id asignado, como en _records_from_dicts.
+    """
+    prefixes = [_key_prefix(c) for c in df.columns]
+    for start in range(0, len(df), SAVE_CHUNK_ROWS):
+        chunk = df.iloc[start:start + SAVE_CHUNK_ROWS]
+        ids = chunk.index.tolist()
+        columns = []
+        for j, prefix in enumerate(prefixes):
+            col = chunk.iloc[:, j]
+            mask = col.notna().to_numpy()
+            encoded = [prefix + _encode_value(v) if ok else None for v, ok in zip(col.tolist(), mask)]
+            columns.append(encoded)
+        for pk, row in zip(ids, zip(*columns)):
+            yield _format_record(pk, [part for part in row if part is not None])
+    if last > _max_id(df.index):
+        yield _format_last_id(last)
+
+
+def _records_from_dicts(records, last=0):
+    """
+    Registros serializados a partir de {id: campos} y del mayor id asignado
+    (ver _merge_records): si ese registro ya no existe, se añade su baja al final.
+    """
+    for pk, fields in records.items():
+        fields = _clean_fields(fields)
+        yield _format_record(pk, [_key_prefix(k) + _encode_value(v) for k, v in fields.items()])
+    if last > _max_id(records):
+        yield _format_last_id(last)
+
+
+def _write_json_atomic(encoded_records, path):
+    """
+    Escribe la lista de registros en streaming (mismo formato que
+    json.dump(indent=4)) en un temporal y lo renombra: los lectores nunca ven
+    medio fichero y no se construye el JSON completo en memoria.
+    """
+    tmp_path = path + ".tmp"
+    with open(tmp_path, "w", encoding="utf-8") as f:
+        f.write("[")
+        empty = True
+        for text in encoded_records:
+            f.write("\n" if empty else ",\n")
+            f.write(text)
+            empty = False
+        f.write("]" if empty else "\n]")
+    os.replace(tmp_path, path)
+
+
+@contextmanager
+def _file_lock(path):
+    """Bloqueo exclusivo (entre sesiones y procesos) sobre <path>.lock."""
+    with open(path + ".lock", "a+") as lock_file:
+        if fcntl is not None:
+            fcntl.flock(lock_file, fcntl.LOCK_EX)
+        else:
+            msvcrt.locking(lock_file.fileno(), msvcrt.LK_LOCK, 1)
+        try:
+            yield
+        finally:
+            if fcntl is not None:
+                fcntl.flock(lock_file, fcntl.LOCK_UN)
+            else:
+                lock_file.seek(0)
+                msvcrt.locking(lock_file.fileno(), msvcrt.LK_UNLCK, 1)
+
+
+class JsonStorage:
+    """Tablas como ficheros JSON en data_dir (snapshot + log JSON Lines)."""
+
+    supports_queries = False
+
+    def __init__(self, data_dir):
+        self.data_dir = data_dir
+
+    def location(self, table_name):
+        """Ruta del snapshot de la tabla (lo crea vacío si no existe)."""
+        path = os.path.join(self.data_dir, f"{table_name}.json")
+        os.makedirs(self.data_dir, exist_ok=True)
+        if not os.path.exists(path):
+            with open(path, "w", encoding="utf-8") as f:
+                json.dump([], f)
+        return path
+
+    def _log_path(self, table_name):
+        return os.path.join(self.data_dir, f"{table_name}.jsonl")
+
+    def version(self, table_name):
+        """
+        Versión de la tabla en disco: (mtime_ns, tamaño) del snapshot y de su log.
+        Cambia en cada escritura.
+        """
+        stat = os.stat(self.location(table_name))
+        try:
+            log_stat = os.stat(self._log_path(table_name))
+            log_version = (log_stat.st_mtime_ns, log_stat.st_size)
+        except FileNotFoundError:
+            log_version = (0, 0)
+        return (stat.st_mtime_ns, stat.st_size) + log_version
+
+    def _read_snapshot_records(self, table_name):
+        with open(self.location(table_name), "r", encoding="utf-8") as f:
+            return json.load(f)
+
+    def _read_log_records(self, table_name):
+        records = []
+        log_path = self._log_path(table_name)
+        if os.path.exists(log_path):
+            with open(log_path, "r", encoding="utf-8") as f:
+                for line in f:
+                    try:
+                        records.append(json.loads(line))
+                    except json.JSONDecodeError:
+                        # Última línea a medio escribir: se leerá en la próxima versión
+                        break
+        return records
+
+    def _read_records(self, table_name):
+        """
+        Registros vigentes {id: campos} y mayor id asignado: el snapshot con el
+        log (si existe) aplicado.
+        """
+        return _merge_records(self._read_snapshot_records(table_name) + self._read_log_records(table_name))
+
+    def last_id(self, table_name):
+        """Mayor id asignado en la tabla, aunque ese registro se haya borrado."""
+        columnar = self._read_columnar(table_name, []) if table_name in COLUMNAR_TABLES else None
+        if columnar is None:
+            return self._read_records(table_name)[1]
+        return _merge_records(self._read_log_records(table_name), columnar[1])[1]
+
+    def _write_snapshot(self, encoded_records, table_name):
+        _write_json_atomic(encoded_records, self.location(table_name))
+
+    # --- Snapshot columnar (Parquet) ---
+    def _columnar_path(self, table_name):
+        return os.path.join(self.data_dir, f"{table_name}.parquet")
+
+    def _snapshot_version(self, table_name):
+        """Versión del snapshot JSON (sin el log) con la que se etiqueta el Parquet."""
+        stat = os.stat(self.location(table_name))
+        return f"{stat.st_mtime_ns}:{stat.st_size}".encode()
+
+    def _write_columnar(self, table_name, df, last=0):
+        """
+        Escribe <tabla>.parquet con el contenido del snapshot JSON recién escrito
+        (y las fechas convertidas a días) y su mayor id asignado. Si alguna
+        columna no se puede representar en Arrow (tipos mezclados) se borra el
+        Parquet y las lecturas vuelven al JSON.
+        """
+        import pyarrow as pa
+        import pyarrow.parquet as pq
+
+        path = self._columnar_path(table_name)
+        try:
+            table = pa.Table.from_pandas(_with_days(table_name, df), preserve_index=True)
+        except (pa.ArrowException, TypeError, ValueError):
+            if os.path.exists(path):
+                os.remove(path)
+            return
+        metadata = dict(table.schema.metadata or {})
+        metadata[COLUMNAR_SOURCE_KEY] = self._snapshot_version(table_name)
+        metadata[COLUMNAR_LAST_ID_KEY] = str(max(last, _max_id(df.index))).encode()
+        tmp_path = path + ".tmp"
+        pq.write_table(table.replace_schema_metadata(metadata), tmp_path)
+        os.replace(tmp_path, path)
+
+    def _read_columnar(self, table_name, columns=None):
+        """
+        (columnas del Parquet, mayor id asignado) si está al día con el snapshot
+        JSON; None si no lo está.
+        """
+        import pyarrow as pa
+        import pyarrow.parquet as pq
+
+        path = self._columnar_path(table_name)
+        try:
+            schema = pq.read_schema(path)
+            if (schema.metadata or {}).get(COLUMNAR_SOURCE_KEY) != self._snapshot_version(table_name):
+                return None
+            if columns is not None:
+                columns = [c for c in columns if c in schema.names]
+            df = pd.read_parquet(path, columns=columns).rename_axis(RECORD_ID)
+            last = int((schema.metadata or {}).get(COLUMNAR_LAST_ID_KEY, 0))
+            return df, max(last, _max_id(df.index))
+        except (OSError, pa.ArrowException):
+            return None
+
+    def _read_projected(self, table_name, columns):
+        """
+        Solo las columnas indicadas: las del snapshot salen del Parquet (que se
+        regenera aquí si falta o está desfasado) y las del log, del JSON Lines.
+        """
+        columnar = self._read_columnar(table_name, columns)
+        if columnar is None:
+            with _file_lock(self.location(table_name)):
+                columnar = self._read_columnar(table_name, columns)
+                if columnar is None:
+                    records, last = _merge_records(self._read_snapshot_records(table_name))
+                    full = self._records_df(records)
+                    self._write_columnar(table_name, full, last)
+                    columnar = full[[c for c in columns if c in full.columns]], last
+        df, last = columnar
+        df = _replay_log(df, self._read_log_records(table_name), columns, last)
+        return df[[c for c in columns if c in df.columns]]
+
+    @staticmethod
+    def _records_df(records):
+        """DataFrame indexado por id a partir de {id: campos}."""
+        if not records:
+            return pd.DataFrame()
+        return pd.DataFrame(list(records.values()), index=pd.Index(list(records), name=RECORD_ID))
+
+    def read(self, table_name, columns=None):
+        """Tabla completa, o solo las columnas indicadas (las que existan). El índice es el id."""
+        if columns is not None and table_name in COLUMNAR_TABLES:
+            return self._read_projected(table_name, list(columns))
+        df = self._records_df(self._read_records(table_name)[0])
+        if columns is not None:
+            df = df[[c for c in columns if c in df.columns]]
+        return df
+
+    def query(self, table_name, filters):
+        return filter_df(self.read(table_name), filters)
+
+    def read_days(self, table_name, column):
+        """
+        Serie id -> días desde 1970-01-01 de una columna de fecha, ordenada por
+        fecha y sin las filas sin fecha válida. Sale de la columna de días del
+        Parquet; solo se convierten las fechas que vengan del log.
+        """
+        companion = days_column(column)
+        if table_name in COLUMNAR_TABLES:
+            df = self._read_projected(table_name, [column, companion])
+        else:
+            df = self.read(table_name, [column])
+        if column not in df.columns:
+            return pd.Series(dtype=np.int64)
+        if companion in df.columns:
+            days = pd.to_numeric(df[companion], errors="coerce")
+        else:
+            days = pd.Series(np.nan, index=df.index)
+        pending = days.isna() & df[column].notna()
+        if pending.any():
+            days[pending] = dates_to_days(df.loc[pending, column]).astype(float)
+        return days.dropna().astype(np.int64).sort_values(kind="stable")
+
+    def save(self, table_name, df):
+        """
+        Reemplaza la tabla (los ids son el índice "id" o la columna "id" de df, o
+        1..n si no trae ids; ver _record_ids). Los ids asignados antes siguen sin
+        reutilizarse. Devuelve (versión anterior, versión nueva).
+        """
+        df = _with_record_ids(df)
+        path = self.location(table_name)
+        with _file_lock(path):
+            prev_version = self.version(table_name)
+            last = max(self.last_id(table_name), _max_id(df.index))
+            self._write_snapshot(_records_from_df(df, last), table_name)
+            # El df ya incluye lo que hubiera en el log: se vacía
+            if os.path.exists(self._log_path(table_name)):
+                os.remove(self._log_path(table_name))
+            if table_name in COLUMNAR_TABLES:
+                self._write_columnar(table_name, df, last)
+            return prev_version, self.version(table_name)
+
+    def _compact_locked(self, table_name):
+        log_path = self._log_path(table_name)
+        if not os.path.exists(log_path):
+            return
+        # Con el Parquet al día se le añade el log en vez de reconstruirlo desde los registros
+        columnar = self._read_columnar(table_name) if table_name in COLUMNAR_TABLES else None
+        snapshot, log = self._read_snapshot_records(table_name), self._read_log_records(table_name)
+        records, last = _merge_records(snapshot + log)
+        self._write_snapshot(_records_from_dicts(records, last), table_name)
+        os.remove(log_path)
+        if columnar is not None:
+            columnar_df, columnar_last = columnar
+            self._write_columnar(table_name, _replay_log(columnar_df, log, last=columnar_last), last)
+
+    def compact(self, table_name):
+        """Vuelca el log de una tabla en su snapshot y vacía el log."""
+        with _file_lock(self.location(table_name)):
+            self._compact_locked(table_name)
+
+    def append(self, table_name, new_record):
+        """Añade un registro. Devuelve (versión anterior, versión nueva)."""
+        path = self.location(table_name)
+        if table_name not in APPEND_ONLY_TABLES:
+            with _file_lock(path):
+                prev_version = self.version(table_name)
+                records, last = self._read_records(table_name)
+                records[last + 1] = new_record
+                self._write_snapshot(_records_from_dicts(records, last + 1), table_name)
+                return prev_version, self.version(table_name)
+
+        # Modo solo añadir: una línea en el log, O(1) independientemente del tamaño de la tabla
+        with _file_lock(path):
+            prev_version = self.version(table_name)
+            self._append_log_locked(table_name, [{"fields": _clean_fields(new_record)}])
+            return prev_version, self.version(table_name)
+
+    def _append_log_locked(self, table_name, entries):
+        log_path = self._log_path(table_name)
+        with open(log_path, "a", encoding="utf-8") as f:
+            f.writelines(json.dumps(entry, ensure_ascii=False, default=str) + "\n" for entry in entries)
+        # Compactación ocasional
+        if os.path.getsize(log_path) >= LOG_COMPACT_BYTES:
+            self._compact_locked(table_name)
+
+    def apply_changes(self, table_name, updates=None, deletes=(), inserts=()):
+        """
+        Cambios puntuales por id: updates {id: campos} sustituye los campos de esos
+        registros, deletes los borra e inserts añade registros nuevos. En las tablas
+        en modo solo añadir son líneas del log, O(cambios); en el resto se reescribe
+        el snapshot. Devuelve (versión anterior, versión nueva).
+        """
+        entries = (
+            [{"pk": int(pk), "fields": _clean_fields(fields)} for pk, fields in (updates or {}).items()]
+            + [{"pk": int(pk), "deleted": True} for pk in deletes]
+            + [{"fields": _clean_fields(fields)} for fields in inserts]
+        )
+        path = self.location(table_name)
+        with _file_lock(path):
+            prev_version = self.version(table_name)
+            if table_name in APPEND_ONLY_TABLES:
+                self._append_log_locked(table_name, entries)
+            else:
+                records, last = _merge_records(
+                    self._read_snapshot_records(table_name) + self._read_log_records(table_name) + entries
+                )
+                self._write_snapshot(_records_from_dicts(records, last), table_name)
+            return prev_version, self.version(table_name)
+
+
+class SqliteStorage:
+    """
+    Tablas en una base SQLite.
+    Cada campo es una columna real (se añaden con ALTER TABLE cuando aparecen
+    campos nuevos) y cada tabla tiene un id autoincremental. La tabla _meta guarda
+    un contador de escrituras por tabla que sirve de versión para las cachés.
+    """
+
+    supports_queries = True
+
+    def __init__(self, db_path):
+        self.db_path = db_path
+        self._local = threading.local()
+        os.makedirs(os.path.dirname(os.path.abspath(db_path)), exist_ok=True)
+        with self._transaction() as conn:
+            conn.execute("CREATE TABLE IF NOT EXISTS _meta (table_name TEXT PRIMARY KEY, version INTEGER NOT NULL)")
+
+    def _conn(self):
+        """Una conexión por hilo (cada sesión de Streamlit corre en su propio hilo)."""
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            conn = sqlite3.connect(self.db_path, timeout=30, isolation_level=None)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            self._local.conn = conn
+        return conn
+
+    @contextmanager
+    def _transaction(self):
+        """Transacción de escritura (BEGIN IMMEDIATE: un escritor a la vez, lectores sin bloqueo)."""
+        conn = self._conn()
+        conn.execute("BEGIN IMMEDIATE")
+        try:
+            yield conn
+        except BaseException:
+            conn.execute("ROLLBACK")
+            raise
+        conn.execute("COMMIT")
+
+    @staticmethod
+    def _quote(name):
+        return '"' + str(name).replace('"', '""') + '"'
+
+    def location(self, table_name):
+        return self.db_path
+
+    def _columns(self, conn, table_name, internal=False):
+        """Columnas de la tabla sin el id (y sin las internas de días salvo con internal)."""
+        rows = conn.execute(f"PRAGMA table_info({self._quote(table_name)})").fetchall()
+        return [r[1] for r in rows if r[1] != "id" and (internal or not r[1].endswith(DAYS_SUFFIX))]
+
+    def _ensure_table(self, conn, table_name, columns):
+        """
+        Crea la tabla, sus índices y las columnas que falten, incluidas las de
+        días (indexadas) de las fechas, que se rellenan al crearlas. Devuelve
+        todas las columnas.
+        """
+        q = self._quote
+        indexed = INDEXED_COLUMNS.get(table_name, [])
+        existing = self._columns(conn, table_name, internal=True)
+        if not existing and not conn.execute(
+            "SELECT 1 FROM sqlite_master WHERE type='table' AND name=?", (table_name,)
+        ).fetchone():
+            cols = "".join(f", {q(c)}" for c in indexed)
+            conn.execute(f"CREATE TABLE {q(table_name)} (id INTEGER PRIMARY KEY AUTOINCREMENT{cols})")
+            for col in indexed:
+                conn.execute(f"CREATE INDEX {q(f'idx_{table_name}_{col}')} ON {q(table_name)} ({q(col)})")
+            existing = list(indexed)
+        for col in columns:
+            if col not in existing and col != "id" and not col.endswith(DAYS_SUFFIX):
+                conn.execute(f"ALTER TABLE {q(table_name)} ADD COLUMN {q(col)}")
+                existing.append(col)
+        for col in DATE_COLUMNS.get(table_name, []):
+            companion = days_column(col)
+            if col not in existing or companion in existing:
+                continue
+            conn.execute(f"ALTER TABLE {q(table_name)} ADD COLUMN {q(companion)} INTEGER")
+            conn.execute(f"CREATE INDEX {q(f'idx_{table_name}_{companion}')} ON {q(table_name)} ({q(companion)})")
+            existing.append(companion)
+            # Filas ya guardadas (bases anteriores a las columnas de días)
+            rows = conn.execute(f"SELECT id, {q(col)} FROM {q(table_name)} WHERE {q(col)} IS NOT NULL").fetchall()
+            if rows:
+                days = dates_to_days([r[1] for r in rows])
+                conn.executemany(
+                    f"UPDATE {q(table_name)} SET {q(companion)} = ? WHERE id = ?",
+                    [(None if pd.isna(d) else int(d), r[0]) for d, r in zip(days, rows)],
+                )
+        return existing
+
+    def _bump_version(self, conn, table_name):
+        """Incrementa el contador de escrituras. Devuelve (versión anterior, versión nueva)."""
+        row = conn.execute("SELECT version FROM _meta WHERE table_name = ?", (table_name,)).fetchone()
+        prev_version = row[0] if row else 0
+        conn.execute(
+            "INSERT INTO _meta (table_name, version) VALUES (?, 1) "
+            "ON CONFLICT(table_name) DO UPDATE SET version = version + 1",
+            (table_name,),
+        )
+        return prev_version, prev_version + 1
+
+    def _insert_df(self, conn, table_name, df, with_ids=False):
+        """
+        Inserta un DataFrame columna a columna (NaN -> NULL) con executemany.
+        Con with_ids el índice de df se guarda como id; si no, los asigna SQLite.
+        """
+        df = _with_days(table_name, df)
+        columns = [c for c in df.columns if c != "id"]
+        self._ensure_table(conn, table_name, columns)
+        if df.empty or not columns:
+            return
+        q = self._quote
+        col_values = [df[c].astype(object).where(df[c].notna(), None).tolist() for c in columns]
+        names = [q(c) for c in columns]
+        if with_ids:
+            names.insert(0, "id")
+            col_values.insert(0, [int(i) for i in df.index])
+        conn.executemany(
+            f"INSERT INTO {q(table_name)} ({', '.join(names)}) VALUES ({', '.join('?' for _ in names)})",
+            zip(*col_values),
+        )
+
+    def version(self, table_name):
+        row = self._conn().execute("SELECT version FROM _meta WHERE table_name = ?", (table_name,)).fetchone()
+        return row[0] if row else 0
+
+    def last_id(self, table_name):
+        """Mayor id asignado en la tabla (el contador de AUTOINCREMENT), aunque ese registro se haya borrado."""
+        conn = self._conn()
+        if not conn.execute("SELECT 1 FROM sqlite_master WHERE name = 'sqlite_sequence'").fetchone():
+            return 0
+        row = conn.execute("SELECT seq FROM sqlite_sequence WHERE name = ?", (table_name,)).fetchone()
+        return row[0] if row else 0
+
+    def _keep_last_id(self, conn, table_name, last):
+        """Sube el contador de AUTOINCREMENT a last para que SQLite no asigne ids ya usados."""
+        row = conn.execute("SELECT seq FROM sqlite_sequence WHERE name = ?", (table_name,)).fetchone()
+        if row is None:
+            conn.execute("INSERT INTO sqlite_sequence (name, seq) VALUES (?, ?)", (table_name, last))
+        elif row[0] < last:
+            conn.execute("UPDATE sqlite_sequence SET seq = ? WHERE name = ?", (last, table_name))
+
+    def _where(self, existing, filters):
+        """Cláusula WHERE y parámetros para {columna: valor | lista}; None si no puede haber filas."""
+        clauses, params = [], []
+        for col, value in (filters or {}).items():
+            if col not in existing:
+                return None
+            if isinstance(value, (list, tuple, set)):
+                value = list(value)
+                if not value:
+                    return None
+                clauses.append(f"{self._quote(col)} IN ({', '.join('?' for _ in value)})")
+                params.extend(value)
+            else:
+                clauses.append(f"{self._quote(col)} = ?")
+                params.append(value)
+        return ("WHERE " + " AND ".join(clauses)) if clauses else "", params
+
+    def _records_df(self, rows, columns):
+        """DataFrame indexado por id a partir de filas (id, *columns)."""
+        return pd.DataFrame.from_records(rows, columns=[RECORD_ID] + columns, index=RECORD_ID)
+
+    def read(self, table_name, columns=None):
+        """Tabla completa, o solo las columnas indicadas (las que existan). El índice es el id."""
+        conn = self._conn()
+        existing = self._columns(conn, table_name)
+        columns = existing if columns is None else [c for c in columns if c in existing]
+        if not columns:
+            return pd.DataFrame()
+        q = self._quote
+        rows = conn.execute(
+            f"SELECT id, {', '.join(q(c) for c in columns)} FROM {q(table_name)} ORDER BY id"
+        ).fetchall()
+        if not rows:
+            return pd.DataFrame()
+        # Quitar columnas sin ningún valor (equivale a un campo ausente en el JSON)
+        return self._records_df(rows, columns).dropna(axis=1, how="all")
+
+    def query(self, table_name, filters):
+        """Consulta con filtros {columna: valor | lista de valores} resuelta por los índices."""
+        conn = self._conn()
+        columns = self._columns(conn, table_name)
+        where = self._where(columns, filters)
+        if where is None:
+            return pd.DataFrame(columns=columns)
+        q = self._quote
+        rows = conn.execute(
+            f"SELECT id, {', '.join(q(c) for c in columns)} FROM {q(table_name)} {where[0]} ORDER BY id",
+            where[1],
+        ).fetchall()
+        return self._records_df(rows, columns)
+
+    def read_days(self, table_name, column):
+        """
+        Serie id -> días desde 1970-01-01 de una columna de fecha, ordenada por
+        fecha y sin las filas sin fecha válida (recorrido del índice de la columna de días).
+        """
+        conn = self._conn()
+        companion = days_column(column)
+        q = self._quote
+        if companion not in self._columns(conn, table_name, internal=True):
+            # Base anterior a las columnas de días y sin escrituras desde entonces
+            df = self.read(table_name, [column])
+            if column not in df.columns:
+                return pd.Series(dtype=np.int64)
+            return dates_to_days(df[column]).dropna().astype(np.int64).sort_values(kind="stable")
+        rows = conn.execute(
+            f"SELECT id, {q(companion)} FROM {q(table_name)} WHERE {q(companion)} IS NOT NULL "
+            f"ORDER BY {q(companion)}, id"
+        ).fetchall()
+        return pd.Series([r[1] for r in rows], index=[r[0] for r in rows], dtype=np.int64)
+
+    def distinct(self, table_name, column, filters=None):
+        """Valores distintos (no nulos) de una columna, en orden de aparición."""
+        conn = self._conn()
+        columns = self._columns(conn, table_name)
+        where = self._where(columns, filters)
+        if column not in columns or where is None:
+            return []
+        q = self._quote
+        clause = where[0] + (" AND " if where[0] else "WHERE ") + f"{q(column)} IS NOT NULL"
+        rows = conn.execute(
+            f"SELECT {q(column)} FROM {q(table_name)} {clause} GROUP BY {q(column)} ORDER BY MIN(id)",
+            where[1],
+        ).fetchall()
+        return [r[0] for r in rows]
+
+    def save(self, table_name, df):
+        """
+        Reemplaza la tabla (los ids son el índice "id" o la columna "id" de df, o
+        1..n si no trae ids; ver _record_ids). Los ids asignados antes siguen sin
+        reutilizarse. Devuelve (versión anterior, versión nueva).
+        """
+        with self._transaction() as conn:
+            self._ensure_table(conn, table_name, list(df.columns))
+            conn.execute(f"DELETE FROM {self._quote(table_name)}")
+            self._insert_df(conn, table_name, _with_record_ids(df), with_ids=True)
+            return self._bump_version(conn, table_name)
+
+    def append(self, table_name, new_record):
+        """Añade un registro. Devuelve (versión anterior, versión nueva)."""
+        with self._transaction() as conn:
+            self._insert_df(conn, table_name, pd.DataFrame([_clean_fields(new_record)]))
+            return self._bump_version(conn, table_name)
+
+    def apply_changes(self, table_name, updates=None, deletes=(), inserts=()):
+        """
+        Cambios puntuales por id en una transacción: updates {id: campos} sustituye
+        los campos de esos registros, deletes los borra e inserts añade registros
+        nuevos. Devuelve (versión anterior, versión nueva).
+        """
+        updates = updates or {}
+        q = self._quote
+        with self._transaction() as conn:
+            names = dict.fromkeys(k for fields in updates.values() for k in fields)
+            columns = self._ensure_table(conn, table_name, list(names))
+            if updates:
+                records = _records_with_days(table_name, [_clean_fields(f) for f in updates.values()])
+                conn.executemany(
+                    f"UPDATE {q(table_name)} SET {', '.join(f'{q(c)} = ?' for c in columns)} WHERE id = ?",
+                    [[record.get(c) for c in columns] + [int(pk)] for pk, record in zip(updates, records)],
+                )
+            if deletes:
+                conn.executemany(f"DELETE FROM {q(table_name)} WHERE id = ?", [(int(pk),) for pk in deletes])
+            if inserts:
+                self._insert_df(conn, table_name, pd.DataFrame([_clean_fields(f) for f in inserts]))
+            return self._bump_version(conn, table_name)
+
+    def import_tables(self, tables, last_ids=None):
+        """
+        Carga masiva {tabla: DataFrame} en una única transacción (reemplaza el
+        contenido). last_ids {tabla: id} conserva el mayor id asignado en el
+        origen para que los ids de registros borrados no se reutilicen.
+        """
+        with self._transaction() as conn:
+            for table_name, df in tables.items():
+                self._ensure_table(conn, table_name, list(df.columns))
+                conn.execute(f"DELETE FROM {self._quote(table_name)}")
+                self._insert_df(conn, table_name, _with_record_ids(df), with_ids=True)
+                self._keep_last_id(conn, table_name, (last_ids or {}).get(table_name, 0))
+                self._bump_version(conn, table_name)
+
+
+def get_storage(backend, data_dir):
+    """Crea el backend configurado ("json" o "sqlite")."""
+    if backend == "sqlite":
+        return SqliteStorage(os.path.join(data_dir, "scouting.db"))
+    if backend == "json":
+        return JsonStorage(data_dir)
+    raise ValueError(f"Backend de almacenamiento desconocido: {backend}")
+
+
+def import_json(data_dir, db_path, tables=None):
+    """Importa las tablas JSON de data_dir a la base SQLite db_path en una sola transacción."""
+    source = JsonStorage(data_dir)
+    if tables is None:
+        tables = sorted(
+            os.path.splitext(name)[0] for name in os.listdir(data_dir) if name.endswith(".json")
+        )
+    dfs = {table_name: source.read(table_name) for table_name in tables}
+    SqliteStorage(db_path).import_tables(dfs, {table_name: source.last_id(table_name) for table_name in tables})
+    return {table_name: len(df) for table_name, df in dfs.items()}
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Utilidades de almacenamiento de Scouting UD Lanzarote")
+    sub = parser.add_subparsers(dest="command", required=True)
+    imp = sub.add_parser("import-json", help="Importar los JSON de una carpeta a SQLite")
+    imp.add_argument("data_dir", nargs="?", default=os.path.join(os.path.dirname(os.path.abspath(__file__)), "data"))
+    imp.add_argument("db_path", nargs="?", default=None)
+    imp.add_argument("--tables", nargs="*", default=None, help="Tablas a importar (por defecto, todas)")
+    args = parser.parse_args()
+
+    if args.command == "import-json":
+        db_path = args.db_path or os.path.join(args.data_dir, "scouting.db")
+        counts = import_json(args.data_dir, db_path, args.tables)
+        for table_name, n in counts.items():
+            print(f"{table_name}: {n} registros")
@@ -0,0 +1,81 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from aggregates import AggregateCache, GroupAggregates
+
+ATTRS = ["Velocidad", "Duelos", "Gol"]
+
+
+def informes():
+    return pd.DataFrame([
+        {"Jugador": "Ana", "Posición": "Delantero", "Velocidad": 4, "Duelos": 0, "Gol": 5},
+        {"Jugador": "Ana", "Posición": "Delantero", "Velocidad": 3, "Duelos": 2, "Gol": 4},
+        {"Jugador": "Luis", "Posición": "Central", "Velocidad": 2, "Duelos": 5, "Gol": 0},
+        {"Jugador": "Luis", "Posición": "Central", "Velocidad": 0, "Duelos": 4, "Gol": 1},
+        {"Jugador": "Eva", "Posición": "Portero", "Velocidad": 1, "Duelos": 0, "Gol": 0},
+    ], index=[1, 2, 3, 4, 5])
+
+
+def assert_same(agg, expected):
+    assert agg.groups == expected.groups
+    np.testing.assert_array_equal(agg.count, expected.count)
+    np.testing.assert_allclose(agg.sums, expected.sums)
+    np.testing.assert_array_equal(agg.nonzero, expected.nonzero)
+    np.testing.assert_array_equal(agg.hist, expected.hist)
+    assert agg.first == expected.first
+    assert agg.first_ids == expected.first_ids
+
+
+def test_insert_matches_rebuild():
+    df = informes()
+    nuevo = {"Jugador": "Luis", "Posición": "Central", "Velocidad": 3, "Duelos": 0, "Gol": 2}
+    agg = GroupAggregates.from_df(df, "Jugador", ATTRS, ["Posición"]).with_record(nuevo)
+    expected = GroupAggregates.from_df(pd.concat([df, pd.DataFrame([nuevo])]), "Jugador", ATTRS, ["Posición"])
+    assert_same(agg, expected)
+
+
+def test_update_and_delete_match_rebuild():
+    df = informes()
+    base = GroupAggregates.from_df(df, "Jugador", ATTRS, ["Posición"])
+    nuevo = dict(df.loc[2], Velocidad=5, Duelos=0)
+    agg = base.with_changes(deleted={4: df.loc[4].to_dict()}, updated={2: (df.loc[2].to_dict(), nuevo)})
+    cambiado = df.drop(index=4)
+    cambiado.loc[2, ["Velocidad", "Duelos"]] = [5, 0]
+    assert_same(agg, GroupAggregates.from_df(cambiado, "Jugador", ATTRS, ["Posición"]))
+
+
+def test_group_without_reports_disappears():
+    df = informes()
+    agg = GroupAggregates.from_df(df, "Jugador", ATTRS, ["Posición"]).with_changes(deleted={5: df.loc[5].to_dict()})
+    assert "Eva" not in agg
+    assert "Eva" not in agg.first["Posición"]
+    assert_same(agg, GroupAggregates.from_df(df.drop(index=5), "Jugador", ATTRS, ["Posición"]))
+
+
+def test_unknown_first_value_requires_rebuild():
+    df = informes()
+    base = GroupAggregates.from_df(df, "Jugador", ATTRS, ["Posición"])
+    # El informe 1 da la posición de Ana y el 3 la de Luis
+    assert base.with_changes(deleted={1: df.loc[1].to_dict()}) is None
+    assert base.with_changes(updated={3: (df.loc[3].to_dict(), dict(df.loc[3], Posición="Lateral"))}) is None
+    # Un informe añadido después de leer la tabla no tiene id: si puede ser el que da el valor, tampoco
+    nuevo = {"Jugador": "Rosa", "Posición": "Lateral", "Gol": 3}
+    con_nuevos = base.with_record(nuevo).with_record(dict(nuevo, Posición="Central"))
+    assert con_nuevos.first_value("Rosa", "Posición") == "Lateral"
+    assert con_nuevos.with_changes(deleted={7: dict(nuevo, Posición="Central")}) is not None
+    assert con_nuevos.with_changes(deleted={6: nuevo}) is None
+
+
+@pytest.mark.parametrize("cambio", ["actualizado", "reconstruir"])
+def test_cache_records_changed(cambio):
+    df = informes()
+    cache = AggregateCache(ATTRS, group_cols=["Jugador", "Posición"], first_cols=["Posición"])
+    cache.get(1, lambda: (df, None))
+    if cambio == "actualizado":
+        cache.records_changed(1, 2, updated={2: (df.loc[2].to_dict(), dict(df.loc[2], Gol=1))})
+        df.loc[2, "Gol"] = 1
+        assert cache.get(2, lambda: pytest.fail("no debería reconstruir")).mean_of("Ana")["Gol"] == 3
+    else:
+        cache.records_changed(1, 2, deleted={1: df.loc[1].to_dict()})
+        assert cache.get(2, lambda: (df.drop(index=1), None)).mean_of("Ana")["Gol"] == 4
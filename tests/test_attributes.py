@@ -0,0 +1,37 @@
+import numpy as np
+import pandas as pd
+
+from aggregates import GroupAggregates
+from attributes import AttributeMatrix, encode_values
+
+
+def test_values_are_kept_exact():
+    valores = ["4", 3.5, 0, None, "", "n/d", 7, -1, 2.25]
+    notas = encode_values(valores)
+    esperado = pd.to_numeric(pd.Series(valores, dtype=object), errors="coerce").replace(0, np.nan)
+    np.testing.assert_array_equal(notas, esperado.to_numpy(dtype=np.float32))
+    assert encode_values([0, 3], zero_is_missing=False).tolist() == [0, 3]
+
+
+def test_matrix_rows_and_missing_columns():
+    df = pd.DataFrame({"Gol": [4, 0, "2"], "Duelos": [None, 1.5, 3]}, index=[10, 11, 12])
+    m = AttributeMatrix.from_df(df, ["Gol", "Duelos", "Velocidad"])
+    assert m.values.dtype == np.float32 and m.index.tolist() == [10, 11, 12]
+    assert m.rated().tolist() == [[True, False, False], [False, True, False], [True, True, False]]
+    assert m.row_values(1) == {"Duelos": 1.5}
+    assert AttributeMatrix.from_record({"Gol": "3"}, ["Gol", "Duelos"]).row_values(0) == {"Gol": 3.0}
+
+
+def test_aggregate_means_match_pandas():
+    # Notas fraccionarias y fuera de escala: las medias son las de pandas ignorando los 0
+    df = pd.DataFrame({
+        "Jugador": ["A", "A", "A", "B", "B"],
+        "Gol": [4.5, 0, 6, "3", None],
+        "Duelos": [1, 2, -1, 0, 2.75],
+    })
+    agg = GroupAggregates.from_df(df, "Jugador", ["Gol", "Duelos"])
+    esperado = df[["Gol", "Duelos"]].apply(pd.to_numeric, errors="coerce").replace(0, np.nan)
+    esperado = esperado.groupby(df["Jugador"]).mean()
+    pd.testing.assert_frame_equal(agg.means(), esperado, check_names=False)
+    # El histograma de los percentiles sí redondea a la escala 1..5
+    assert agg.hist[agg.index["A"], 0].tolist() == [0, 0, 0, 1, 1]
@@ -0,0 +1,191 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from indexes import InvertedIndex, NameIndex, SortedIndex, TextIndex, TimelineIndex, name_key, trigrams
+from storage import dates_to_days
+
+INFORMES = pd.DataFrame({
+    "Scout": ["Ana", "Luis", "Ana", None, "Eva", "Luis", "Ana"],
+    "Posición": ["Extremo", "Central", "Central", "Extremo", None, "Extremo", "Extremo"],
+    "Acción": ["Fichar", "Seguir", "Fichar", "Descartar", "Fichar", "Fichar", "Seguir"],
+    "Fecha informe": ["03-01-2025", "15-02-2025", None, "03-01-2025", "30-06-2024", "no es fecha", "01-03-2025"],
+})
+
+
+def posiciones(df, filters):
+    """Filas que cumplen los filtros, recorriendo la tabla (referencia de lookup)."""
+    mask = np.ones(len(df), dtype=bool)
+    for col, values in filters.items():
+        values = values if isinstance(values, list) else [values]
+        if values:
+            mask &= df[col].isin(values).to_numpy() if col in df.columns else False
+    return np.flatnonzero(mask)
+
+
+@pytest.mark.parametrize("filters", [
+    {"Scout": ["Ana"]},
+    {"Scout": ["Ana", "Luis"], "Posición": ["Extremo"]},
+    {"Scout": "Luis", "Acción": ["Fichar", "Seguir"], "Posición": []},
+    {"Scout": ["Nadie"]},
+    {"Scout": ["Ana"], "Temporada": ["2024-2025"]},
+])
+def test_lookup_matches_scan(filters):
+    index = InvertedIndex.from_df(INFORMES, ["Scout", "Posición", "Acción", "Temporada"])
+    np.testing.assert_array_equal(index.lookup(filters), posiciones(INFORMES, filters))
+
+
+def test_lookup_without_active_filters_is_none():
+    index = InvertedIndex.from_df(INFORMES, ["Scout"])
+    assert index.lookup({}) is None
+    assert index.lookup({"Scout": []}) is None
+
+
+def test_options_skip_missing_values():
+    index = InvertedIndex.from_df(INFORMES, ["Scout", "Temporada"])
+    assert index.options("Scout") == ["Ana", "Eva", "Luis"]
+    assert index.options("Temporada") == []
+
+
+def indice_fechas(df):
+    """SortedIndex de los días de Fecha informe sobre las posiciones de df, sin las filas sin fecha."""
+    days = dates_to_days(df["Fecha informe"]).to_numpy(dtype=float, na_value=np.nan)
+    found = np.flatnonzero(~np.isnan(days))
+    return SortedIndex(days[found].astype(np.int64), found), days
+
+
+@pytest.mark.parametrize("low, high", [
+    (None, None), ("03-01-2025", "03-01-2025"), ("01-01-2025", None), (None, "31-12-2024"),
+    ("01-07-2025", None), ("01-03-2025", "01-01-2025"),
+])
+def test_sorted_index_range_matches_scan(low, high):
+    index, days = indice_fechas(INFORMES)
+    low_day = None if low is None else dates_to_days([low])[0]
+    high_day = None if high is None else dates_to_days([high])[0]
+    esperado = np.flatnonzero(
+        ~np.isnan(days) & (days >= (low_day if low is not None else -np.inf))
+        & (days <= (high_day if high is not None else np.inf))
+    )
+    np.testing.assert_array_equal(index.range(low_day, high_day), esperado)
+
+
+def test_sorted_index_bounds():
+    index, _ = indice_fechas(INFORMES)
+    assert index.bounds() == (dates_to_days(["30-06-2024"])[0], dates_to_days(["01-03-2025"])[0])
+    assert SortedIndex(np.empty(0, dtype=np.int64), []).bounds() == (None, None)
+
+
+def test_lookup_combines_ranges_and_filters():
+    index, days = indice_fechas(INFORMES)
+    inverted = InvertedIndex(len(INFORMES), InvertedIndex.from_df(INFORMES, ["Scout"]).postings,
+                             {"Fecha informe": index})
+    desde = dates_to_days(["01-01-2025"])[0]
+    np.testing.assert_array_equal(
+        inverted.lookup({"Scout": ["Ana"]}, {"Fecha informe": (desde, None)}), [0, 6]
+    )
+    # Un rango abierto por los dos lados no filtra; uno sobre una columna sin índice no da filas
+    assert inverted.lookup({}, {"Fecha informe": (None, None)}) is None
+    assert not len(inverted.lookup({}, {"Fecha de nacimiento": (desde, None)}))
+
+
+NOMBRES = [
+    "Juan Pérez", "juan  perez", "J. Perez", "Juan Pérez García", "Pedro Gómez", "Pedro Gomez Ruiz",
+    "Iván Manrique", "Ivan Manrique Márquez", None, "", "Zacarías Núñez", "Luis",
+]
+
+
+def dice(a, b):
+    ga, gb = trigrams(name_key(a)), trigrams(name_key(b))
+    return 2 * len(ga & gb) / (len(ga) + len(gb))
+
+
+def test_name_index_find_ignores_case_accents_and_spaces():
+    index = NameIndex.from_values(NOMBRES)
+    assert index.find("JUAN PEREZ") == "Juan Pérez"
+    assert index.find("zacarias nunez") == "Zacarías Núñez"
+    assert index.find("Juan") is None
+    # Las filas vacías cuentan como fila pero no se indexan
+    assert index.n_rows == len(NOMBRES)
+    assert index.rows[index.keys.index(name_key("Juan Pérez"))] == [0, 1]
+
+
+def test_name_index_suggest_matches_brute_force():
+    index = NameIndex.from_values(NOMBRES)
+    for consulta in ["juan perz", "Pedro Gómez", "I. Manrique", "Nadie Conocido"]:
+        esperado = sorted(
+            ((index.names[i], dice(consulta, index.names[i])) for i in range(len(index.keys))),
+            key=lambda par: -par[1],
+        )
+        esperado = [(nombre, pytest.approx(score)) for nombre, score in esperado if score >= 0.5][:5]
+        assert index.suggest(consulta) == esperado
+
+
+def test_name_index_add_matches_rebuild():
+    index = NameIndex.from_values(NOMBRES[:6])
+    for nombre in NOMBRES[6:]:
+        index.add(nombre)
+    nuevo = NameIndex.from_values(NOMBRES)
+    assert index.keys == nuevo.keys and index.rows == nuevo.rows
+    assert index.suggest("ivan manrike") == nuevo.suggest("ivan manrike")
+
+
+@pytest.mark.parametrize("threshold", [0.5, 0.7, 0.9])
+def test_duplicate_clusters_match_pairwise_comparison(threshold):
+    index = NameIndex.from_values(NOMBRES)
+    n = len(index.keys)
+    parent = list(range(n))
+
+    def raiz(i):
+        while parent[i] != i:
+            i = parent[i]
+        return i
+
+    for i in range(n):
+        for j in range(i):
+            if dice(index.names[i], index.names[j]) >= threshold:
+                parent[raiz(i)] = raiz(j)
+    grupos = {}
+    for i in range(n):
+        grupos.setdefault(raiz(i), []).append(i)
+    esperado = sorted((g for g in grupos.values() if len(g) > 1), key=lambda g: (-len(g), g[0]))
+    assert index.duplicate_clusters(threshold) == esperado
+
+
+OBSERVACIONES = pd.DataFrame({
+    "Observaciones": ["Zurdo rápido, buen desborde", "Lento pero buen pase", None, "Rápido, rápido y con gol"],
+    "Club": ["CD Tenerife", "UD Lanzarote", "Tenerife B", None],
+})
+
+
+def test_text_index_search_folds_accents_and_ranks():
+    index = TextIndex.from_df(OBSERVACIONES, ["Observaciones", "Club"])
+    docs, scores = index.search("RAPIDO")
+    # Más apariciones del término en un texto más corto, más relevante
+    assert list(docs) == [3, 0] and scores[0] > scores[1]
+    assert set(index.search("tenerife buen")[0]) == {0, 1, 2}
+    assert not len(index.search("portero")[0])
+
+
+def test_text_index_add_matches_rebuild():
+    index = TextIndex.from_df(OBSERVACIONES.iloc[:2], ["Observaciones", "Club"])
+    for record in OBSERVACIONES.iloc[2:].to_dict("records"):
+        index.add(record)
+    nuevo = TextIndex.from_df(OBSERVACIONES, ["Observaciones", "Club"])
+    for consulta in ["rapido", "buen pase tenerife", "gol"]:
+        docs, scores = index.search(consulta)
+        docs_nuevo, scores_nuevo = nuevo.search(consulta)
+        np.testing.assert_array_equal(docs, docs_nuevo)
+        np.testing.assert_allclose(scores, scores_nuevo)
+
+
+def test_timeline_rows_ordered_by_date():
+    df = pd.DataFrame({
+        "Jugador": ["Ana", "Luis", "Ana", "Ana", "Luis", "Ana"],
+        "Fecha informe": ["10-05-2025", "01-01-2025", "sin fecha", "02-01-2024", "01-01-2025", "02-01-2024"],
+    })
+    index = TimelineIndex.from_df(df, "Jugador", "Fecha informe")
+    # Sin fecha delante; a igual fecha, en el orden de la tabla
+    assert list(index.rows("Ana")) == [2, 3, 5, 0]
+    assert list(index.rows("Luis")) == [1, 4]
+    assert not len(index.rows("Eva"))
+    assert np.isnat(index.dates[2]) and index.dates[0] == np.datetime64("2025-05-10")
@@ -0,0 +1,69 @@
+import os
+import re
+
+import matplotlib
+import numpy as np
+import pytest
+
+import pdf_report
+
+# La DejaVu que trae matplotlib (la app usa DejaVuSans.ttf en su directorio)
+TTF = os.path.join(matplotlib.get_data_path(), "fonts", "ttf", "DejaVuSans.ttf")
+
+INFORME = {
+    "Jugador": "Iván Pérez", "Fecha informe": "01-02-2025", "Posición": "Extremo",
+    "Velocidad": 4, "Desborde": 5, "Gol": 3, "% Duelos ganados": 55,
+    "Observaciones": "Zurdo rápido, buen desborde. Ñ, ç y tildes en la fuente.",
+}
+CONTEXTO = {
+    "mean_vals": {"Velocidad": 3.5, "Desborde": 4.0, "Gol": 3.0},
+    "pos_mean": {"Velocidad": 3.0, "Desborde": 3.2, "Gol": 2.5},
+    "jugador_pos": "Extremo",
+}
+
+
+def sin_fecha(pdf):
+    """El PDF sin la fecha de creación ni el /ID que fpdf2 calcula a partir de ella."""
+    pdf = re.sub(rb"/CreationDate \(D:\d+Z\)", b"", pdf)
+    return re.sub(rb"/ID \[<[0-9A-F]+><[0-9A-F]+>\]", b"", pdf)
+
+
+@pytest.fixture(autouse=True)
+def plantilla_nueva():
+    pdf_report._plantilla.cache_clear()
+    yield
+    pdf_report._plantilla.cache_clear()
+
+
+@pytest.mark.skipif(not os.path.exists(TTF), reason="sin DejaVuSans.ttf")
+def test_reused_template_gives_same_pdf_as_fresh_one():
+    # Guarda de los internals de fpdf2 que usa PlantillaInforme: los documentos
+    # hechos con la plantilla compartida no arrastran estado (glifos, imágenes)
+    primero = sin_fecha(pdf_report.generar_pdf(INFORME, ttf_path=TTF, **CONTEXTO))
+    assert primero.startswith(b"%PDF-") and primero.rstrip().endswith(b"%%EOF")
+    otro = dict(INFORME, Jugador="Ægir Øster", Observaciones="Ωμέγα — caracteres distintos")
+    assert sin_fecha(pdf_report.generar_pdf(otro, ttf_path=TTF, **CONTEXTO)) != primero
+    assert sin_fecha(pdf_report.generar_pdf(INFORME, ttf_path=TTF, **CONTEXTO)) == primero
+
+
+def test_cache_key_normalises_types():
+    con_numpy = dict(INFORME, Velocidad=np.int64(4), Gol=np.float64(3.0), Duelos=float("nan"))
+    assert pdf_report.pdf_cache_key(con_numpy, **CONTEXTO) == pdf_report.pdf_cache_key(
+        dict(INFORME, Gol=3.0, Duelos=None), **CONTEXTO)
+
+
+def test_cache_key_changes_with_any_input():
+    base = pdf_report.pdf_cache_key(INFORME, **CONTEXTO)
+    assert pdf_report.pdf_cache_key(dict(INFORME, Gol=2), **CONTEXTO) != base
+    assert pdf_report.pdf_cache_key(INFORME, **dict(CONTEXTO, jugador_pos="Delantero")) != base
+    assert pdf_report.pdf_cache_key(INFORME, **dict(CONTEXTO, pos_mean={})) != base
+
+
+def test_pdf_cache_is_bounded_lru():
+    cache = pdf_report.PdfCache(max_bytes=10)
+    cache.put("a", b"1234")
+    cache.put("b", b"5678")
+    assert cache.get("a") == b"1234"  # a pasa a ser el más reciente
+    cache.put("c", b"9012")
+    assert cache.get("b") is None
+    assert cache.get("a") == b"1234" and cache.get("c") == b"9012"
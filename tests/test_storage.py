@@ -0,0 +1,95 @@
+import pandas as pd
+import pytest
+
+import storage
+from storage import JsonStorage, SqliteStorage
+
+INFORMES = pd.DataFrame({
+    "Jugador": ["Ana", "Luis", "Eva"],
+    "Fecha informe": ["01-02-2025", "15-03-2025", "20-04-2025"],
+    "Velocidad": [4, 2, 1],
+})
+
+
+@pytest.fixture(params=["json", "sqlite"])
+def store(request, tmp_path):
+    if request.param == "json":
+        return JsonStorage(str(tmp_path))
+    return SqliteStorage(str(tmp_path / "scouting.db"))
+
+
+def test_save_without_ids_numbers_from_one(store):
+    # Un índice por defecto (RangeIndex 0..n-1) no son ids: se numeran 1..n
+    store.save("Informes", INFORMES)
+    df = store.read("Informes")
+    assert list(df.index) == [1, 2, 3]
+    assert df.index.name == "id"
+
+
+def test_save_keeps_explicit_ids(store):
+    store.save("Scouts", pd.DataFrame({"Nombre scout": ["A", "B"]}, index=pd.Index([7, 9], name="id")))
+    assert list(store.read("Scouts").index) == [7, 9]
+    store.save("Scouts", pd.DataFrame({"id": [4, 2], "Nombre scout": ["C", "D"]}))
+    df = store.read("Scouts")
+    assert sorted(df.index) == [2, 4] and list(df.columns) == ["Nombre scout"]
+
+
+def test_read_save_round_trip_keeps_ids(store):
+    store.save("Informes", INFORMES)
+    store.apply_changes("Informes", deletes=[1])
+    store.save("Informes", store.read("Informes"))
+    assert list(store.read("Informes").index) == [2, 3]
+
+
+def test_apply_changes(store):
+    store.save("Informes", INFORMES)
+    store.apply_changes(
+        "Informes",
+        updates={2: {"Jugador": "Luis", "Fecha informe": "15-03-2025", "Velocidad": 5}},
+        deletes=[1],
+        inserts=[{"Jugador": "Iván", "Velocidad": 3}],
+    )
+    df = store.read("Informes")
+    assert list(df.index) == [2, 3, 4]
+    assert df.loc[2, "Velocidad"] == 5 and df.loc[4, "Jugador"] == "Iván"
+    assert store.read_days("Informes", "Fecha informe").to_dict() == {
+        2: storage.day_number("2025-03-15"), 3: storage.day_number("2025-04-20"),
+    }
+
+
+@pytest.mark.parametrize("table_name", ["Informes", "Scouts"])
+def test_deleted_ids_are_not_reused(store, table_name):
+    store.save(table_name, INFORMES)
+    store.apply_changes(table_name, deletes=[3])
+    if isinstance(store, JsonStorage):
+        store.compact(table_name)
+    store.append(table_name, {"Jugador": "Iván"})
+    assert list(store.read(table_name).index) == [1, 2, 4]
+    assert store.last_id(table_name) == 4
+
+
+def test_json_log_replay_matches_compacted_snapshot(tmp_path):
+    store = JsonStorage(str(tmp_path))
+    store.save("Informes", INFORMES)
+    store.append("Informes", {"Jugador": "Iván", "Velocidad": 3})
+    store.apply_changes("Informes", updates={1: {"Jugador": "Ana", "Velocidad": 5}}, deletes=[4])
+    store.append("Informes", {"Jugador": "Leo", "Velocidad": 2})
+    antes = store.read("Informes")
+    proyectado = store.read("Informes", ["Jugador", "Velocidad"])
+    store.compact("Informes")
+    assert not (tmp_path / "Informes.jsonl").exists()
+    pd.testing.assert_frame_equal(store.read("Informes"), antes)
+    pd.testing.assert_frame_equal(store.read("Informes", ["Jugador", "Velocidad"]), proyectado)
+    assert list(antes.index) == [1, 2, 3, 5] and antes.loc[1, "Velocidad"] == 5
+
+
+def test_import_json_keeps_last_id(tmp_path):
+    source = JsonStorage(str(tmp_path))
+    source.save("Informes", INFORMES)
+    source.apply_changes("Informes", deletes=[3])
+    source.compact("Informes")
+    db_path = str(tmp_path / "scouting.db")
+    storage.import_json(str(tmp_path), db_path, ["Informes"])
+    target = SqliteStorage(db_path)
+    target.append("Informes", {"Jugador": "Iván"})
+    assert list(target.read("Informes").index) == [1, 2, 4]